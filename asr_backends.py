@@ -0,0 +1,408 @@
+"""
+음성 인식(ASR) 백엔드
+
+OpenAIHelper.transcribe_audio_data는 ASRBackend 인터페이스로 실제 인식을 맡긴다.
+- RemoteWhisperBackend: OpenAI Whisper API (기존 동작)
+- LocalWhisperBackend: faster-whisper(CTranslate2, int8 양자화) 모델을 별도 워커 프로세스에
+  한 번 올려두고 계속 재사용 (인터넷이 불안정한 부스용)
+- HedgedASRBackend: 두 백엔드에 동시에(또는 지연 후) 요청해 먼저 온 쓸 만한 결과를 사용
+백엔드마다 호출 지연 시간을 기록해 비교할 수 있다.
+"""
+import importlib.util
+import itertools
+import logging
+import multiprocessing as mp
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from config import (
+    ASR_MODEL, LOCAL_ASR_MODEL, LOCAL_ASR_COMPUTE_TYPE, LOCAL_ASR_THREADS, LOCAL_ASR_TIMEOUT,
+    ASR_HEDGE_MODE, ASR_HEDGE_DELAY
+)
+from resilience import request_timeout
+
+log = logging.getLogger(__name__)
+
+
+class ASRError(Exception):
+    """ASR 백엔드 호출 실패"""
+
+
+class ASRCancelled(ASRError):
+    """다른 백엔드가 먼저 결과를 내서 요청이 취소됨"""
+
+
+class ASRBackend:
+    """ASR 백엔드 공통 인터페이스 (지연 시간 기록 포함)"""
+
+    name = "base"
+    model_name = ""
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.cancelled = 0
+        self._latencies: deque = deque(maxlen=500)
+        self._stats_lock = threading.Lock()
+
+    def transcribe(self, audio_data: bytes, filename: str = "audio.wav",
+                   cancel: Optional[threading.Event] = None, timeout: Optional[float] = None) -> str:
+        """인코딩된 오디오를 텍스트로 변환. 실패하면 ASRError, cancel이 설정되면 ASRCancelled
+        timeout: 이번 호출의 최대 대기 시간 (초, None이면 백엔드 기본값)"""
+        if cancel is not None and cancel.is_set():
+            raise ASRCancelled()
+        t0 = time.perf_counter()
+        try:
+            text = self._transcribe(audio_data, filename, cancel, timeout)
+            if cancel is not None and cancel.is_set():
+                raise ASRCancelled()  # 늦게 끝난 요청의 결과는 버림
+        except ASRCancelled:
+            with self._stats_lock:
+                self.cancelled += 1
+            raise
+        except ASRError:
+            self._record(None)
+            raise
+        except Exception as e:
+            self._record(None)
+            raise ASRError(str(e)) from e
+        self._record(time.perf_counter() - t0)
+        return text
+
+    def _record(self, latency: Optional[float]):
+        with self._stats_lock:
+            if latency is None:
+                self.failures += 1
+            else:
+                self.calls += 1
+                self._latencies.append(latency)
+
+    def _transcribe(self, audio_data: bytes, filename: str, cancel: Optional[threading.Event],
+                    timeout: Optional[float]) -> str:
+        raise NotImplementedError
+
+    def latency_percentile(self, q: float, min_samples: int = 1) -> Optional[float]:
+        """관측된 지연 시간의 q 분위수 (표본이 min_samples보다 적으면 None)"""
+        with self._stats_lock:
+            if len(self._latencies) < min_samples:
+                return None
+            lat = np.array(self._latencies, dtype=np.float64)
+        return float(np.percentile(lat, q))
+
+    def stats(self) -> Dict[str, float]:
+        """호출 수와 지연 시간 분위수 (초)"""
+        with self._stats_lock:
+            lat = np.array(self._latencies, dtype=np.float64)
+            calls, failures, cancelled = self.calls, self.failures, self.cancelled
+        result = {"backend": self.name, "calls": calls, "failures": failures, "cancelled": cancelled}
+        if lat.size:
+            p50, p95 = np.percentile(lat, [50, 95])
+            result.update(mean=float(lat.mean()), p50=float(p50), p95=float(p95))
+        return result
+
+    def close(self):
+        pass
+
+
+class RemoteWhisperBackend(ASRBackend):
+    """OpenAI Whisper API"""
+
+    name = "remote"
+    model_name = ASR_MODEL
+
+    def __init__(self, client):
+        super().__init__()
+        self.client = client
+
+    def _transcribe(self, audio_data: bytes, filename: str, cancel: Optional[threading.Event],
+                    timeout: Optional[float]) -> str:
+        # 동기 HTTP 요청은 중간에 끊을 수 없으므로 취소되면 응답을 받은 뒤 버린다 (transcribe에서 처리)
+        if self.client is None:
+            raise ASRError("OpenAI client not configured")
+        audio_file = BytesIO(audio_data)
+        audio_file.name = filename  # 파일명 지정 (확장자로 포맷 인식)
+
+        extra = {"timeout": request_timeout(timeout)} if timeout else {}
+        result = self.client.audio.transcriptions.create(
+            model=ASR_MODEL,
+            file=audio_file,
+            response_format="verbose_json",  # 더 상세한 결과
+            language="ko",  # 한국어 명시적 지정
+            prompt="",  # 프롬프트 제거 (편향 방지)
+            temperature=0.3,  # 약간의 랜덤성 추가
+            **extra,
+        )
+
+        # verbose_json에서 텍스트 추출
+        if hasattr(result, 'text'):
+            return result.text.strip()
+        if isinstance(result, dict) and 'text' in result:
+            return result['text'].strip()
+        return str(result).strip()
+
+
+def local_asr_available() -> bool:
+    """faster-whisper 설치 여부"""
+    return importlib.util.find_spec("faster_whisper") is not None
+
+
+def _local_asr_worker(conn, model_size: str, compute_type: str, threads: int):
+    """워커 프로세스: 모델을 한 번 로드한 뒤 요청을 계속 처리"""
+    try:
+        from faster_whisper import WhisperModel
+        model = WhisperModel(model_size, device="cpu", compute_type=compute_type, cpu_threads=threads)
+    except Exception as e:
+        conn.send(("error", None, f"model load failed: {e}"))
+        return
+    conn.send(("ready", None, None))
+    pending: deque = deque()  # 인식 도중 도착한 다음 요청
+    while True:
+        if pending:
+            msg = pending.popleft()
+        else:
+            try:
+                msg = conn.recv()
+            except EOFError:
+                return
+        if msg is None:
+            return
+        kind, req_id, audio_data = msg
+        if kind != "transcribe":
+            continue  # 이미 끝난 요청에 대한 취소
+        try:
+            # segments는 지연 생성되므로 세그먼트 사이마다 취소 요청을 확인할 수 있다
+            segments, _info = model.transcribe(BytesIO(audio_data), language="ko", beam_size=1)
+            parts, stopped = [], False
+            for seg in segments:
+                parts.append(seg.text)
+                while conn.poll():
+                    other = conn.recv()
+                    if other is None:
+                        return
+                    if other[0] == "cancel":
+                        stopped = stopped or other[1] == req_id
+                    else:
+                        pending.append(other)
+                if stopped:
+                    break
+            conn.send(("cancelled" if stopped else "ok", req_id, "".join(parts).strip()))
+        except Exception as e:
+            conn.send(("error", req_id, str(e)))
+
+
+class LocalWhisperBackend(ASRBackend):
+    """faster-whisper CPU 백엔드 (모델은 워커 프로세스에서 상주)"""
+
+    name = "local"
+
+    def __init__(self, model_size: str = LOCAL_ASR_MODEL, compute_type: str = LOCAL_ASR_COMPUTE_TYPE,
+                 threads: int = LOCAL_ASR_THREADS, timeout: float = LOCAL_ASR_TIMEOUT):
+        super().__init__()
+        if not local_asr_available():
+            raise ASRError("faster-whisper not installed. Run: pip install faster-whisper")
+        self.model_name = f"faster-whisper-{model_size}-{compute_type}"
+        self.timeout = timeout
+        self._lock = threading.Lock()  # 워커와의 요청/응답은 한 번에 하나씩
+        self._ids = itertools.count(1)
+        self._ready = False
+        ctx = mp.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        # 게임 시작과 동시에 모델 로딩을 시작해 첫 요청 전에 워밍업을 끝낸다
+        self._process = ctx.Process(
+            target=_local_asr_worker, args=(child_conn, model_size, compute_type, threads),
+            name="local-asr", daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+
+    def _wait_ready(self, deadline: float):
+        while not self._ready:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or not self._conn.poll(remaining):
+                raise ASRError("local ASR model is still loading")
+            status, _req_id, detail = self._conn.recv()
+            if status != "ready":
+                raise ASRError(detail or "local ASR worker failed")
+            self._ready = True
+
+    def _transcribe(self, audio_data: bytes, filename: str, cancel: Optional[threading.Event],
+                    timeout: Optional[float]) -> str:
+        with self._lock:
+            if not self._process.is_alive():
+                raise ASRError("local ASR worker is not running")
+            deadline = time.perf_counter() + (min(self.timeout, timeout) if timeout else self.timeout)
+            self._wait_ready(deadline)
+            req_id = next(self._ids)
+            self._conn.send(("transcribe", req_id, bytes(audio_data)))
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise ASRError("local ASR timed out")
+                if not self._conn.poll(min(remaining, 0.05)):
+                    if cancel is not None and cancel.is_set():
+                        self._conn.send(("cancel", req_id, None))  # 워커가 다음 세그먼트에서 중단
+                        raise ASRCancelled()
+                    continue
+                status, resp_id, payload = self._conn.recv()
+                if resp_id != req_id:
+                    continue  # 이전에 시간 초과된 요청의 늦은 응답
+                if status != "ok":
+                    raise ASRError(payload)
+                return payload
+
+    def close(self):
+        try:
+            self._conn.send(None)
+        except Exception:
+            pass
+        self._process.join(timeout=2)
+        if self._process.is_alive():
+            self._process.terminate()
+
+
+class HedgedASRBackend(ASRBackend):
+    """헤지 요청: 주 백엔드가 hedge_delay 안에 쓸 만한 결과를 못 내면 보조 백엔드에도 요청하고,
+    먼저 도착한 쓸 만한 결과를 채택한 뒤 나머지 요청은 취소한다.
+
+    hedge_delay가 None이면 주 백엔드의 관측 p95 지연을 사용 (표본이 모이기 전에는 default_delay).
+    주 백엔드가 지연 전에 실패하거나 쓸 수 없는 결과를 내면 보조 백엔드를 바로 호출한다.
+    """
+
+    name = "hedged"
+
+    def __init__(self, primary: ASRBackend, secondary: ASRBackend, hedge_delay: Optional[float] = None,
+                 default_delay: float = 1.5, min_samples: int = 20,
+                 is_usable: Optional[Callable[[str], bool]] = None):
+        super().__init__()
+        self.primary = primary
+        self.secondary = secondary
+        self.hedge_delay = hedge_delay
+        self.default_delay = default_delay
+        self.min_samples = min_samples
+        self.is_usable = is_usable or (lambda text: bool(text and text.strip()))
+        self.model_name = f"{primary.model_name}|{secondary.model_name}"
+        self.hedges = 0  # 보조 요청을 보낸 횟수
+        self.wins = {"primary": 0, "secondary": 0}
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="asr-hedge")
+
+    def current_delay(self) -> float:
+        """보조 요청을 보내기 전 대기 시간 (초)"""
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        p95 = self.primary.latency_percentile(95, self.min_samples)
+        return p95 if p95 is not None else self.default_delay
+
+    def _transcribe(self, audio_data: bytes, filename: str, cancel: Optional[threading.Event],
+                    timeout: Optional[float]) -> str:
+        results: "queue.Queue" = queue.Queue()
+        backends = {"primary": self.primary, "secondary": self.secondary}
+        cancels = {role: threading.Event() for role in backends}
+
+        def run(role: str):
+            try:
+                text = backends[role].transcribe(audio_data, filename, cancels[role], timeout)
+                results.put((role, text, None))
+            except ASRError as e:
+                results.put((role, None, e))
+
+        self._executor.submit(run, "primary")
+        started, running = {"primary"}, 1
+        hedge_at = time.perf_counter() + self.current_delay()
+        fallback_text, last_error = None, None
+        try:
+            while True:
+                if cancel is not None and cancel.is_set():
+                    raise ASRCancelled()
+                if "secondary" not in started and time.perf_counter() >= hedge_at:
+                    self._launch_secondary(run)
+                    started.add("secondary")
+                    running += 1
+                try:
+                    role, text, error = results.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                running -= 1
+                if error is None and self.is_usable(text):
+                    with self._stats_lock:
+                        self.wins[role] += 1
+                    log.debug("ASR 헤지: %s(%s) 결과 채택", backends[role].name, role)
+                    return text
+                if error is None:
+                    fallback_text = text
+                elif not isinstance(error, ASRCancelled):
+                    last_error = error
+                if "secondary" not in started:
+                    # 주 백엔드가 실패하거나 쓸 수 없는 결과를 냄 → 기다리지 않고 보조 요청
+                    self._launch_secondary(run)
+                    started.add("secondary")
+                    running += 1
+                elif running == 0:
+                    break
+        finally:
+            for ev in cancels.values():
+                ev.set()  # 아직 진행 중인 요청 취소
+        if fallback_text is not None:
+            return fallback_text
+        raise last_error or ASRError("no ASR backend produced a result")
+
+    def _launch_secondary(self, run):
+        with self._stats_lock:
+            self.hedges += 1
+        self._executor.submit(run, "secondary")
+
+    def stats(self) -> Dict[str, float]:
+        result = super().stats()
+        with self._stats_lock:
+            result.update(hedges=self.hedges, wins=dict(self.wins))
+        result.update(delay=self.current_delay(),
+                      primary=self.primary.stats(), secondary=self.secondary.stats())
+        return result
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.primary.close()
+        self.secondary.close()
+
+
+def create_asr_backend(name: str, client, hedge_mode: str = ASR_HEDGE_MODE,
+                       is_usable: Optional[Callable[[str], bool]] = None) -> ASRBackend:
+    """설정 이름으로 백엔드 생성 (local을 쓸 수 없으면 remote로 대체)
+
+    hedge_mode:
+      off     - 백엔드 하나만 사용
+      dual    - 로컬과 원격에 동시에 요청 (로컬을 쓸 수 없으면 delayed로 동작)
+      delayed - 주 백엔드가 ASR_HEDGE_DELAY 안에 답하지 않으면 원격에 한 번 더 요청
+    """
+    primary: Optional[ASRBackend] = None
+    if name == "local":
+        try:
+            primary = LocalWhisperBackend()
+        except ASRError as e:
+            print(f"로컬 ASR 사용 불가 - 원격 Whisper 사용: {e}")
+    if primary is None:
+        primary = RemoteWhisperBackend(client)
+    if hedge_mode not in ("dual", "delayed"):
+        return primary
+
+    delay = None if ASR_HEDGE_DELAY == "auto" else float(ASR_HEDGE_DELAY)
+    secondary: Optional[ASRBackend] = None
+    if hedge_mode == "dual":
+        if primary.name == "local":
+            secondary = RemoteWhisperBackend(client)
+        else:
+            try:
+                secondary = LocalWhisperBackend()
+            except ASRError as e:
+                print(f"로컬 ASR 사용 불가 - 지연 헤지로 대체: {e}")
+        if secondary is not None:
+            delay = 0.0
+    if secondary is None:
+        secondary = RemoteWhisperBackend(client)
+    return HedgedASRBackend(primary, secondary, hedge_delay=delay, is_usable=is_usable)
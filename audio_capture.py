@@ -0,0 +1,222 @@
+"""
+실시간 오디오 캡처용 링 버퍼
+
+sounddevice 콜백(실시간 오디오 스레드)은 블록마다 배열을 새로 만들지 않고
+미리 할당한 NumPy 링 버퍼에 그대로 써넣는다. 쓰기 위치는 콜백만 갱신하고
+게임 루프는 누적 위치로 구간을 읽기만 하므로 락이 필요 없다.
+녹음이 끝나면 구간을 한 번 복사해 넘긴다 (이후 처리가 길어져도 새 오디오에 덮어쓰이지 않음).
+
+CaptureService는 입력 스트림을 프로세스당 한 번만 열어 계속 링 버퍼에 기록하고,
+SPACE 누름/뗌은 버퍼 위치만 표시한다 (스트림 open/close 비용과 첫 음절 잘림 제거).
+"""
+import logging
+import threading
+from typing import Optional
+
+import numpy as np
+import sounddevice as sd
+
+from config import (
+    SAMPLE_RATE, CHANNELS, CAPTURE_BUFFER_SECONDS, CAPTURE_DTYPE, CAPTURE_BLOCKSIZE,
+    CAPTURE_PREROLL_SECONDS
+)
+from metrics import count, span
+from utils import resolve_input_device
+
+log = logging.getLogger(__name__)
+
+
+class AudioRingBuffer:
+    """미리 할당된 모노 오디오 링 버퍼 (float32 또는 int16 저장)"""
+
+    def __init__(self, capacity: int, dtype=np.float32, blocksize: int = CAPTURE_BLOCKSIZE):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.dtype(np.float32), np.dtype(np.int16)):
+            raise ValueError(f"unsupported capture dtype: {self.dtype}")
+        self._buf = np.zeros(self.capacity, dtype=self.dtype)
+        # int16 저장 시 스케일/클리핑에 쓰는 작업 공간 (콜백에서 할당하지 않기 위해 미리 확보)
+        self._scratch = np.empty(max(1, blocksize), dtype=np.float32)
+        # 누적 샘플 위치 (단조 증가, 콜백만 갱신)
+        self._write_pos = 0
+
+    @classmethod
+    def from_config(cls) -> "AudioRingBuffer":
+        """config 설정값으로 링 버퍼 생성"""
+        seconds = CAPTURE_BUFFER_SECONDS + CAPTURE_PREROLL_SECONDS
+        return cls(int(seconds * SAMPLE_RATE), dtype=CAPTURE_DTYPE)
+
+    @property
+    def write_pos(self) -> int:
+        return self._write_pos
+
+    def reset(self):
+        """스트림이 멈춘 상태에서 버퍼 위치 초기화 (다음 구간이 0번 인덱스부터 연속으로 쌓임)"""
+        self._write_pos = 0
+
+    def write(self, block: np.ndarray):
+        """오디오 콜백에서 호출. block은 (frames, channels) 또는 (frames,) float32"""
+        src = block[:, 0] if block.ndim == 2 else block
+        n = src.shape[0]
+        if n == 0:
+            return
+        cap = self.capacity
+        pos_total = self._write_pos
+        if n > cap:
+            # 블록이 버퍼보다 크면 마지막 capacity 샘플만 유지
+            skip = n - cap
+            src = src[skip:]
+            pos_total += skip
+            n = cap
+
+        pos = pos_total % cap
+        first = min(n, cap - pos)
+        self._store(self._buf[pos:pos + first], src[:first])
+        if first < n:
+            self._store(self._buf[:n - first], src[first:])
+        # 데이터를 모두 쓴 뒤에 위치를 공개 (읽는 쪽은 이 값까지만 읽음)
+        self._write_pos = pos_total + n
+
+    def _store(self, dst: np.ndarray, src: np.ndarray):
+        if self.dtype == np.float32:
+            np.copyto(dst, src, casting="unsafe")
+            return
+        # float32 → int16: 작업 공간에서 스케일/클리핑 후 캐스팅 (임시 배열 없음)
+        step = self._scratch.shape[0]
+        for i in range(0, src.shape[0], step):
+            chunk = src[i:i + step]
+            tmp = self._scratch[:chunk.shape[0]]
+            np.multiply(chunk, 32767.0, out=tmp)
+            np.clip(tmp, -32768.0, 32767.0, out=tmp)
+            np.copyto(dst[i:i + step], tmp, casting="unsafe")
+
+    def read(self, start: int, end: int) -> np.ndarray:
+        """누적 위치 [start, end) 구간 반환. 버퍼 경계를 넘지 않으면 복사 없는 view"""
+        end = min(end, self._write_pos)
+        start = max(start, end - self.capacity, 0)
+        n = end - start
+        if n <= 0:
+            return self._buf[:0]
+        pos = start % self.capacity
+        if pos + n <= self.capacity:
+            return self._buf[pos:pos + n]
+        first = self.capacity - pos
+        return np.concatenate((self._buf[pos:], self._buf[:n - first]))
+
+    def is_overwritten(self, start: int) -> bool:
+        """start 위치의 데이터가 이미 새 데이터로 덮어쓰였는지 여부"""
+        return self._write_pos - start > self.capacity
+
+
+class CaptureService:
+    """항상 열려 있는 입력 스트림 + 링 버퍼 (키 입력은 구간 표시만 담당)"""
+
+    def __init__(self, ring: Optional[AudioRingBuffer] = None,
+                 preroll_seconds: float = CAPTURE_PREROLL_SECONDS, device=None):
+        self.ring = ring or AudioRingBuffer.from_config()
+        self.preroll_samples = int(preroll_seconds * SAMPLE_RATE)
+        self.device = device
+        self.stream: Optional[sd.InputStream] = None
+        self.status_errors = 0
+        self._segment_start: Optional[int] = None
+
+    @property
+    def running(self) -> bool:
+        return self.stream is not None
+
+    def start(self) -> bool:
+        """입력 스트림 열기 (이미 열려 있으면 그대로 사용)"""
+        if self.stream is not None:
+            return True
+        ring = self.ring
+
+        def audio_callback(indata, frames, time_info, status):
+            if status:
+                self.status_errors += 1
+            ring.write(indata)  # 미리 할당된 버퍼에 제자리 기록
+
+        try:
+            stream = sd.InputStream(
+                samplerate=SAMPLE_RATE,
+                channels=CHANNELS,
+                dtype='float32',
+                blocksize=CAPTURE_BLOCKSIZE,
+                callback=audio_callback,
+                device=self.device,
+            )
+            stream.start()
+        except Exception as e:
+            print(f"입력 스트림 시작 실패: {e}")
+            return False
+        self.stream = stream
+        print("입력 스트림 시작 (상시 캡처)")
+        return True
+
+    def mark_start(self) -> bool:
+        """녹음 구간 시작 표시 (프리롤만큼 앞에서부터 포함)"""
+        if not self.start():
+            return False
+        self._segment_start = max(0, self.ring.write_pos - self.preroll_samples)
+        return True
+
+    def mark_end(self) -> np.ndarray:
+        """녹음 구간 종료 표시 후 구간 오디오 복사본 반환
+
+        스트림은 계속 기록하므로 view를 넘기면 워커/세션 녹화/파일 대체 경로가 쓰는 동안
+        새 오디오로 덮어쓰일 수 있다. 구간은 길어야 수백 KB라 여기서 한 번 복사한다.
+        구간이 버퍼 용량보다 길었으면 앞부분은 이미 덮어쓰였으므로 최근 용량만큼만 남는다.
+        """
+        start = self._segment_start
+        self._segment_start = None
+        if start is None:
+            return np.zeros(0, dtype=self.ring.dtype)
+        end = self.ring.write_pos  # 구간 끝 (이후 판단은 모두 이 값과 실제로 남은 샘플 수 기준)
+        with span("concatenate"):
+            audio = self.ring.read(start, end)
+            if not audio.flags.owndata:
+                audio = audio.copy()
+        # 복사하는 동안 콜백이 구간 앞부분을 덮어썼으면 그만큼 버림
+        clobbered = self.ring.write_pos - self.ring.capacity - (end - audio.shape[0])
+        if clobbered > 0:
+            audio = audio[clobbered:]
+        lost = end - start - audio.shape[0]
+        if lost > 0:
+            log.warning("녹음이 캡처 버퍼보다 길어 앞부분 %.2f초가 잘렸습니다 (CAPTURE_BUFFER_SECONDS)",
+                        lost / SAMPLE_RATE)
+            count("capture_truncated")
+        return audio
+
+    def close(self):
+        if self.stream is None:
+            return
+        try:
+            self.stream.stop()
+            self.stream.close()
+        except Exception as e:
+            print(f"입력 스트림 종료 오류: {e}")
+        self.stream = None
+
+
+_service: Optional[CaptureService] = None
+_service_lock = threading.Lock()
+
+
+def get_capture_service() -> CaptureService:
+    """프로세스 전역 캡처 서비스 (첫 호출 시 생성 및 스트림 시작)"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = CaptureService(device=resolve_input_device())
+            _service.start()
+        return _service
+
+
+def shutdown_capture_service():
+    """프로그램 종료 시 입력 스트림 닫기"""
+    global _service
+    with _service_lock:
+        if _service is not None:
+            _service.close()
+            _service = None
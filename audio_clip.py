@@ -0,0 +1,69 @@
+"""
+녹음 클립 객체
+
+캡처 → VAD → 증폭 → 인코딩 단계가 같은 녹음의 최대값/RMS를 각각 다시 계산하지 않도록
+샘플 view와 함께 통계와 변환 결과를 처음 필요할 때 한 번만 계산해 보관한다.
+"""
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from config import SAMPLE_RATE, UPLOAD_CODEC
+from utils import signal_levels, upload_gain, prepare_pcm16
+
+
+class AudioClip:
+    """모노 오디오 샘플(view) + 지연 계산/메모된 통계"""
+
+    def __init__(self, samples: np.ndarray, sample_rate: int = SAMPLE_RATE):
+        self.samples = samples.reshape(-1)
+        self.sample_rate = sample_rate
+        self._levels: Optional[Tuple[float, float]] = None
+        self._pcm16: Optional[np.ndarray] = None
+        self._encoded: Dict[str, object] = {}
+
+    def __len__(self) -> int:
+        return self.samples.shape[0]
+
+    @property
+    def duration(self) -> float:
+        """길이 (초)"""
+        return self.samples.shape[0] / self.sample_rate
+
+    @property
+    def levels(self) -> Tuple[float, float]:
+        """(최대값, RMS) - float 스케일, 처음 접근할 때 한 번만 계산"""
+        if self._levels is None:
+            self._levels = signal_levels(self.samples)
+        return self._levels
+
+    @property
+    def peak(self) -> float:
+        return self.levels[0]
+
+    @property
+    def rms(self) -> float:
+        return self.levels[1]
+
+    @property
+    def gain(self) -> float:
+        """업로드용 증폭 배율"""
+        return upload_gain(self.samples, self.peak)
+
+    def slice(self, start: int, end: int) -> "AudioClip":
+        """[start, end) 구간의 새 클립 (샘플은 복사 없는 view)"""
+        return AudioClip(self.samples[start:end], self.sample_rate)
+
+    def pcm16(self) -> np.ndarray:
+        """업로드용 int16 샘플 (int16 캡처에서 증폭이 필요 없으면 원본 view 그대로)"""
+        if self._pcm16 is None:
+            self._pcm16 = prepare_pcm16(self.samples, self.sample_rate, self.levels)
+        return self._pcm16
+
+    def encoded(self, codec: str = UPLOAD_CODEC):
+        """코덱별 인코딩 결과 (EncodedAudio), 같은 코덱은 한 번만 인코딩"""
+        from audio_encoders import encode_audio  # audio_encoders가 이 모듈을 import함
+
+        if codec not in self._encoded:
+            self._encoded[codec] = encode_audio(self, codec=codec)
+        return self._encoded[codec]
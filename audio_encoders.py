@@ -0,0 +1,100 @@
+"""
+업로드용 오디오 인코더
+
+WAV는 16kHz 기준 32KB/s라 행사장 Wi-Fi에서는 업로드 시간이 길다.
+config.UPLOAD_CODEC으로 WAV / FLAC(무손실) / OGG Opus(손실) 중 선택할 수 있으며,
+FLAC/Opus는 soundfile(libsndfile)이 설치되어 있을 때만 사용 가능하다.
+사용할 수 없는 코덱을 고르면 WAV로 대체한다.
+"""
+import io
+from dataclasses import dataclass
+from typing import Dict, List, Union
+
+import numpy as np
+
+from audio_clip import AudioClip
+from config import SAMPLE_RATE, CHANNELS, UPLOAD_CODEC, UPLOAD_OPUS_COMPRESSION
+from utils import audio_array_to_wav_bytes
+
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except Exception:  # ImportError 또는 libsndfile 로드 실패
+    sf = None
+    SOUNDFILE_AVAILABLE = False
+
+
+@dataclass
+class EncodedAudio:
+    """인코딩된 오디오 (filename의 확장자로 Whisper가 포맷을 인식)"""
+    data: bytes
+    filename: str
+    codec: str
+
+
+def _encode_wav(clip: AudioClip) -> bytes:
+    return audio_array_to_wav_bytes(clip.samples, clip.sample_rate, clip.levels)
+
+
+def _encode_soundfile(clip: AudioClip, fmt: str, subtype: str, **kwargs) -> bytes:
+    buf = io.BytesIO()
+    sf.write(buf, clip.pcm16().reshape(-1, CHANNELS), clip.sample_rate, format=fmt, subtype=subtype, **kwargs)
+    return buf.getvalue()
+
+
+def _encode_flac(clip: AudioClip) -> bytes:
+    return _encode_soundfile(clip, "FLAC", "PCM_16")
+
+
+def _encode_opus(clip: AudioClip) -> bytes:
+    # compression_level: 0.0(최고 음질/큰 용량) ~ 1.0(최저 음질/작은 용량)
+    return _encode_soundfile(clip, "OGG", "OPUS", compression_level=UPLOAD_OPUS_COMPRESSION)
+
+
+# 코덱 이름 → (인코더, 파일 확장자)
+ENCODERS: Dict[str, tuple] = {
+    "wav": (_encode_wav, "wav"),
+    "flac": (_encode_flac, "flac"),
+    "opus": (_encode_opus, "ogg"),
+}
+
+
+def _codec_supported(codec: str) -> bool:
+    if codec == "wav":
+        return True
+    if not SOUNDFILE_AVAILABLE:
+        return False
+    try:
+        if codec == "flac":
+            return "FLAC" in sf.available_formats()
+        if codec == "opus":
+            return "OPUS" in sf.available_subtypes("OGG")
+    except Exception:
+        return False
+    return False
+
+
+def available_codecs() -> List[str]:
+    """현재 환경에서 사용 가능한 코덱 목록"""
+    return [name for name in ENCODERS if _codec_supported(name)]
+
+
+def encode_audio(audio: Union[AudioClip, np.ndarray], samplerate: int = SAMPLE_RATE,
+                 codec: str = UPLOAD_CODEC) -> EncodedAudio:
+    """오디오를 업로드용으로 인코딩 (실패하거나 지원되지 않으면 WAV로 대체)"""
+    clip = audio if isinstance(audio, AudioClip) else AudioClip(audio, samplerate)
+    codec = (codec or "wav").lower()
+    if codec not in ENCODERS or not _codec_supported(codec):
+        print(f"코덱 '{codec}' 사용 불가 - WAV로 대체")
+        codec = "wav"
+    encoder, ext = ENCODERS[codec]
+    try:
+        data = encoder(clip)
+    except Exception as e:
+        if codec == "wav":
+            raise
+        print(f"{codec} 인코딩 실패: {e} - WAV로 대체")
+        codec = "wav"
+        encoder, ext = ENCODERS[codec]
+        data = encoder(clip)
+    return EncodedAudio(data=data, filename=f"audio.{ext}", codec=codec)
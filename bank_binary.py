@@ -0,0 +1,122 @@
+"""
+taboo 뱅크 바이너리 형식 (.tbk) - 수십만 항목 뱅크를 전부 읽지 않고 메모리 매핑으로 필요한 항목만 꺼냄
+
+파일 구조 (리틀 엔디언):
+  헤더 16바이트    magic "TBNK", 버전 u16, 예약 u16, 항목 수 N u32, 단어 수 W u32
+  항목 표          u32 x (N + 1) - 항목 i의 단어 = 단어 번호 [entry[i], entry[i+1]) (첫 단어가 목표어)
+  단어 위치 표     u32 x (W + 1) - 단어 j = 문자열 풀의 바이트 [offset[j], offset[j+1])
+  문자열 풀        UTF-8 (구분자 없음)
+
+항목 k개를 뽑을 때는 표 두 개에서 위치만 읽고 해당 바이트만 디코드하므로 O(k)이며,
+나머지 항목은 디스크(페이지 캐시)에 남아 있다.
+
+변환:
+  python bank_binary.py taboo_bank.json taboo_bank.tbk
+"""
+import mmap
+import os
+import random
+import struct
+import sys
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+MAGIC = b"TBNK"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHHII")
+_U32_MAX = 0xFFFFFFFF
+
+
+def is_binary_bank(path: str) -> bool:
+    """파일이 바이너리 뱅크인지 (앞 4바이트로 판별)"""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def write_binary_bank(entries: Iterable[Tuple[str, Sequence[str]]], path: str) -> int:
+    """(목표어, 금지어 목록)들을 바이너리 뱅크로 저장 (임시 파일에 쓴 뒤 교체) - 항목 수 반환"""
+    entry_index = [0]
+    offsets = [0]
+    pool = bytearray()
+    for target, forbidden in entries:
+        for word in (target, *forbidden):
+            pool += word.encode("utf-8")
+            offsets.append(len(pool))
+        entry_index.append(len(offsets) - 1)
+    if len(pool) > _U32_MAX or len(offsets) > _U32_MAX:
+        raise ValueError(f"뱅크가 너무 큼 (문자열 {len(pool)}바이트, 단어 {len(offsets) - 1}개)")
+
+    n_entries, n_words = len(entry_index) - 1, len(offsets) - 1
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, n_entries, n_words))
+        f.write(np.asarray(entry_index, dtype="<u4").tobytes())
+        f.write(np.asarray(offsets, dtype="<u4").tobytes())
+        f.write(pool)
+    os.replace(tmp, path)
+    return n_entries
+
+
+class BinaryBank:
+    """메모리 매핑한 바이너리 뱅크 (읽기 전용)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"바이너리 뱅크가 아님: {path}")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, n_entries, n_words = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 바이너리 뱅크: {path} (magic={magic!r}, 버전 {version})")
+        pos = _HEADER.size
+        # 표는 복사 없이 매핑된 메모리를 그대로 본다 (읽는 페이지만 올라옴)
+        self._entries = np.frombuffer(self._mm, dtype="<u4", count=n_entries + 1, offset=pos)
+        pos += (n_entries + 1) * 4
+        self._offsets = np.frombuffer(self._mm, dtype="<u4", count=n_words + 1, offset=pos)
+        self._pool = pos + (n_words + 1) * 4
+        if self._entries[-1] != n_words or self._pool + int(self._offsets[-1]) != size:
+            raise ValueError(f"바이너리 뱅크가 손상됨: {path}")
+        self.size = n_entries
+
+    def __len__(self) -> int:
+        return self.size
+
+    def entry(self, i: int) -> Tuple[str, Tuple[str, ...]]:
+        """항목 i의 (목표어, 금지어들)"""
+        start, end = int(self._entries[i]), int(self._entries[i + 1])
+        bounds = self._offsets[start:end + 1].tolist()
+        base = self._pool
+        words = [self._mm[base + a:base + b].decode("utf-8") for a, b in zip(bounds, bounds[1:])]
+        return words[0], tuple(words[1:])
+
+    def sample(self, k: int, rng: random.Random = random) -> List[Tuple[str, Tuple[str, ...]]]:
+        """항목 k개 무작위 추출 (중복 없음) - 뽑은 항목만 읽는다"""
+        return [self.entry(i) for i in rng.sample(range(self.size), min(k, self.size))]
+
+    def __iter__(self):
+        return (self.entry(i) for i in range(self.size))
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) != 2:
+        print("사용법: python bank_binary.py <taboo_bank.json> <출력.tbk>")
+        return 2
+    if not os.path.isfile(argv[0]):
+        print(f"파일 없음: {argv[0]}")
+        return 1
+    from bank_store import BankStore  # 변환할 때만 필요 (검증 규칙을 게임과 같게)
+
+    entries = BankStore(argv[0]).entries()
+    n = write_binary_bank(((e.target, e.forbidden) for e in entries), argv[1])
+    print(f"{argv[1]}: {n}개 항목, {os.path.getsize(argv[1])}바이트")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,198 @@
+"""
+taboo 뱅크 저장소 (프로세스 전역, 파일이 바뀌었을 때만 다시 읽음)
+
+- 파일은 한 번만 파싱/검증하고, 정규화 형태(EntryKeys)까지 계산한 불변 BankEntry 튜플로 보관
+- entries()를 부를 때마다 os.stat만 확인: mtime/크기가 바뀌면 내용 해시를 비교해
+  실제로 내용이 달라졌을 때만 다시 파싱 (게임을 재시작하지 않아도 뱅크 수정이 반영됨)
+- 파일이 없거나 깨졌으면 이전에 읽은 뱅크를 유지하고, 처음부터 없으면 config.FALLBACK_TABOO_BANK 사용
+- 바이너리 뱅크(bank_binary.py로 변환한 .tbk)는 내용 해시 대신 (mtime, 크기)로만 변경을 판단
+"""
+import hashlib
+import json
+import os
+import random
+import threading
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from bank_binary import BinaryBank, is_binary_bank
+from config import TABOO_JSON_PATH, FALLBACK_TABOO_BANK
+from text_normalize import EntryKeys
+
+
+@dataclass(frozen=True)
+class BankEntry:
+    """뱅크 항목 하나 (목표어 + 금지어 + 미리 계산한 정규화 형태)"""
+    target: str
+    forbidden: Tuple[str, ...]
+    keys: EntryKeys = field(compare=False, repr=False)
+
+    @classmethod
+    def of(cls, target: str, forbidden: Iterable[str]) -> "BankEntry":
+        forbidden = tuple(forbidden)
+        return cls(target, forbidden, EntryKeys.of(target, list(forbidden)))
+
+
+def parse_bank(data) -> Tuple[BankEntry, ...]:
+    """JSON 데이터 검증: {"target": str, "forbidden": [..]} 형태만 남기고 공백 정리, 빈 단어 제거"""
+    entries = []
+    for item in data if isinstance(data, list) else []:
+        if not isinstance(item, dict):
+            continue
+        target = item.get("target")
+        forbidden = item.get("forbidden")
+        if not isinstance(target, str) or not target.strip() or not isinstance(forbidden, list):
+            continue
+        words = [str(x).strip() for x in forbidden if str(x).strip()]
+        entries.append(BankEntry.of(target.strip(), words))
+    return tuple(entries)
+
+
+FALLBACK_ENTRIES = parse_bank(FALLBACK_TABOO_BANK)
+
+
+class BankStore:
+    """뱅크 파일 하나에 대한 캐시 (여러 스레드에서 호출 가능)
+
+    JSON 뱅크는 전부 파싱해 들고 있고, 바이너리 뱅크(bank_binary, .tbk)는 메모리 매핑만 해 두고
+    sample()이 뽑은 항목만 읽는다.
+    """
+
+    def __init__(self, path: str = TABOO_JSON_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Tuple[BankEntry, ...]] = None  # 바이너리 뱅크면 entries()를 처음 부를 때 채움
+        self._binary: Optional[BinaryBank] = None
+        self._stat: Optional[Tuple[int, int]] = None  # (mtime_ns, 크기)
+        self._digest: Optional[bytes] = None
+        self.version = 0  # 뱅크 내용이 바뀔 때마다 증가
+        self.parses = 0
+
+    def refresh(self) -> int:
+        """파일이 바뀌었는지 확인하고 현재 뱅크 버전 반환"""
+        with self._lock:
+            self._refresh()
+            return self.version
+
+    def entries(self) -> Tuple[BankEntry, ...]:
+        """뱅크 전체 (파일이 바뀌지 않았으면 stat 한 번으로 끝)
+
+        바이너리 뱅크는 전부 풀어야 하므로 큰 뱅크에서는 sample / index_entries를 쓴다.
+        """
+        with self._lock:
+            self._refresh()
+            if self._entries is None:  # 바이너리 뱅크 전체가 필요한 경우 (로컬 추측기 색인 등)
+                self._entries = tuple(BankEntry.of(t, f) for t, f in self._binary)
+            return self._entries
+
+    def sample(self, k: int, rng: random.Random = random) -> List[BankEntry]:
+        """항목 k개 무작위 추출 (중복 없음, 바이너리 뱅크는 뽑은 항목만 읽어 O(k))"""
+        with self._lock:
+            self._refresh()
+            if self._entries is None:
+                return [BankEntry.of(t, f) for t, f in self._binary.sample(k, rng)]
+            return rng.sample(self._entries, min(k, len(self._entries)))
+
+    def index_entries(self, limit: int, include: Sequence[BankEntry] = ()) -> Tuple[BankEntry, ...]:
+        """색인용 항목 (로컬 추측기 등): 뱅크가 limit개 이하면 전체,
+        넘으면 include(이번 게임 항목) + 나머지를 무작위로 limit개까지 - 바이너리 뱅크도 뽑은 항목만 읽음"""
+        with self._lock:
+            self._refresh()
+            entries, binary = self._entries, self._binary
+        size = len(entries) if entries is not None else len(binary)
+        if size <= limit:
+            return self.entries()
+        chosen = list(include)[:limit]
+        seen = {e.target for e in chosen}
+        # include와 겹치는 항목을 건너뛰어도 limit개를 채우도록 그만큼 더 뽑아 둔다
+        for i in random.sample(range(size), min(size, limit)):
+            if len(chosen) >= limit:
+                break
+            entry = entries[i] if entries is not None else BankEntry.of(*binary.entry(i))
+            if entry.target not in seen:
+                seen.add(entry.target)
+                chosen.append(entry)
+        return tuple(chosen)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._binary) if self._entries is None else len(self._entries)
+
+    def _refresh(self):
+        try:
+            st = os.stat(self.path)
+            stat = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stat = None
+        if self.version and stat == self._stat:
+            return
+        self._stat = stat
+        if stat is None:
+            if not self.version:
+                print(f"taboo 뱅크 파일 없음 ({self.path}) - 내장 뱅크 사용")
+                self._set(FALLBACK_ENTRIES)
+        elif is_binary_bank(self.path):
+            self._load_binary()
+        else:
+            self._load_json()
+
+    def _load_binary(self):
+        try:
+            bank = BinaryBank(self.path)
+        except (OSError, ValueError) as e:
+            print(f"taboo 뱅크 읽기 실패 ({self.path}): {e}")
+            bank = None
+        if bank is None or not len(bank):
+            if not self.version:
+                self._set(FALLBACK_ENTRIES)
+            return  # 깨진 파일은 무시하고 이전 뱅크 유지
+        if self.version:
+            print(f"taboo 뱅크 다시 읽음: {len(bank)}개 항목 ({self.path})")
+        self._set(None, binary=bank)
+
+    def _load_json(self):
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            print(f"taboo 뱅크 읽기 실패 ({self.path}): {e}")
+            raw = None
+        digest = hashlib.blake2b(raw, digest_size=16).digest() if raw is not None else None
+        if digest is not None and digest == self._digest:
+            return  # 시각만 바뀌고 내용은 같음
+        entries: Tuple[BankEntry, ...] = ()
+        if raw is not None:
+            try:
+                self.parses += 1
+                entries = parse_bank(json.loads(raw.decode("utf-8")))
+            except (UnicodeDecodeError, ValueError) as e:
+                print(f"taboo 뱅크 파싱 실패 ({self.path}): {e}")
+        if not entries:
+            if not self.version:
+                self._set(FALLBACK_ENTRIES)
+            return  # 깨진 파일은 무시하고 이전 뱅크 유지
+        if self.version:
+            print(f"taboo 뱅크 다시 읽음: {len(entries)}개 항목 ({self.path})")
+        self._set(entries, digest)
+
+    def _set(self, entries: Optional[Tuple[BankEntry, ...]], digest: Optional[bytes] = None,
+             binary: Optional[BinaryBank] = None):
+        # 이전 BinaryBank의 매핑은 닫지 않는다 (이미 꺼내 간 numpy 뷰가 있을 수 있음 - 참조가 사라지면 해제)
+        self._entries = entries
+        self._binary = binary
+        self._digest = digest
+        self.version += 1
+
+
+_store: Optional[BankStore] = None
+_store_lock = threading.Lock()
+
+
+def get_bank_store() -> BankStore:
+    """프로세스 전역 뱅크 저장소 (config.TABOO_JSON_PATH)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = BankStore(TABOO_JSON_PATH)
+        return _store
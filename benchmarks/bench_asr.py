@@ -0,0 +1,55 @@
+"""
+ASR 백엔드 지연 시간 비교: 같은 녹음을 백엔드마다 여러 번 인식시켜 p50/p95 출력
+
+사용법:
+  python benchmarks/bench_asr.py clip.wav                 # remote + (설치되어 있으면) local
+  python benchmarks/bench_asr.py clip.wav -n 10 local     # 특정 백엔드만, 10회
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from asr_backends import ASRError, LocalWhisperBackend, RemoteWhisperBackend, local_asr_available  # noqa: E402
+
+
+def make_backend(name: str):
+    if name == "local":
+        return LocalWhisperBackend()
+    from openai import OpenAI
+    return RemoteWhisperBackend(OpenAI())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("wav")
+    parser.add_argument("backends", nargs="*")
+    parser.add_argument("-n", type=int, default=5, help="백엔드별 반복 횟수")
+    args = parser.parse_args()
+
+    with open(args.wav, "rb") as f:
+        audio_data = f.read()
+    names = args.backends or (["remote", "local"] if local_asr_available() else ["remote"])
+
+    for name in names:
+        backend = make_backend(name)
+        try:
+            # 첫 호출은 모델 로딩/연결 수립이 포함되므로 따로 보고
+            t0 = time.perf_counter()
+            text = backend.transcribe(audio_data, os.path.basename(args.wav))
+            print(f"[{name}] 첫 호출 {time.perf_counter() - t0:.2f}s: '{text}'")
+            for _ in range(args.n):
+                backend.transcribe(audio_data, os.path.basename(args.wav))
+        except ASRError as e:
+            print(f"[{name}] 실패: {e}")
+        stats = backend.stats()
+        if "p50" in stats:
+            print(f"[{name}] {backend.model_name}: {stats['calls']}회, "
+                  f"p50 {stats['p50'] * 1000:.0f}ms, p95 {stats['p95'] * 1000:.0f}ms, 실패 {stats['failures']}")
+        backend.close()
+
+
+if __name__ == "__main__":
+    main()
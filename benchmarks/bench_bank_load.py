@@ -0,0 +1,109 @@
+"""
+뱅크 로드 벤치마크: JSON 뱅크 vs 바이너리 뱅크(.tbk, 메모리 매핑)
+
+항목 N개짜리 합성 뱅크를 JSON과 바이너리로 만들고, 형식마다 새 프로세스에서
+BankStore를 열어 라운드 수(k)만큼 뽑는 데 걸린 시간과 늘어난 최대 RSS를 잰다.
+이어서 로컬 추측기(GUESS_BACKEND=local/fallback) 색인을 만들 때의 시간과 RSS도 잰다
+(LOCAL_GUESS_MAX_ENTRIES개까지만 색인).
+(프로세스를 나누는 이유: RSS는 줄지 않으므로 같은 프로세스에서는 비교가 안 됨)
+
+사용법:
+  python benchmarks/bench_bank_load.py
+  python benchmarks/bench_bank_load.py --sizes 1000 100000 500000 -k 12
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후"
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def max_rss_kb() -> int:
+    """지금까지의 최대 RSS (KB, 측정할 수 없으면 0)"""
+    if resource is None:
+        return 0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss  # macOS는 바이트 단위
+
+
+def random_word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5)))
+
+
+def child(path: str, k: int):
+    """하위 프로세스: 임포트 후 RSS를 기준으로, 열기 + k개 추출, 로컬 추측기 색인의 시간/RSS 증가량 출력"""
+    from bank_store import BankStore
+    from config import LOCAL_GUESS_MAX_ENTRIES
+    from local_guesser import LocalGuesser
+
+    base = max_rss_kb()
+    t0 = time.perf_counter()
+    store = BankStore(path)
+    items = store.sample(k)
+    elapsed = time.perf_counter() - t0
+    rss = max_rss_kb() - base
+    t0 = time.perf_counter()
+    entries = store.index_entries(LOCAL_GUESS_MAX_ENTRIES, items)
+    LocalGuesser(entries)
+    local_elapsed = time.perf_counter() - t0
+    print(json.dumps({"ms": elapsed * 1000, "rss_kb": rss, "n": len(store), "k": len(items),
+                      "local_ms": local_elapsed * 1000, "local_rss_kb": max_rss_kb() - base - rss,
+                      "indexed": len(entries)}))
+
+
+def run_child(path: str, k: int) -> dict:
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", path, "-k", str(k)],
+                         capture_output=True, text=True, check=True, cwd=ROOT)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1000, 50000, 300000], help="뱅크 항목 수")
+    parser.add_argument("-k", type=int, default=12, help="뽑을 항목 수 (ROUNDS_PER_SESSION)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child, args.k)
+        return
+
+    from bank_binary import write_binary_bank
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            bank = [{"target": random_word(rng), "forbidden": [random_word(rng) for _ in range(5)]}
+                    for _ in range(size)]
+            json_path = os.path.join(tmp, f"bank{size}.json")
+            bin_path = os.path.join(tmp, f"bank{size}.tbk")
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(bank, f, ensure_ascii=False)
+            write_binary_bank(((item["target"], item["forbidden"]) for item in bank), bin_path)
+
+            j = run_child(json_path, args.k)
+            b = run_child(bin_path, args.k)
+            print(f"항목 {size:7d}개 (JSON {os.path.getsize(json_path) / 1e6:6.1f}MB, "
+                  f"바이너리 {os.path.getsize(bin_path) / 1e6:6.1f}MB)")
+            print(f"  JSON     : 열기+{j['k']}개 추출 {j['ms']:9.1f}ms, RSS +{j['rss_kb'] / 1024:7.1f}MB")
+            print(f"  바이너리 : 열기+{b['k']}개 추출 {b['ms']:9.1f}ms, RSS +{b['rss_kb'] / 1024:7.1f}MB "
+                  f"({j['ms'] / max(b['ms'], 1e-3):.0f}배 빠름)")
+            for name, r in (("JSON", j), ("바이너리", b)):
+                print(f"  로컬 추측기 색인 ({name}, {r['indexed']}개): {r['local_ms']:9.1f}ms, "
+                      f"RSS +{r['local_rss_kb'] / 1024:7.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+업로드 코덱 벤치마크: 오디오 1초당 바이트 수와 인코딩 시간
+
+사용법:
+  python benchmarks/bench_encoders.py            # 합성 음성 신호 5초
+  python benchmarks/bench_encoders.py clip.wav   # 녹음 파일 사용 (16비트 모노 WAV)
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+import wave
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from config import SAMPLE_RATE  # noqa: E402
+from audio_encoders import ENCODERS, available_codecs, encode_audio  # noqa: E402
+
+
+def synth_speech(seconds: float = 5.0, samplerate: int = SAMPLE_RATE) -> np.ndarray:
+    """음성과 비슷한 스펙트럼의 합성 신호 (기본 주파수 변화 + 배음 + 음절 단위 진폭 변화)"""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * samplerate)) / samplerate
+    f0 = 140 + 30 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / samplerate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 12))
+    envelope = np.clip(np.sin(2 * np.pi * 4 * t), 0, None) ** 0.5
+    signal = 0.05 * voiced * envelope + 0.002 * rng.standard_normal(t.shape[0])
+    return signal.astype(np.float32)
+
+
+def load_wav(path: str) -> np.ndarray:
+    with wave.open(path, "rb") as wf:
+        data = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+    return (data.astype(np.float32) / 32767.0)
+
+
+def main():
+    audio = load_wav(sys.argv[1]) if len(sys.argv) > 1 else synth_speech()
+    seconds = audio.shape[0] / SAMPLE_RATE
+    repeats = 20
+    print(f"입력: {seconds:.2f}초, {SAMPLE_RATE}Hz")
+    print(f"{'codec':<6} {'bytes/s':>10} {'ratio':>7} {'encode ms/s':>12}")
+    wav_size = None
+    supported = available_codecs()
+    for codec in ENCODERS:
+        if codec not in supported:
+            print(f"{codec:<6} {'(사용 불가)':>10}")
+            continue
+        with contextlib.redirect_stdout(io.StringIO()):
+            encoded = encode_audio(audio, codec=codec)
+            t0 = time.perf_counter()
+            for _ in range(repeats):
+                encode_audio(audio, codec=codec)
+            elapsed = (time.perf_counter() - t0) / repeats
+        size = len(encoded.data)
+        wav_size = wav_size or (size if codec == "wav" else None)
+        ratio = f"{wav_size / size:.1f}x" if wav_size else "-"
+        print(f"{codec:<6} {size / seconds:>10.0f} {ratio:>7} {elapsed * 1000 / seconds:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+퍼지 매칭 벤치마크: 한 음절이 잘못 인식된 목표어를 정확 일치 검사와 퍼지 검사가 각각 얼마나 잡는지,
+깨끗한 설명에서 잘못 잡는 비율(오탐)과 검사 시간, 뱅크 전체 일괄 스캔(NumPy 벡터화) 속도를 비교
+
+사용법:
+  python benchmarks/bench_fuzzy.py
+  python benchmarks/bench_fuzzy.py --bank taboo_bank.json --ratio 0.2 --min-length 5
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bank_store import BankStore  # noqa: E402
+from config import TABOO_JSON_PATH, FUZZY_MAX_RATIO, FUZZY_MIN_LENGTH  # noqa: E402
+from fuzzy_match import FuzzyMatcher  # noqa: E402
+from matcher import ViolationMatcher  # noqa: E402
+from text_normalize import to_jamo  # noqa: E402
+
+FILLERS = ["이건", "아주", "자주", "쓰는", "물건이에요", "사람들이", "많이", "좋아해요", "그거", "있잖아요",
+           "여기서", "매일", "보는", "거예요", "큰", "작은"]
+
+
+def mishear(word: str, rng: random.Random) -> str:
+    """한 음절의 모음 또는 받침 하나를 바꾼 단어 (Whisper가 비슷한 소리로 잘못 적은 경우 흉내)"""
+    syllables = [i for i, ch in enumerate(word) if "가" <= ch <= "힣"]
+    if not syllables:
+        return word
+    i = rng.choice(syllables)
+    code = ord(word[i]) - 0xAC00
+    lead, vowel, tail = code // 588, (code % 588) // 28, code % 28
+    if rng.random() < 0.7:
+        vowel = (vowel + rng.randint(1, 20)) % 21
+    else:
+        tail = (tail + rng.randint(1, 27)) % 28
+    return word[:i] + chr(0xAC00 + lead * 588 + vowel * 28 + tail) + word[i + 1:]
+
+
+def sentence(rng: random.Random, word: str = "") -> str:
+    words = rng.sample(FILLERS, rng.randint(2, 6))
+    if word:
+        words.insert(rng.randint(0, len(words)), word)
+    return " ".join(words)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bank", default=TABOO_JSON_PATH)
+    parser.add_argument("--ratio", type=float, default=FUZZY_MAX_RATIO)
+    parser.add_argument("--min-length", type=int, default=FUZZY_MIN_LENGTH)
+    parser.add_argument("--unit", default="jamo", choices=["jamo", "syllable"])
+    parser.add_argument("-n", type=int, default=20, help="항목당 문장 수")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    bank = BankStore(args.bank).entries()
+    exact_hits = fuzzy_hits = false_pos = total = 0
+    exact_s = fuzzy_s = 0.0
+    for entry in bank:
+        matcher = ViolationMatcher(entry.target, list(entry.forbidden), keys=entry.keys)
+        clean_words = {entry.target, *entry.forbidden}
+        for _ in range(args.n):
+            misheard = sentence(rng, mishear(entry.target, rng))
+            clean = sentence(rng)
+            if any(w in clean for w in clean_words):
+                continue
+            total += 1
+            t0 = time.perf_counter()
+            exact = matcher.check(misheard)
+            exact_s += time.perf_counter() - t0
+            t0 = time.perf_counter()
+            fuzzy = matcher.fuzzy_check(misheard, args.ratio, args.min_length, args.unit)
+            fuzzy_s += time.perf_counter() - t0
+            exact_hits += exact[1]
+            fuzzy_hits += exact[1] or fuzzy[1]
+            false_pos += any(matcher.fuzzy_check(clean, args.ratio, args.min_length, args.unit))
+    print(f"뱅크 {len(bank)}항목, 한 음절 오인식 문장 {total}개 (unit={args.unit}, ratio={args.ratio}, "
+          f"min_length={args.min_length})")
+    print(f"  목표어 검출: 정확 일치 {exact_hits / total:6.1%}, +퍼지 {fuzzy_hits / total:6.1%}")
+    print(f"  깨끗한 문장 오탐: {false_pos / total:6.1%}")
+    print(f"  검사 시간: 정확 {exact_s / total * 1e6:6.1f}us/건, 퍼지(라운드 단어) {fuzzy_s / total * 1e6:6.1f}us/건")
+
+    # 뱅크 전체 단어를 한 번에 스캔: NumPy 레인 벡터화 vs 단어마다 따로 스캔
+    words = [k.jamo for entry in bank for k in (entry.keys.target,) + entry.keys.forbidden]
+    texts = [to_jamo(sentence(rng, mishear(rng.choice(bank).target, rng)).replace(" ", ""))
+             for _ in range(50)]
+    batch = FuzzyMatcher(words)
+    singles = [FuzzyMatcher([w]) for w in words]
+    t0 = time.perf_counter()
+    batch_result = [batch.distances(t)[0] for t in texts]
+    batch_ms = (time.perf_counter() - t0) / len(texts) * 1000
+    t0 = time.perf_counter()
+    single_result = [[m.distances(t)[0][0] for m in singles] for t in texts[:10]]
+    single_ms = (time.perf_counter() - t0) / 10 * 1000
+    same = all(np.array_equal(b, s) for b, s in zip(batch_result, single_result))
+    print(f"뱅크 전체 {len(words)}단어 일괄 스캔: 벡터화 {batch_ms:.2f}ms/문장, "
+          f"단어별 스캔 {single_ms:.1f}ms/문장 ({single_ms / batch_ms:.0f}배), 결과 일치 {same}")
+
+
+if __name__ == "__main__":
+    main()
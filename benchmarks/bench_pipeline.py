@@ -0,0 +1,80 @@
+"""
+오프라인 파이프라인 부하 테스트: 로컬 OpenAI 대역 서버를 띄우고 OpenAIHelper로 턴(인식 + 추측)을 반복
+
+실제 API 없이 재시도/서킷 브레이커/스트리밍 경로까지 포함한 전체 지연 시간을 본다.
+캐시는 꺼서 매 턴이 서버까지 가도록 한다.
+
+사용법:
+  python benchmarks/bench_pipeline.py                              # 50턴, 동시 1명
+  python benchmarks/bench_pipeline.py -n 200 -c 8 --error-rate 0.1 --asr-latency lognormal:0.4,0.5
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mock_openai_server import MockBehavior, MockOpenAIServer  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=50, help="전체 턴 수")
+    parser.add_argument("-c", type=int, default=1, help="동시에 진행하는 턴 수")
+    parser.add_argument("--asr-latency", default="lognormal:0.3,0.3")
+    parser.add_argument("--llm-latency", default="lognormal:0.4,0.3")
+    parser.add_argument("--chunk-delay", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    behavior = MockBehavior(
+        asr_latency=args.asr_latency, llm_latency=args.llm_latency, chunk_delay=args.chunk_delay,
+        error_rate=args.error_rate, error_codes=(500, 503, 429), hang_rate=args.hang_rate,
+        drop_rate=args.drop_rate, seed=args.seed,
+    )
+    server = MockOpenAIServer(behavior).start()
+    # config는 import 시점에 환경 변수를 읽으므로 먼저 설정
+    os.environ.update(OPENAI_BASE_URL=server.base_url, GUESS_CACHE_ENABLED="0", ASR_CACHE_ENABLED="0",
+                      ASR_BACKEND="remote", GUESS_BACKEND="remote")
+    os.environ.setdefault("OPENAI_API_KEY", "mock")
+
+    from openai_helper import OpenAIHelper
+    from utils import audio_array_to_wav_bytes
+
+    helper = OpenAIHelper()
+    helper.warm_up()
+    rng = np.random.default_rng(args.seed)
+    clip = (rng.standard_normal(16000) * 0.1).astype(np.float32)
+    wav = audio_array_to_wav_bytes(clip)
+
+    def run_turn(i: int):
+        t0 = time.perf_counter()
+        text = helper.transcribe_audio_data(wav, "audio.wav")
+        t1 = time.perf_counter()
+        helper.ask_guess([f"{text} ({i})"])
+        t2 = time.perf_counter()
+        return t1 - t0, t2 - t1, t2 - t0
+
+    t_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.c) as pool:
+        results = np.array(list(pool.map(run_turn, range(args.n))))
+    wall = time.perf_counter() - t_start
+
+    for col, name in enumerate(("asr", "llm", "turn")):
+        p50, p95, p99 = np.percentile(results[:, col], [50, 95, 99]) * 1000
+        print(f"{name:<5} p50 {p50:6.0f}ms  p95 {p95:6.0f}ms  p99 {p99:6.0f}ms")
+    print(f"{args.n}턴 / {wall:.1f}s ({args.n / wall:.1f} 턴/s, 동시 {args.c})")
+    helper.close()  # API 통계 출력
+    print(f"서버 통계: {behavior.stats()}")
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
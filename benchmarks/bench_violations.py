@@ -0,0 +1,70 @@
+"""
+위반 검사 벤치마크: 금지어마다 부분 문자열을 찾던 기존 방식 vs 라운드별 Aho–Corasick 검사기
+
+금지어 수를 늘려 가며 인식 결과 한 건당 검사 시간을 비교하고, 두 방식의 결과가 같은지 확인한다.
+
+사용법:
+  python benchmarks/bench_violations.py
+  python benchmarks/bench_violations.py --sizes 10 100 1000 -n 2000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from matcher import ViolationMatcher  # noqa: E402
+from text_normalize import EntryKeys, contains_key, match_text  # noqa: E402
+
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후"
+
+
+def naive_check(text: str, keys: EntryKeys):
+    """기존 utils.check_violations 방식 (금지어마다 부분 문자열 검사) - 같은 정규화 기준으로 비교"""
+    text_n = match_text(text)
+    target_violation = contains_key(text_n, keys.target)
+    for key in keys.forbidden:
+        if contains_key(text_n, key):
+            return key.word, target_violation
+    return None, target_violation
+
+
+def random_word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="*", default=[5, 50, 200, 1000], help="금지어 개수")
+    parser.add_argument("-n", type=int, default=5000, help="검사할 인식 결과 수")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for size in args.sizes:
+        target = random_word(rng)
+        forbidden = [random_word(rng) for _ in range(size)]
+        vocab = forbidden + [target] + [random_word(rng) for _ in range(size)]
+        # 대부분은 위반 없는 설명, 일부는 금지어/목표어 포함 (2~12어절)
+        texts = [" ".join(random_word(rng) if rng.random() < 0.9 else rng.choice(vocab)
+                          for _ in range(rng.randint(2, 12))) for _ in range(args.n)]
+
+        t0 = time.perf_counter()
+        matcher = ViolationMatcher(target, forbidden)
+        compile_ms = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        expected = [naive_check(t, matcher.keys) for t in texts]
+        naive_us = (time.perf_counter() - t0) / args.n * 1e6
+        t0 = time.perf_counter()
+        actual = [matcher.check(t) for t in texts]
+        ac_us = (time.perf_counter() - t0) / args.n * 1e6
+
+        mismatches = sum(a != b for a, b in zip(actual, expected))
+        print(f"금지어 {size:5d}개: 기존 {naive_us:8.1f}us/건, Aho–Corasick {ac_us:6.1f}us/건 "
+              f"({naive_us / ac_us:5.1f}배), 컴파일 {compile_ms:.1f}ms, 결과 불일치 {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
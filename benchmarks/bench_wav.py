@@ -0,0 +1,74 @@
+"""
+WAV 직렬화 마이크로벤치마크: 기존 wave+BytesIO 경로 vs 단일 할당 빌더
+
+클립당 변환 시간과, tracemalloc으로 측정한 최대 메모리 사용량(출력 크기 대비 배수)을 출력한다.
+
+사용법:
+  python benchmarks/bench_wav.py [초 단위 클립 길이]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+import wave
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from config import SAMPLE_RATE, CHANNELS  # noqa: E402
+from utils import audio_array_to_wav_bytes  # noqa: E402
+
+
+def legacy_wav_bytes(audio: np.ndarray, samplerate: int = SAMPLE_RATE) -> bytes:
+    """이전 구현: 증폭/클리핑/캐스팅마다 임시 배열 + wave 모듈 + BytesIO 복사"""
+    audio_max = np.max(np.abs(audio))
+    np.sqrt(np.mean(audio**2))
+    if audio_max < 0.8:
+        audio = audio * min(50.0, 0.8 / audio_max)
+    audio = np.clip(audio, -1.0, 1.0)
+    audio = (audio * 32767.0).astype(np.int16)
+    np.max(np.abs(audio))
+    wav_buffer = io.BytesIO()
+    with wave.open(wav_buffer, 'wb') as wf:
+        wf.setnchannels(CHANNELS)
+        wf.setsampwidth(2)
+        wf.setframerate(samplerate)
+        wf.writeframes(audio.tobytes())
+    wav_buffer.seek(0)
+    return wav_buffer.read()
+
+
+def measure(fn, audio: np.ndarray, repeats: int = 50):
+    with contextlib.redirect_stdout(io.StringIO()):
+        out = fn(audio)
+        t0 = time.perf_counter()
+        for _ in range(repeats):
+            fn(audio)
+        elapsed = (time.perf_counter() - t0) / repeats
+
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        result = fn(audio)
+        peak = tracemalloc.get_traced_memory()[1] - base
+        tracemalloc.stop()
+    del result
+    return elapsed, peak, len(out)
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    rng = np.random.default_rng(0)
+    audio = (rng.standard_normal(int(seconds * SAMPLE_RATE)) * 0.05).astype(np.float32)
+    print(f"클립: {seconds:.1f}초 float32 ({audio.nbytes} bytes)")
+    print(f"{'impl':<8} {'ms/clip':>9} {'peak bytes':>12} {'peak/output':>12}")
+    for name, fn in (("legacy", legacy_wav_bytes), ("builder", audio_array_to_wav_bytes)):
+        elapsed, peak, size = measure(fn, audio)
+        print(f"{name:<8} {elapsed * 1000:>9.3f} {peak:>12} {peak / size:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+녹화된 게임 세션 재생: 아카이브의 원본 오디오로 Game.process_audio를 다시 돌려 지연 시간 비교
+
+턴마다 녹화 당시의 라운드 상태(목표어, 금지어, 이전 설명)를 복원한 뒤 같은 오디오를 처리하고,
+녹화 당시와 재생 시의 단계별 p50/p95, 인식 결과/AI 응답/정답 여부가 달라진 턴을 보고한다.
+캐시는 기본으로 꺼서 매 턴이 실제 백엔드까지 가도록 한다.
+
+사용법:
+  python benchmarks/replay_session.py sessions/20261017-101500-ab12c3          # 1x (녹화 당시 턴 간격 유지)
+  python benchmarks/replay_session.py SESSION --fast                          # 최대 속도
+  python benchmarks/replay_session.py SESSION --fast --mock                   # 녹화된 인식/응답을 대역 서버로 재현
+  python benchmarks/replay_session.py SESSION --fast --report replay.json      # 보고서 JSON 저장
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mock_openai_server import MockBehavior, MockOpenAIServer  # noqa: E402
+from session_recorder import SessionArchive  # noqa: E402
+
+MOCK_PLACEHOLDER_REPLY = "잘 모르겠어요. 조금 더 설명해주세요."
+
+
+def percentiles(values) -> dict:
+    if not len(values):
+        return {}
+    p50, p95 = np.percentile(np.asarray(values, dtype=np.float64), [50, 95])
+    return {"p50": float(p50), "p95": float(p95), "n": len(values)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("session", help="세션 디렉터리 (SESSION_RECORD_DIR 아래)")
+    parser.add_argument("--fast", action="store_true", help="턴 간격을 기다리지 않고 최대 속도로 재생")
+    parser.add_argument("--mock", action="store_true", help="녹화된 인식 결과/AI 응답을 돌려주는 대역 서버 사용")
+    parser.add_argument("--asr-latency", default="0.3", help="--mock 인식 지연 분포")
+    parser.add_argument("--llm-latency", default="0.4", help="--mock 첫 토큰 지연 분포")
+    parser.add_argument("--cache", action="store_true", help="ASR/추측 캐시 사용")
+    parser.add_argument("--report", help="보고서 JSON 저장 경로")
+    args = parser.parse_args()
+
+    archive = SessionArchive(args.session)
+    turns = [t for t in archive if t["audio"]["samples"]]
+    if not turns:
+        print("재생할 턴이 없습니다.")
+        return
+
+    # config는 import 시점에 환경 변수를 읽으므로 게임 모듈보다 먼저 설정
+    os.environ["SESSION_RECORD_DIR"] = ""  # 재생 중에는 다시 녹화하지 않음
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    if not args.cache:
+        os.environ.update(GUESS_CACHE_ENABLED="0", ASR_CACHE_ENABLED="0")
+    server = None
+    if args.mock:
+        # 응답은 턴마다 pin으로 고정 (취소/오류 턴도 요청을 보내므로 순서대로 나눠 주면 뒤 턴이 밀린다)
+        server = MockOpenAIServer(MockBehavior(args.asr_latency, args.llm_latency)).start()
+        os.environ.update(OPENAI_BASE_URL=server.base_url, ASR_BACKEND="remote")
+        os.environ.setdefault("OPENAI_API_KEY", "mock")
+
+    import pygame
+    from config import WINDOW_W, WINDOW_H
+    from game import Game
+    from metrics import REGISTRY
+    from models import RoundState
+    from audio_clip import AudioClip
+
+    pygame.init()
+    game = Game(pygame.Surface((WINDOW_W, WINDOW_H)))
+    game.start()
+
+    diffs = {"text": 0, "ai_reply": 0, "success": 0}
+    replay_t0 = time.perf_counter()
+    first_t = turns[0]["audio"]["t"]
+    for turn in turns:
+        if not args.fast:
+            wait = (turn["audio"]["t"] - first_t) - (time.perf_counter() - replay_t0)
+            if wait > 0:
+                time.sleep(wait)
+        game.round = RoundState(target=turn["target"], forbidden=list(turn["forbidden"]),
+                                description_history=list(turn["history"]))
+        clip = AudioClip(archive.samples(turn), turn["audio"]["sample_rate"])
+        if server is not None:
+            # 녹화 당시 결과가 없는 턴은 자리 표시 응답 (빈 인식 결과면 추측 요청까지 가지 않음)
+            server.behavior.pin(turn.get("text") or "", turn.get("ai_reply") or MOCK_PLACEHOLDER_REPLY)
+        outcome = game.process_audio(clip)
+        if turn.get("status") != "ok":
+            continue  # 녹화 당시 결과가 없던 턴은 지연 시간만 본다
+        for key, value in (("text", outcome.text), ("ai_reply", outcome.ai_reply),
+                           ("success", outcome.success)):
+            if turn.get(key) != value:
+                diffs[key] += 1
+        if turn.get("success") != outcome.success:
+            print(f"[턴 {turn['turn']}] 정답 여부 변경: {turn.get('success')} → {outcome.success} "
+                  f"('{turn.get('text')}' → '{outcome.text}')")
+    wall = time.perf_counter() - replay_t0
+    game.close()
+
+    recorded = archive.recorded_timings()
+    replayed = REGISTRY.snapshot()
+    report = {"session": args.session, "turns": len(turns), "wall_seconds": wall, "fast": args.fast,
+              "mock": args.mock, "diffs": diffs, "stages": {}}
+    print(f"\n{'stage':<16}{'rec p50':>9}{'rec p95':>9}{'rep p50':>9}{'rep p95':>9}  (ms)")
+    for name in ("vad", "encode", "asr", "violation_check", "llm", "guess_parse", "state_update",
+                 "turn_total"):
+        rec = percentiles(recorded.get(name, []))
+        rep = {k: replayed[name][k] for k in ("p50", "p95") if k in replayed.get(name, {})}
+        if not rec and not rep:
+            continue
+        report["stages"][name] = {"recorded": rec, "replayed": rep}
+        cells = [rec.get("p50"), rec.get("p95"), rep.get("p50"), rep.get("p95")]
+        print(f"{name:<16}" + "".join(f"{v * 1000:9.0f}" if v is not None else f"{'-':>9}" for v in cells))
+    print(f"\n{len(turns)}턴 재생 {wall:.1f}s, 녹화와 다른 턴: 인식 {diffs['text']}, "
+          f"응답 {diffs['ai_reply']}, 정답 여부 {diffs['success']}")
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if server is not None:
+        server.stop()
+    archive.close()
+
+
+if __name__ == "__main__":
+    main()
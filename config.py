@@ -12,6 +12,23 @@ SAMPLE_RATE = int(os.getenv("SAMPLE_RATE", "16000"))  # 테스트에서 성공
 CHANNELS = 1
 RECORD_SECONDS = float(os.getenv("RECORD_SECONDS", "3.0"))
 
+# 캡처 링 버퍼 설정 (SPACE 녹음)
+CAPTURE_BUFFER_SECONDS = float(os.getenv("CAPTURE_BUFFER_SECONDS", "30"))  # 최대 녹음 길이
+CAPTURE_DTYPE = os.getenv("CAPTURE_DTYPE", "float32")  # float32 또는 int16
+CAPTURE_BLOCKSIZE = int(os.getenv("CAPTURE_BLOCKSIZE", "1024"))
+CAPTURE_PREROLL_SECONDS = float(os.getenv("CAPTURE_PREROLL_SECONDS", "0.2"))  # 키 누르기 직전 포함 구간
+INPUT_DEVICE = os.getenv("INPUT_DEVICE")  # 입력 디바이스 번호/이름 (없으면 기본 디바이스)
+
+# 음성 구간 검출 (VAD) - 업로드 전 무음 제거
+VAD_ENABLED = os.getenv("VAD_ENABLED", "1") == "1"
+VAD_FRAME_MS = int(os.getenv("VAD_FRAME_MS", "20"))
+VAD_MIN_RMS = float(os.getenv("VAD_MIN_RMS", "0.002"))  # 이보다 작으면 무조건 무음
+VAD_NOISE_RATIO = float(os.getenv("VAD_NOISE_RATIO", "3.0"))  # 배경 소음 대비 배수
+VAD_PEAK_RATIO = float(os.getenv("VAD_PEAK_RATIO", "0.3"))  # 임계값 상한: 가장 큰 프레임 RMS 대비 배수
+VAD_ZCR_THRESHOLD = float(os.getenv("VAD_ZCR_THRESHOLD", "0.25"))
+VAD_MIN_SPEECH_SECONDS = float(os.getenv("VAD_MIN_SPEECH_SECONDS", "0.2"))
+VAD_PADDING_SECONDS = float(os.getenv("VAD_PADDING_SECONDS", "0.15"))
+
 # UI 설정
 WINDOW_W, WINDOW_H = 980, 640
 BG_COLOR = (18, 20, 26)
@@ -30,12 +47,79 @@ TIME_ATTACK_SECONDS = int(os.getenv("TIME_ATTACK_SECONDS", "60"))
 SPEED_RUN_TARGET_COUNT = int(os.getenv("SPEED_RUN_TARGET_COUNT", "10"))
 SKIP_PENALTY_SECONDS = int(os.getenv("SKIP_PENALTY_SECONDS", "2"))
 
+# 업로드 인코딩 (wav / flac / opus) - flac, opus는 soundfile 필요
+UPLOAD_CODEC = os.getenv("UPLOAD_CODEC", "wav")
+UPLOAD_OPUS_COMPRESSION = float(os.getenv("UPLOAD_OPUS_COMPRESSION", "0.85"))  # 0.0(고음질) ~ 1.0(고압축), 0.85 ≈ 40kbps
+
 # OpenAI 설정
 ASR_MODEL = "whisper-1"
 LLM_MODEL = "gpt-4o-mini"
+LLM_STREAMING = os.getenv("LLM_STREAMING", "1") == "1"  # [[추측]] 토큰이 나오면 즉시 판정
+GUESS_TOP_K = max(1, int(os.getenv("GUESS_TOP_K", "1")))  # 한 번에 받을 순위별 추측 후보 수 (1이면 단일 추측)
+LLM_MAX_OUTPUT_TOKENS = int(os.getenv("LLM_MAX_OUTPUT_TOKENS", "80"))  # 추측 응답 길이 상한
+PROMPT_HISTORY_TOKEN_BUDGET = int(os.getenv("PROMPT_HISTORY_TOKEN_BUDGET", "200"))  # 설명 히스토리 토큰 예산
+PROMPT_HISTORY_MAX_ITEMS = int(os.getenv("PROMPT_HISTORY_MAX_ITEMS", "6"))  # 포함할 최근 설명 최대 개수
+
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None  # 예: 로컬 대역 서버 http://127.0.0.1:8765/v1
+
+# API 호출 보호: 요청 타임아웃, 턴 마감 시간, 재시도, 서킷 브레이커
+OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "3"))  # 초
+OPENAI_READ_TIMEOUT = float(os.getenv("OPENAI_READ_TIMEOUT", "10"))  # 초 (요청 한 번의 상한)
+TURN_DEADLINE_SECONDS = float(os.getenv("TURN_DEADLINE_SECONDS", "15"))  # ASR + 추측 전체 상한
+API_MAX_ATTEMPTS = int(os.getenv("API_MAX_ATTEMPTS", "3"))  # 첫 시도 포함
+API_RETRY_BASE_DELAY = float(os.getenv("API_RETRY_BASE_DELAY", "0.25"))  # 초 (지수 백오프 시작값)
+API_RETRY_MAX_DELAY = float(os.getenv("API_RETRY_MAX_DELAY", "2.0"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "3"))  # 연속 실패 횟수
+BREAKER_RESET_SECONDS = float(os.getenv("BREAKER_RESET_SECONDS", "30"))  # 서킷이 열려 있는 시간
+HTTP_KEEPALIVE_SECONDS = float(os.getenv("HTTP_KEEPALIVE_SECONDS", "120"))  # 유휴 연결 유지 시간
+HTTP_WARM_IDLE_SECONDS = float(os.getenv("HTTP_WARM_IDLE_SECONDS", "30"))  # 이만큼 쉬었으면 녹음 시작 시 재예열
+
+# 추측 백엔드: remote(OpenAI) / local(오프라인 추측기) / fallback(원격 우선, 느리거나 실패하면 로컬)
+GUESS_BACKEND = os.getenv("GUESS_BACKEND", "remote")
+LOCAL_GUESS_LATENCY_BUDGET = float(os.getenv("LOCAL_GUESS_LATENCY_BUDGET", "3.0"))  # fallback 대기 한도 (초)
+LOCAL_GUESS_DIM = int(os.getenv("LOCAL_GUESS_DIM", "4096"))  # n-gram 해시 특징 차원
+LOCAL_GUESS_MIN_SCORE = float(os.getenv("LOCAL_GUESS_MIN_SCORE", "0.08"))  # 이보다 낮으면 추측하지 않음
+LOCAL_GUESS_TARGET_WEIGHT = float(os.getenv("LOCAL_GUESS_TARGET_WEIGHT", "0.5"))
+# 로컬 추측기가 색인할 최대 항목 수 (색인은 항목당 LOCAL_GUESS_DIM float32 행 - 큰 뱅크는 이번 게임 항목 + 무작위 일부만)
+LOCAL_GUESS_MAX_ENTRIES = int(os.getenv("LOCAL_GUESS_MAX_ENTRIES", "2000"))
+
+# 추측 응답 캐시 (같은 설명이면 API 호출 생략)
+GUESS_CACHE_ENABLED = os.getenv("GUESS_CACHE_ENABLED", "1") == "1"
+GUESS_CACHE_SIZE = int(os.getenv("GUESS_CACHE_SIZE", "512"))  # 메모리 LRU 항목 수
+GUESS_CACHE_TTL = float(os.getenv("GUESS_CACHE_TTL", "604800"))  # 초 (기본 7일)
+GUESS_CACHE_PATH = os.getenv("GUESS_CACHE_PATH", "")  # SQLite 파일 경로 (비우면 디스크 캐시 안 씀)
+
+# 음성 인식 결과 캐시 (같은 오디오 바이트는 다시 업로드하지 않음)
+ASR_CACHE_ENABLED = os.getenv("ASR_CACHE_ENABLED", "1") == "1"
+ASR_CACHE_SIZE = int(os.getenv("ASR_CACHE_SIZE", "256"))  # 메모리 항목 수
+ASR_CACHE_DISK_SIZE = int(os.getenv("ASR_CACHE_DISK_SIZE", "5000"))  # 디스크 항목 수
+ASR_CACHE_PATH = os.getenv("ASR_CACHE_PATH", "")  # SQLite 파일 경로 (비우면 디스크 캐시 안 씀)
+
+# 음성 인식 백엔드: remote(OpenAI Whisper) / local(faster-whisper CPU, pip install faster-whisper)
+ASR_BACKEND = os.getenv("ASR_BACKEND", "remote")
+LOCAL_ASR_MODEL = os.getenv("LOCAL_ASR_MODEL", "small")  # tiny / base / small / medium
+LOCAL_ASR_COMPUTE_TYPE = os.getenv("LOCAL_ASR_COMPUTE_TYPE", "int8")  # CPU에서는 int8 양자화가 가장 빠름
+LOCAL_ASR_THREADS = int(os.getenv("LOCAL_ASR_THREADS", "4"))
+LOCAL_ASR_TIMEOUT = float(os.getenv("LOCAL_ASR_TIMEOUT", "30"))  # 모델 로딩 대기 포함 (초)
+
+# 헤지 요청: off / dual(로컬+원격 동시) / delayed(주 백엔드가 늦으면 원격에 한 번 더)
+ASR_HEDGE_MODE = os.getenv("ASR_HEDGE_MODE", "off")
+ASR_HEDGE_DELAY = os.getenv("ASR_HEDGE_DELAY", "auto")  # 초, auto면 주 백엔드의 관측 p95
+
+# 디버그: 단계별 지연 시간 오버레이(F3로 토글)와 통계 파일 (.prom이면 Prometheus 텍스트, 그 외 JSON)
+DEBUG_OVERLAY = os.getenv("DEBUG_OVERLAY", "0") == "1"
+METRICS_EXPORT_PATH = os.getenv("METRICS_EXPORT_PATH", "")  # 비우면 저장하지 않음
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING").upper()  # 턴별 상세 기록(인식 결과 등)은 DEBUG
+SESSION_RECORD_DIR = os.getenv("SESSION_RECORD_DIR", "")  # 세션 녹화 디렉터리 (비우면 녹화하지 않음)
+
+# 퍼지 매칭: 정확히 일치하는 단어가 없을 때 편집 거리로 잘못 인식된 목표어/금지어/추측 후보 판정
+FUZZY_MATCH_ENABLED = os.getenv("FUZZY_MATCH_ENABLED", "1") == "1"
+FUZZY_UNIT = os.getenv("FUZZY_UNIT", "jamo")  # jamo(자모 단위) / syllable(음절 단위)
+FUZZY_MAX_RATIO = float(os.getenv("FUZZY_MAX_RATIO", "0.15"))  # 단어 길이 대비 허용 편집 수 (내림)
+FUZZY_MIN_LENGTH = int(os.getenv("FUZZY_MIN_LENGTH", "6"))  # 이보다 짧은 단어는 정확 일치만 (unit 기준 길이)
 
 # 콘텐츠 소스
-TABOO_JSON_PATH = os.getenv("TABOO_JSON", "taboo_bank.json")
+TABOO_JSON_PATH = os.getenv("TABOO_JSON", "taboo_bank.json")  # JSON 또는 bank_binary.py로 변환한 바이너리 뱅크(.tbk)
 ROUNDS_PER_SESSION = int(os.getenv("ROUNDS", "12"))
 
 # 내장 fallback 데이터 (JSON 파일이 없을 때)
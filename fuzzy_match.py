@@ -0,0 +1,104 @@
+"""
+비트 병렬 퍼지 매칭 (Myers 편집 거리, 여러 패턴을 NumPy로 한꺼번에)
+
+Whisper가 목표어의 한 음절을 잘못 듣는 경우("스마트폰" → "스마트펀") 정확한 부분 문자열 검사는
+놓친다. 단어마다 비트 벡터(64비트 레인 하나)를 두고 텍스트를 한 글자씩 읽으며
+모든 패턴의 편집 거리를 동시에 갱신하므로, 라운드 단어 몇 개든 뱅크 전체 수백 개든 한 번의 스캔이다.
+
+- search 모드: 텍스트의 어느 부분 문자열과든 가장 가까운 거리 (위반 검사)
+- global 모드: 텍스트 전체와의 거리 (추측 후보 비교)
+
+단위는 음절 또는 자모(text_normalize.to_jamo) - 자모 단위면 "폰"→"펀" 같은 모음 하나 차이가 1이다.
+64글자를 넘는 패턴은 퍼지 매칭에서 제외된다 (정확 일치 검사는 그대로).
+"""
+from typing import List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+MAX_PATTERN_LENGTH = 64
+NO_MATCH = np.iinfo(np.int64).max
+_ONE = np.uint64(1)
+
+
+class FuzzyHit(NamedTuple):
+    """퍼지 일치 하나"""
+    index: int  # 패턴 번호
+    distance: int  # 편집 거리
+    end: int  # search 모드에서 가장 가까운 부분 문자열의 끝 위치 (텍스트 기준, global이면 -1)
+
+
+def max_edits(lengths: np.ndarray, max_ratio: float, min_length: int) -> np.ndarray:
+    """패턴 길이별 허용 편집 수 (길이 * max_ratio 내림, min_length보다 짧으면 -1 = 퍼지 매칭 안 함)"""
+    k = np.floor(lengths * max_ratio).astype(np.int64)
+    return np.where(lengths >= min_length, k, -1)
+
+
+class FuzzyMatcher:
+    """여러 패턴의 Myers 비트 병렬 편집 거리 (생성 후 불변)"""
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns = list(patterns)
+        n = len(self.patterns)
+        self.lengths = np.array([len(p) for p in self.patterns], dtype=np.int64)
+        usable = (self.lengths > 0) & (self.lengths <= MAX_PATTERN_LENGTH)
+        self.usable = usable
+        # 문자별 일치 비트 (Peq): 행 = 알파벳 문자, 열 = 패턴. 마지막 행은 패턴에 없는 문자(0)
+        self._alphabet = {}
+        rows: List[np.ndarray] = []
+        for i, pattern in enumerate(self.patterns):
+            if not usable[i]:
+                continue
+            for bit, ch in enumerate(pattern):
+                row = self._alphabet.get(ch)
+                if row is None:
+                    row = self._alphabet[ch] = len(rows)
+                    rows.append(np.zeros(n, dtype=np.uint64))
+                rows[row][i] |= _ONE << np.uint64(bit)
+        rows.append(np.zeros(n, dtype=np.uint64))
+        self._peq = np.stack(rows)
+        self._unknown = len(rows) - 1
+        self._high = np.where(usable, _ONE << (np.maximum(self.lengths, 1) - 1).astype(np.uint64),
+                              np.uint64(0))
+
+    def distances(self, text: str, search: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """패턴별 (편집 거리, 끝 위치) - 퍼지 매칭할 수 없는 패턴은 거리 NO_MATCH"""
+        n = len(self.patterns)
+        pv = np.full(n, np.iinfo(np.uint64).max, dtype=np.uint64)
+        mv = np.zeros(n, dtype=np.uint64)
+        score = self.lengths.copy()
+        best = score.copy()
+        end = np.full(n, -1, dtype=np.int64)
+        high = self._high
+        alphabet, unknown, peq = self._alphabet, self._unknown, self._peq
+        for pos, ch in enumerate(text):
+            eq = peq[alphabet.get(ch, unknown)]
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq  # 덧셈 자리올림이 64비트를 넘으면 버려진다 (의도된 동작)
+            ph = mv | ~(xh | pv)
+            mh = pv & xh
+            score += (ph & high) != 0
+            score -= (mh & high) != 0
+            ph <<= _ONE
+            mh <<= _ONE
+            if not search:
+                ph |= _ONE  # 전체 비교: 첫 행 D[0][j] = j
+            pv = mh | ~(xv | ph)
+            mv = ph & xv
+            if search:
+                better = score < best
+                best[better] = score[better]
+                end[better] = pos + 1
+        result = best if search else score
+        return np.where(self.usable, result, NO_MATCH), end
+
+    def matches(self, text: str, max_ratio: float, min_length: int, search: bool = True) -> List[FuzzyHit]:
+        """허용 편집 수 안에 들어온 패턴 (패턴 순서)"""
+        dist, end = self.distances(text, search)
+        k = max_edits(self.lengths, max_ratio, min_length)
+        idx = np.flatnonzero(dist <= k)
+        return [FuzzyHit(int(i), int(dist[i]), int(end[i])) for i in idx]
+
+
+def edit_distance(a: str, b: str) -> int:
+    """두 문자열의 편집 거리 (b가 64글자를 넘으면 NO_MATCH)"""
+    return int(FuzzyMatcher([b]).distances(a, search=False)[0][0])
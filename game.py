@@ -1,24 +1,35 @@
 """
 Voice Taboo 게임 핵심 로직
 """
+import logging
 import math
-import random
 import time
 import os
 from typing import Optional
 
 import pygame
-import numpy as np
-import sounddevice as sd
 
 from config import (
     WINDOW_W, WINDOW_H, BG_COLOR, FG_COLOR, ACCENT, MUTED, GOOD, BAD, WARN,
     FONT_NAME, TIME_ATTACK_SECONDS, SPEED_RUN_TARGET_COUNT, SKIP_PENALTY_SECONDS,
-    SAMPLE_RATE, CHANNELS, ROUNDS_PER_SESSION, RECORD_SECONDS
+    SAMPLE_RATE, ROUNDS_PER_SESSION, RECORD_SECONDS, VAD_ENABLED, TURN_DEADLINE_SECONDS,
+    GUESS_TOP_K, DEBUG_OVERLAY, METRICS_EXPORT_PATH, SESSION_RECORD_DIR
 )
-from models import RoundState
-from utils import load_taboo_bank, record_block, save_wav_from_array, check_violations, extract_guess_token, start_recording, stop_recording_and_get_audio, audio_array_to_wav_bytes
-from openai_helper import OpenAIHelper
+from models import RoundState, TurnOutcome
+from utils import record_block, save_wav_from_array, check_violations, extract_guess_tokens, guess_matches, start_recording, stop_recording_and_get_audio
+from openai_helper import get_openai_helper
+from audio_capture import get_capture_service
+from vad import detect_speech
+from audio_clip import AudioClip
+from turn_pipeline import TurnPipeline, TurnContext, TurnResult, TurnCancelled
+from resilience import Deadline
+from metrics import REGISTRY, count, span
+from session_recorder import SessionRecorder
+from matcher import ViolationMatcher
+from bank_store import get_bank_store
+from text_normalize import MatchKey, contains_key, match_text
+
+log = logging.getLogger(__name__)
 
 
 class Game:
@@ -27,9 +38,17 @@ class Game:
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
         self._init_fonts()
-        self.client = OpenAIHelper()
+        self.client = get_openai_helper()  # 프로세스 전역 (연결 풀/캐시를 게임 사이에 재사용)
         self.time_mode = "TIME_ATTACK"  # or "SPEED_RUN"
         self.player_name = "PLAYER"  # 기본 플레이어 이름
+        self.pipeline = TurnPipeline()
+        self.capture = get_capture_service()  # 입력 스트림은 프로세스당 한 번만 연다
+        self.pending_turn_id: Optional[int] = None
+        self.show_metrics = DEBUG_OVERLAY  # F3로 단계별 지연 시간 오버레이 토글
+        self.last_turn_timings: dict = {}
+        self._metrics_font = None
+        self.recorder: Optional[SessionRecorder] = None  # SESSION_RECORD_DIR이 있으면 start()에서 생성
+        self._pending_record: Optional[tuple] = None  # 결과를 기다리는 턴의 (오디오 위치, 라운드 정보)
         self.reset_session()
 
     def _init_fonts(self):
@@ -49,10 +68,10 @@ class Game:
                 self.small = pygame.font.SysFont(None, 22)
 
     def reset_session(self):
-        """게임 세션 초기화"""
-        bank = load_taboo_bank("taboo_bank.json")
-        k = min(ROUNDS_PER_SESSION, len(bank))
-        self.items = random.sample(bank, k=k)
+        """게임 세션 초기화 (뱅크는 프로세스 전역 저장소에서 - 파일이 바뀌었을 때만 다시 읽음)"""
+        self._cancel_pending_turn()
+        self.items = get_bank_store().sample(ROUNDS_PER_SESSION)
+        self.client.set_session_entries(self.items)  # 큰 뱅크에서도 로컬 추측기가 이번 게임 단어를 알도록
         
         self.idx = 0
         self.round: Optional[RoundState] = None
@@ -62,6 +81,8 @@ class Game:
         self.finished = False
         self.solved_count = 0
         self.skips = 0
+        # top-k 추측 효과 측정: 해결한 라운드 수, 그 라운드들의 턴 수 합, 2순위 이하 후보로 맞힌 횟수
+        self.guess_stats = {"solved_rounds": 0, "solved_turns": 0, "lower_rank_hits": 0}
         
         # 시간 동결 관리 변수들
         self.time_frozen = False
@@ -70,13 +91,22 @@ class Game:
         
         # 녹음 상태 추가
         self.is_recording = False
-        self.recording_stream = None
         self.recording_start_time = 0.0
-        self._rec_frames = []  # 실시간 녹음 프레임 버퍼
 
     def start(self):
-        """게임 시작"""
-        self.reset_session()
+        """게임 시작 (이미 진행한 세션이면 새 단어로 초기화 - 생성 직후에는 __init__에서 뽑은 단어 사용)"""
+        if self.start_ts is not None:
+            self.reset_session()
+        if SESSION_RECORD_DIR:
+            self._close_recorder()
+            try:
+                self.recorder = SessionRecorder.create(SESSION_RECORD_DIR, {
+                    "mode": self.time_mode, "player": self.player_name, "sample_rate": SAMPLE_RATE,
+                    "vad": VAD_ENABLED, "top_k": GUESS_TOP_K,
+                })
+                print(f"세션 녹화: {self.recorder.path}")
+            except OSError as e:
+                print(f"세션 녹화 시작 실패: {e}")
         self.start_ts = time.perf_counter()
         self.round = self._next_round()
 
@@ -84,9 +114,9 @@ class Game:
         """다음 라운드로 진행"""
         if self.idx >= len(self.items):
             return None
-        item = self.items[self.idx]
+        entry = self.items[self.idx]
         self.idx += 1
-        return RoundState(target=item["target"], forbidden=item["forbidden"])
+        return RoundState(target=entry.target, forbidden=list(entry.forbidden), keys=entry.keys)
 
     def _time_left(self) -> float:
         """남은 시간 계산"""
@@ -122,6 +152,8 @@ class Game:
             self.skip_word()
         elif key == pygame.K_F11:
             pygame.display.toggle_fullscreen()
+        elif key == pygame.K_F3:
+            self.show_metrics = not self.show_metrics
     
     def handle_key_up(self, key):
         """키를 뗄 때 처리 (SPACE 키를 떼면 녹음 중지)"""
@@ -129,193 +161,285 @@ class Game:
             self.stop_recording_and_process()
 
     def start_recording(self):
-        """녹음 시작 - 실시간 스트림으로 즉시 시작"""
-        if not self.round or self.is_recording:
+        """녹음 시작 - 상시 열린 스트림에서 구간 시작만 표시"""
+        if not self.round or self.is_recording or self.is_thinking:
             return
         
-        try:
-            self.is_recording = True
-            self._rec_frames = []  # 프레임 버퍼 초기화
-            self.recording_start_time = time.perf_counter()
-            
-            # 실시간 입력 스트림으로 키를 누른 순간부터 녹음
-            def audio_callback(indata, frames, time_info, status):
-                if status:
-                    print(f"오디오 상태: {status}")
-                self._rec_frames.append(indata.copy())
-            
-            self.recording_stream = sd.InputStream(
-                samplerate=SAMPLE_RATE,
-                channels=CHANNELS,
-                dtype='float32',
-                callback=audio_callback,
-                device=None  # 테스트에서 성공한 기본 디바이스
-            )
-            self.recording_stream.start()
-            print("녹음 시작...")
-            
-        except Exception as e:
-            print(f"녹음 시작 실패: {e}")
-            self.is_recording = False
+        if not self.capture.mark_start():
+            log.warning("녹음 시작 실패: 입력 스트림을 열 수 없습니다.")
+            count("record_start_failed")
+            return
+        self.is_recording = True
+        self.recording_start_time = time.perf_counter()
+        log.debug("녹음 시작")
+        # 오래 쉬었다면 말하는 동안 API 연결을 미리 다시 열어 둔다
+        self.client.warm_up_async()
 
     def stop_recording_and_process(self):
-        """녹음 중지 및 누적된 프레임 처리"""
-        if not self.is_recording or not self.recording_stream:
+        """녹음 구간 종료 표시 후 처리"""
+        if not self.is_recording:
             return
         
         try:
-            # 스트림 중지
-            self.recording_stream.stop()
-            self.recording_stream.close()
-            self.recording_stream = None
+            # 구간 종료 (스트림은 계속 열려 있음)
+            started_at = time.perf_counter()
+            timings: dict = {}
+            with span("capture_stop", timings):
+                audio = self.capture.mark_end()
             self.is_recording = False
             
-            duration = time.perf_counter() - self.recording_start_time
-            print(f"녹음 종료 (시간: {duration:.1f}초)")
+            duration = started_at - self.recording_start_time
             
             # 최소 녹음 시간 체크
             if duration < 0.5:
-                print("녹음 시간이 너무 짧습니다.")
+                log.debug("녹음 시간이 너무 짧습니다 (%.2f초)", duration)
+                count("record_too_short")
                 return
             
-            # 누적된 프레임들을 하나로 합치기
-            if not self._rec_frames:
-                print("수집된 오디오가 없습니다.")
+            if audio.size == 0:
+                log.warning("수집된 오디오가 없습니다.")
+                count("record_empty")
                 return
-                
-            audio = np.concatenate(self._rec_frames, axis=0).reshape(-1)
             
-            # 오디오 품질 확인
-            audio_level = float(np.max(np.abs(audio)))
-            audio_rms = float(np.sqrt(np.mean(audio**2)))
-            print(f"캡처된 오디오 - 최대: {audio_level:.4f}, RMS: {audio_rms:.4f}")
-            
-            # 음성 처리
-            self.process_audio(audio)
+            # 음성 처리 (백그라운드 파이프라인, 통계는 클립에 보관되어 인코딩 단계에서 재사용)
+            self._submit_turn(AudioClip(audio), started_at, timings)
             
         except Exception as e:
-            print(f"녹음 처리 실패: {e}")
+            log.warning("녹음 처리 실패: %s", e)
             self.is_recording = False
-            if self.recording_stream:
-                try:
-                    self.recording_stream.stop()
-                    self.recording_stream.close()
-                except:
-                    pass
-                self.recording_stream = None
 
-    def process_audio(self, audio: np.ndarray):
-        """녹음된 오디오를 처리하여 게임 로직 실행 (파일 저장 없이)"""
+    def _submit_turn(self, clip: AudioClip, started_at: Optional[float] = None, timings: Optional[dict] = None):
+        """녹음된 오디오를 백그라운드 파이프라인에 넘긴다 (메인 루프는 계속 렌더링)"""
         if not self.round:
             return
         
-        print("오디오 처리 시작...")
-        
         # 시간 동결 시작 (음성 인식 및 AI 처리 중)
         self.freeze_time()
         
-        # 1) 오디오를 바이너리 데이터로 변환 (파일 저장 없음)
+        # 워커에서는 라운드 상태를 직접 건드리지 않도록 스냅샷을 전달
+        target = self.round.target
+        forbidden = list(self.round.forbidden)
+        history = list(self.round.description_history)
+        matcher = self.round.matcher  # 불변 객체라 워커와 공유해도 안전
+        started_at = started_at if started_at is not None else time.perf_counter()
+        self._begin_record(clip, target, forbidden, history)
+        self.pending_turn_id = self.pipeline.submit(
+            self.idx,
+            lambda ctx: self._run_turn(clip, target, forbidden, history, ctx, started_at, timings, matcher),
+        )
+
+    def process_audio(self, audio):
+        """녹음된 오디오(np.ndarray 또는 AudioClip)를 동기적으로 처리하고 TurnOutcome 반환 (리플레이/디버깅용)"""
+        if not self.round:
+            return
+        
+        clip = audio if isinstance(audio, AudioClip) else AudioClip(audio)
+        self.freeze_time()
+        target, forbidden, history = self.round.target, list(self.round.forbidden), list(self.round.description_history)
+        self._begin_record(clip, target, forbidden, history)
+        outcome = self._run_turn(clip, target, forbidden, history, started_at=time.perf_counter(),
+                                 matcher=self.round.matcher)
+        self._apply_turn_outcome(outcome)
+        return outcome
+
+    def _run_turn(self, clip: AudioClip, target: str, forbidden: list, history: list,
+                  ctx: Optional[TurnContext] = None, started_at: Optional[float] = None,
+                  timings: Optional[dict] = None, matcher: Optional[ViolationMatcher] = None) -> TurnOutcome:
+        """오디오 → ASR → 위반 검사 → AI 추측 (게임 상태를 변경하지 않음, 워커 스레드에서 실행 가능)
+        단계별 소요 시간은 metrics 히스토그램과 outcome.timings에 기록된다."""
+        outcome = TurnOutcome(timings=timings if timings is not None else {}, started_at=started_at)
+        t = outcome.timings
+        if started_at is not None and ctx is not None:
+            wait = time.perf_counter() - started_at - sum(t.values())
+            REGISTRY.observe("queue_wait", wait)
+            t["queue_wait"] = wait
+        deadline = Deadline(TURN_DEADLINE_SECONDS)  # ASR + 추측 전체가 이 시간 안에 끝나야 함
+        
+        # 0) 무음 제거 - 말소리가 없으면 업로드하지 않음
+        if VAD_ENABLED:
+            with span("vad", t):
+                vad = detect_speech(clip.samples, clip.sample_rate)
+            if not vad.is_speech:
+                log.debug("VAD: 음성 없음 (%.2f초 클립 폐기)", vad.original_seconds)
+                count("vad_no_speech")
+                outcome.error_feedback = "음성이 감지되지 않았습니다. 더 크게 말해주세요."
+                return outcome
+            REGISTRY.observe("vad_trimmed_seconds", vad.trimmed_seconds)
+            clip = clip.slice(vad.start, vad.end)
+        
+        # 1) 오디오를 업로드용으로 인코딩 (파일 저장 없음, 코덱은 config.UPLOAD_CODEC)
         try:
-            wav_data = audio_array_to_wav_bytes(audio)
+            with span("encode", t):
+                encoded = clip.encoded()
+            if ctx:
+                ctx.check()
             
             # 2) ASR (음성 인식) - 바이너리 데이터 직접 전송
-            text = self.client.transcribe_audio_data(wav_data)
+            with span("asr", t):
+                text = self.client.transcribe_audio_data(encoded.data, encoded.filename, deadline=deadline)
             
+        except TurnCancelled:
+            raise
         except Exception as e:
-            print(f"바이너리 방식 실패: {e}, 파일 방식으로 재시도...")
+            log.warning("바이너리 방식 실패: %s, 파일 방식으로 재시도", e)
+            count("asr_file_fallback")
             # Fallback: 파일 저장 방식
             try:
                 tmp = f"_tmp_{int(time.time()*1000)}.wav"
-                save_wav_from_array(tmp, audio)
+                save_wav_from_array(tmp, clip.samples)
                 text = self.client.transcribe(tmp)
                 try:
                     os.remove(tmp)
                 except:
                     pass
             except Exception as e2:
-                self.round.feedback = f"음성 처리 완전 실패: {e2}"
-                # 시간 동결 해제
-                self.unfreeze_time()
-                return
+                outcome.error_feedback = f"음성 처리 완전 실패: {e2}"
+                return outcome
         
-        print(f"최종 음성 인식 결과: '{text}'")
+        log.debug("최종 음성 인식 결과: %r", text)
         
-        self.round.last_transcription = text
+        outcome.text = text
         if text.startswith("__error__"):
-            self.round.feedback = "음성 인식 오류. 다시 시도해주세요."
-            # 시간 동결 해제
-            self.unfreeze_time()
-            return
+            outcome.error_feedback = "음성 인식 오류. 다시 시도해주세요."
+            return outcome
         
         if not text or text.strip() == "":
-            self.round.feedback = "음성이 인식되지 않았습니다. 더 명확하게 말해주세요."
-            # 시간 동결 해제
-            self.unfreeze_time()
-            return
+            outcome.error_feedback = "음성이 인식되지 않았습니다. 더 명확하게 말해주세요."
+            return outcome
 
         # 3) 위반 검사 (금지어 + 목표어)
-        forbidden_violation, target_violation = check_violations(
-            text, self.round.target, self.round.forbidden
-        )
+        with span("violation_check", t):
+            forbidden_violation, target_violation = check_violations(text, target, forbidden, matcher)
+        if target_violation or forbidden_violation:
+            outcome.target_violation = target_violation
+            outcome.forbidden_violation = forbidden_violation
+            return outcome
+
+        if ctx:
+            ctx.check()
+
+        # 4) 설명 누적 → AI 추측 요청
+        clean = text.strip()
+        if clean:
+            history = history + [clean]
+        
+        # 스트리밍 중인 응답은 메인 루프로 전달해 바로 화면에 표시 (턴이 취소되면 스트림 중단)
+        with span("llm", t):
+            reply = self.client.ask_guess(history, on_partial=ctx.report if ctx else None, deadline=deadline)
+        if ctx:
+            ctx.check()
+        outcome.ai_reply = reply
+        with span("guess_parse", t):
+            outcome.success = self._judge_guess(outcome, reply, target, matcher)
+        return outcome
+
+    def _judge_guess(self, outcome: TurnOutcome, reply: str, target: str,
+                     matcher: Optional[ViolationMatcher] = None) -> bool:
+        """AI 응답에서 추측 후보를 꺼내 목표어와 비교 (outcome.ai_guess/ai_guesses/guess_rank 채움)
+        matcher가 있으면 라운드에서 미리 계산한 목표어 정규화 형태를 사용"""
+        guesses = extract_guess_tokens(reply, GUESS_TOP_K)
+        outcome.ai_guesses = guesses
+
+        # 5) 성공 판정 (NFKC/공백/문장부호/조사 차이는 정규화로 흡수)
+        key = matcher.keys.target if matcher is not None else MatchKey.of(target)
+        success = False
         
-        if target_violation:
+        # 순위별 추측 후보 중 하나라도 목표어와 일치하면 정답 (정확히 일치 또는 정규화 후 일치)
+        for rank, guess in enumerate(guesses):
+            if guess_matches(guess, target, key):
+                success = True
+                outcome.guess_rank = rank
+                break
+        if guesses:
+            outcome.ai_guess = guesses[outcome.guess_rank or 0]
+        
+        # AI 응답 본문에 목표어가 포함되었는지 확인 (정규화한 응답의 부분 문자열)
+        if not success and contains_key(match_text(reply), key):
+            success = True
+
+        return success
+
+    def _apply_turn_outcome(self, outcome: TurnOutcome):
+        """턴 처리 결과를 현재 라운드에 반영하고 턴 전체 소요 시간 기록 (메인 스레드에서만 호출)"""
+        with span("state_update", outcome.timings):
+            self._update_round(outcome)
+        if outcome.started_at is not None:
+            total = time.perf_counter() - outcome.started_at
+            REGISTRY.observe("turn_total", total)
+            outcome.timings["turn_total"] = total
+        self.last_turn_timings = outcome.timings
+        self._finish_record(outcome)
+
+    def _begin_record(self, clip: AudioClip, target: str, forbidden: list, history: list):
+        """세션 녹화 중이면 원본 오디오를 아카이브에 추가 (턴 결과는 _finish_record에서 기록)"""
+        if self.recorder is None:
+            return
+        self._finish_record(status="cancelled")  # 결과 없이 끝난 이전 턴
+        try:
+            ref = self.recorder.add_audio(clip.samples, clip.sample_rate)
+        except OSError as e:
+            log.warning("세션 녹화 실패: %s", e)
+            return
+        self._pending_record = (ref, {"round": self.idx, "target": target, "forbidden": forbidden,
+                                      "history": history})
+
+    def _finish_record(self, outcome: Optional[TurnOutcome] = None, status: str = "ok",
+                       error: Optional[str] = None):
+        """대기 중인 턴 기록 완료 (status: ok / error / cancelled)"""
+        if self.recorder is None or self._pending_record is None:
+            return
+        ref, round_info = self._pending_record
+        self._pending_record = None
+        try:
+            self.recorder.record_turn(ref, round_info, outcome, status, error)
+        except OSError as e:
+            log.warning("세션 녹화 실패: %s", e)
+
+    def _close_recorder(self):
+        if self.recorder is not None:
+            self._finish_record(status="cancelled")
+            self.recorder.close()
+            self.recorder = None
+
+    def _update_round(self, outcome: TurnOutcome):
+        """턴 처리 결과에 따라 라운드 상태 변경"""
+        # AI 처리 완료 후 시간 동결 해제
+        self.unfreeze_time()
+        if not self.round:
+            return
+        
+        if outcome.text:
+            self.round.last_transcription = outcome.text
+        if outcome.error_feedback:
+            self.round.feedback = outcome.error_feedback
+            return
+        
+        if outcome.target_violation:
             self.round.target_violation = True
             self.round.feedback = "목표어를 말했습니다! 라운드 실패"
-            # 시간 동결 해제
-            self.unfreeze_time()
             # 다음 라운드로
             self.round = self._next_round()
             if self.round is None:
                 self.finished = True
             return
         
-        if forbidden_violation:
-            self.round.taboo_violation = forbidden_violation
-            self.round.feedback = f"금지어 '{forbidden_violation}' 사용! 라운드 실패"
-            # 시간 동결 해제
-            self.unfreeze_time()
+        if outcome.forbidden_violation:
+            self.round.taboo_violation = outcome.forbidden_violation
+            self.round.feedback = f"금지어 '{outcome.forbidden_violation}' 사용! 라운드 실패"
             # 다음 라운드로
             self.round = self._next_round()
             if self.round is None:
                 self.finished = True
             return
 
-        # 4) 설명 누적 → AI 추측 요청
-        clean = text.strip()
+        clean = outcome.text.strip()
         if clean:
             self.round.description_history.append(clean)
-        
-        reply = self.client.ask_guess(self.round.description_history)
-        self.round.ai_reply = reply
-        guess = extract_guess_token(reply)
-        self.round.ai_guess = guess or None
-
-        # 5) 성공 판정 (한글 지원 강화)
-        target_original = self.round.target
-        target_lower = target_original.lower()
-        success = False
-        
-        # 추측 토큰으로 판정 (대소문자 무시)
-        if guess:
-            guess_lower = guess.lower()
-            if guess_lower == target_lower or guess == target_original:
-                success = True
-        
-        # AI 응답에 목표어가 포함되었는지 확인 (더 정확한 매칭)
-        if not success:
-            reply_lower = reply.lower()
-            # 정확한 단어 매칭 (공백으로 구분된 토큰 기준)
-            reply_tokens = reply_lower.split()
-            if target_lower in reply_tokens or target_original in reply.split():
-                success = True
-            # 한글의 경우 서브스트링으로도 확인
-            elif target_lower in reply_lower:
-                success = True
-
-        # AI 처리 완료 후 시간 동결 해제
-        self.unfreeze_time()
+        self.round.ai_reply = outcome.ai_reply
+        self.round.ai_guess = outcome.ai_guess
 
-        if success:
+        if outcome.success:
+            self._record_guess_stats(outcome)
             self.round.solved = True
             self.score += 1
             self.solved_count += 1
@@ -330,8 +454,77 @@ class Game:
         else:
             self.round.feedback = "더 설명해주세요! (금지어와 목표어는 피해서)"
 
+    def _record_guess_stats(self, outcome: TurnOutcome):
+        """해결한 라운드의 턴 수와 정답 후보 순위 기록"""
+        self.guess_stats["solved_rounds"] += 1
+        self.guess_stats["solved_turns"] += len(self.round.description_history)
+        if outcome.guess_rank:
+            # 1순위만 받았다면 최소 한 번 더 설명해야 했던 라운드
+            self.guess_stats["lower_rank_hits"] += 1
+
+    def guess_summary(self) -> str:
+        """top-k 추측 통계 요약 (라운드당 턴 수, 절약한 턴 수)"""
+        s = self.guess_stats
+        if not s["solved_rounds"]:
+            return f"추측 통계(top-{GUESS_TOP_K}): 해결한 라운드 없음"
+        return (f"추측 통계(top-{GUESS_TOP_K}): 해결 {s['solved_rounds']}라운드, "
+                f"라운드당 평균 {s['solved_turns'] / s['solved_rounds']:.2f}턴, "
+                f"2순위 이하 후보로 절약한 턴 최소 {s['lower_rank_hits']}회")
+
+    def _handle_turn_result(self, result: TurnResult):
+        """파이프라인에서 돌아온 결과 처리 (취소/이전 라운드의 결과는 버림)"""
+        if result.turn_id != self.pending_turn_id:
+            return
+        if result.partial:
+            # 스트리밍 중인 AI 응답을 바로 표시
+            if self.round:
+                self.round.ai_reply = result.value
+            return
+        self.pending_turn_id = None
+        
+        if result.cancelled:
+            self._finish_record(status="cancelled")
+            self.unfreeze_time()
+            return
+        if result.error is not None:
+            log.warning("턴 처리 실패: %s", result.error)
+            count("turn_failed")
+            self._finish_record(status="error", error=str(result.error))
+            self.unfreeze_time()
+            if self.round:
+                self.round.feedback = f"음성 처리 실패: {result.error}"
+            return
+        self._apply_turn_outcome(result.value)
+
+    def _cancel_pending_turn(self):
+        """진행 중인 턴 취소 (라운드가 바뀌면 결과를 적용하지 않음)"""
+        if self.pending_turn_id is None:
+            return
+        self.pipeline.cancel()
+        self.pending_turn_id = None
+        self._finish_record(status="cancelled")
+        self.unfreeze_time()
+
+    @property
+    def is_thinking(self) -> bool:
+        """ASR/AI 처리 대기 중인지 여부"""
+        return self.pending_turn_id is not None
+
+    def close(self):
+        """게임 종료 시 백그라운드 워커 정리"""
+        self._cancel_pending_turn()
+        self.pipeline.close()
+        self._close_recorder()
+        print(self.guess_summary())
+        if METRICS_EXPORT_PATH:
+            try:
+                REGISTRY.export(METRICS_EXPORT_PATH)
+            except OSError as e:
+                log.warning("지연 시간 통계 저장 실패: %s", e)
+
     def skip_word(self):
         """단어 스킵 (패널티 적용)"""
+        self._cancel_pending_turn()
         self.skips += 1
         if self.time_mode == "TIME_ATTACK" and self.start_ts is not None:
             self.start_ts -= SKIP_PENALTY_SECONDS
@@ -341,6 +534,10 @@ class Game:
 
     def update(self):
         """게임 상태 업데이트"""
+        # 백그라운드에서 끝난 턴 결과 반영
+        for result in self.pipeline.poll():
+            self._handle_turn_result(result)
+        
         if self.start_ts is not None:
             # 현재 동결 중이면 동결 시간을 추가로 계산
             current_frozen_time = self.total_frozen_time
@@ -536,6 +733,16 @@ class Game:
                 pygame.draw.circle(self.screen, (255, pulse // 2, pulse // 2), (wave_x + i * 25, wave_y), 4)
             
             draw_neon_text("Release SPACE to stop recording", self.small, WINDOW_W // 2, control_y + 50, (255, 200, 200), (100, 80, 80), center=True)
+        elif self.is_thinking:
+            # ASR/AI 처리 중 - 화면은 계속 갱신됨
+            t = time.perf_counter()
+            dots = "." * (int(t * 3) % 4)
+            think_bg = pygame.Rect(WINDOW_W // 2 - 150, control_y, 300, 60)
+            pygame.draw.rect(self.screen, (25, 0, 30), think_bg, border_radius=12)
+            draw_neon_rect(think_bg, (200, 100, 255), (80, 40, 100), 3)
+            
+            draw_neon_text(f"THINKING{dots}", self.font, WINDOW_W // 2, control_y + 15, (220, 150, 255), (80, 40, 100), center=True)
+            draw_neon_text("N to skip", self.small, WINDOW_W // 2, control_y + 40, (180, 150, 220), (60, 50, 80), center=True)
         else:
             # 간단한 상태 표시만 (키 설명 제거)
             status_bg = pygame.Rect(WINDOW_W // 2 - 150, control_y, 300, 60)
@@ -611,8 +818,29 @@ class Game:
             # 피드백 텍스트 (아래줄)
             draw_neon_text(self.round.feedback, self.small, WINDOW_W // 2, feedback_y + 25, feedback_color, feedback_glow, center=True)
 
+        if self.show_metrics:
+            self._draw_metrics_overlay()
+
         pygame.display.flip()
     
+    def _draw_metrics_overlay(self):
+        """디버그 오버레이: 단계별 지연 시간 (마지막 턴, p50/p95/p99, ms) + 응답 캐시 적중률"""
+        if self._metrics_font is None:
+            self._metrics_font = pygame.font.SysFont("consolas,dejavusansmono,couriernew,monospace", 14)
+        lines = REGISTRY.overlay_lines(self.last_turn_timings)
+        for cache in (self.client.guess_cache, self.client.asr_cache):
+            s = cache.stats()
+            if s["enabled"]:
+                lines.append(f"{s['name'] + ' cache':<16}{s['hit_rate']:7.0%} hit of {s['lookups']}")
+        line_h = self._metrics_font.get_linesize()
+        width = max(self._metrics_font.size(line)[0] for line in lines) + 16
+        panel = pygame.Surface((width, line_h * len(lines) + 12), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+        for i, line in enumerate(lines):
+            color = (0, 255, 255) if i == 0 else (220, 220, 220)
+            panel.blit(self._metrics_font.render(line, True, color), (8, 6 + i * line_h))
+        self.screen.blit(panel, (10, 10))
+
     def _draw_neon_game_over_screen(self):
         """네온 스타일 게임 오버 화면"""
         # 어두운 오버레이
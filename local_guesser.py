@@ -0,0 +1,99 @@
+"""
+오프라인 로컬 추측 엔진
+
+taboo 뱅크의 각 목표어를 (목표어 + 금지어) 문서로 보고 글자 n-gram TF-IDF 행렬로 색인한다.
+설명 히스토리도 같은 방식으로 벡터화한 뒤 행렬곱 한 번으로 모든 목표어와의
+코사인 유사도를 계산하고, 가장 가까운 목표어를 [[단어]] 형태로 답한다.
+네트워크가 느리거나 끊겼을 때 ask_guess 대신(또는 대체용으로) 사용한다.
+"""
+import zlib
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from bank_store import BankEntry
+from config import (
+    LOCAL_GUESS_DIM, LOCAL_GUESS_MIN_SCORE, LOCAL_GUESS_TARGET_WEIGHT, GUESS_TOP_K, PROMPT_HISTORY_MAX_ITEMS
+)
+
+
+def _ngrams(word: str) -> List[str]:
+    """단어 전체 + 경계 표시를 붙인 글자 2~3-gram (한글은 음절 단위)"""
+    w = f"<{word}>"
+    grams = [word]
+    for n in (2, 3):
+        grams.extend(w[i:i + n] for i in range(len(w) - n + 1))
+    return grams
+
+
+def _bucket(gram: str, dim: int) -> int:
+    """n-gram → 특징 인덱스 (프로세스 간에도 고정된 해시)"""
+    return zlib.crc32(gram.encode("utf-8")) % dim
+
+
+class LocalGuesser:
+    """뱅크 기반 TF-IDF 최근접 목표어 추측기"""
+
+    def __init__(self, bank: Sequence[BankEntry], dim: int = LOCAL_GUESS_DIM):
+        self.dim = dim
+        self.targets = [entry.target for entry in bank]
+
+        # (문서, 특징, 가중치) 목록을 모아 한 번에 행렬로 누적
+        rows, cols, weights = [], [], []
+        for doc, entry in enumerate(bank):
+            for word, weight in self._doc_words(entry):
+                for gram in _ngrams(word.lower()):
+                    rows.append(doc)
+                    cols.append(_bucket(gram, dim))
+                    weights.append(weight)
+        tf = np.zeros((len(bank), dim), dtype=np.float32)
+        np.add.at(tf, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)),
+                  np.array(weights, dtype=np.float32))
+
+        df = np.count_nonzero(tf, axis=0)
+        self.idf = (np.log((1.0 + len(bank)) / (1.0 + df)) + 1.0).astype(np.float32)
+        matrix = np.log1p(tf) * self.idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.matrix = matrix / norms
+
+    @staticmethod
+    def _doc_words(entry: BankEntry) -> Iterable[Tuple[str, float]]:
+        yield entry.target, LOCAL_GUESS_TARGET_WEIGHT
+        for w in entry.forbidden:
+            yield w, 1.0
+
+    def _query_vector(self, history: List[str]) -> np.ndarray:
+        q = np.zeros(self.dim, dtype=np.float32)
+        cols = [_bucket(g, self.dim) for text in history for tok in text.lower().split() for g in _ngrams(tok)]
+        if cols:
+            np.add.at(q, np.array(cols, dtype=np.intp), 1.0)
+        q = np.log1p(q) * self.idf
+        norm = np.linalg.norm(q)
+        return q / norm if norm > 0 else q
+
+    def scores(self, history: List[str]) -> np.ndarray:
+        """모든 목표어에 대한 코사인 유사도 (행렬-벡터 곱 한 번)"""
+        return self.matrix @ self._query_vector(history)
+
+    def top_guesses(self, history: List[str], k: int = 1) -> List[Tuple[str, float]]:
+        """유사도 상위 k개 목표어와 점수 (기준 점수 미만은 제외, 점수 내림차순)"""
+        if not self.targets:
+            return []
+        scores = self.scores(history[-max(1, PROMPT_HISTORY_MAX_ITEMS):])  # 원격 프롬프트와 같은 최근 설명 수
+        k = min(k, len(self.targets))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.targets[i], float(scores[i])) for i in top if scores[i] >= LOCAL_GUESS_MIN_SCORE]
+
+    def best_guess(self, history: List[str]) -> Optional[Tuple[str, float]]:
+        """가장 유사한 목표어와 점수 (기준 점수 미만이면 None)"""
+        top = self.top_guesses(history, 1)
+        return top[0] if top else None
+
+    def ask_guess(self, history: List[str], k: int = GUESS_TOP_K) -> str:
+        """OpenAIHelper.ask_guess와 같은 형식의 답변 (extract_guess_tokens 호환, 후보 최대 k개)"""
+        top = self.top_guesses(history, k)
+        if not top:
+            return "잘 모르겠어요. 조금 더 설명해주세요."
+        return "설명을 들어보니 이것 같아요. " + " ".join(f"[[{word}]]" for word, _ in top)
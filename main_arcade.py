@@ -21,13 +21,16 @@ Setup:
   set TABOO_JSON=taboo_bank.json  # JSON path
   set ROUNDS=12                   # rounds per session
 """
+import logging
 import time
 import pygame
 import subprocess
 import sys
 import os
 
-from config import WINDOW_W, WINDOW_H, BG_COLOR, FG_COLOR, ACCENT, MUTED, FONT_NAME, ROUNDS_PER_SESSION, TABOO_JSON_PATH
+from config import WINDOW_W, WINDOW_H, BG_COLOR, FG_COLOR, ACCENT, MUTED, FONT_NAME, ROUNDS_PER_SESSION, TABOO_JSON_PATH, LOG_LEVEL
+from audio_capture import shutdown_capture_service
+from openai_helper import shutdown_openai_helper, warm_openai_helper
 from game import Game
 from main_menu import MainMenu
 
@@ -50,12 +53,16 @@ def show_help():
 
 def main():
     """메인 실행 함수"""
+    logging.basicConfig(level=LOG_LEVEL, format="[%(levelname)s] %(name)s: %(message)s")
     pygame.init()
     screen = pygame.display.set_mode((WINDOW_W, WINDOW_H))
     pygame.display.set_caption("Voice Taboo – Arcade Edition")
 
     clock = pygame.time.Clock()
     
+    # API 클라이언트는 프로세스당 하나 - 메뉴를 보는 동안 미리 만들고 연결을 열어 둔다
+    warm_openai_helper()
+
     # 메인 메뉴 초기화
     main_menu = MainMenu(screen)
     game = None
@@ -80,6 +87,8 @@ def main():
                         running = False
                     else:
                         menu_action = main_menu.handle_key(event.key)
+                        if main_menu.name_input_active:
+                            warm_openai_helper()  # 이름 입력 중에 연결 예열 (최근 예열했으면 생략)
                         
                         if menu_action == "START_GAME_WITH_NAME":
                             # 이름과 함께 게임 시작
@@ -96,6 +105,7 @@ def main():
                     # 게임 중 키 처리
                     if event.key == pygame.K_ESCAPE:
                         current_state = "MAIN_MENU"
+                        game.close()  # 진행 중인 ASR/AI 처리 취소
                         game = None
                     else:
                         game.handle_key(event.key)
@@ -122,6 +132,7 @@ def main():
                 if game.finished or not game.round:
                     # 모든 게임 결과를 저장 (0점 포함)
                     main_menu.add_score(game.player_name, game.score, game.time_mode, game.elapsed)
+                    game.close()
                     current_state = "GAME_OVER"
                     final_score = game.score
                     final_mode = game.time_mode
@@ -172,6 +183,8 @@ def main():
         
         clock.tick(60)
 
+    shutdown_openai_helper()
+    shutdown_capture_service()
     pygame.quit()
 
 
@@ -0,0 +1,148 @@
+"""
+라운드별 위반 검사기 (Aho–Corasick)
+
+라운드가 만들어질 때 목표어와 금지어를 오토마톤 하나로 컴파일해 두고,
+인식 결과는 한 번의 선형 스캔으로 모든 일치(위치 포함)를 찾는다.
+금지어가 수백 개(변형 포함)여도 검사 시간은 텍스트 길이에만 비례한다.
+
+일치 기준: 정규화한 텍스트(text_normalize.match_text - NFKC, 소문자, 문장부호 제거, 어절 구분 유지)
+안의 부분 문자열 ("버스를", "시내버스"는 일치). 공백을 남겨 두므로 어절 경계를 넘는 일치는 없다
+("회사 과장"의 "사과"는 불일치).
+단어 쪽 정규화 형태는 뱅크 로드 시 미리 계산된 EntryKeys를 그대로 쓰고,
+인식 결과는 검사할 때 한 번만 정규화한다. 위치는 정규화한 텍스트 기준.
+
+정확히 일치하는 단어가 없을 때 쓰는 퍼지 검사(fuzzy_check)용 비트 벡터도 라운드 생성 시 함께 만든다.
+퍼지 검사도 같은 기준(어절 안의 부분 문자열)으로, 어절마다 따로 스캔한다.
+"""
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from fuzzy_match import FuzzyMatcher
+from text_normalize import EntryKeys, match_text, to_jamo
+
+# 패턴 번호 -1은 목표어, 0 이상은 금지어 목록의 순서
+TARGET_ID = -1
+
+
+class Hit(NamedTuple):
+    """텍스트에서 찾은 일치 하나 (정규화한 텍스트의 [start, end) 구간)"""
+    start: int
+    end: int
+    word: str  # 원래 목록의 단어 (목표어 또는 금지어)
+    pattern_id: int  # TARGET_ID 또는 금지어 목록 순서
+
+
+class ViolationMatcher:
+    """목표어 + 금지어 오토마톤 (생성 후 불변이라 여러 스레드에서 공유 가능)"""
+
+    def __init__(self, target: str, forbidden: List[str], keys: Optional[EntryKeys] = None):
+        self.target = target
+        self.forbidden = list(forbidden)
+        self.keys = keys or EntryKeys.of(target, self.forbidden)
+        # 상태별 전이(dict), 실패 링크, 출력(해당 상태에서 끝나는 (패턴 번호, 길이))
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[Tuple[int, int], ...]] = [()]
+        patterns = [(TARGET_ID, self.keys.target)] + list(enumerate(self.keys.forbidden))
+        for pattern_id, key in patterns:
+            for form in key.forms:
+                self._add(form, pattern_id)
+        self._build()
+        # 퍼지 검사용 패턴 (0번이 목표어, 이후 금지어 순서) - 음절/자모 단위
+        words = (self.keys.target,) + self.keys.forbidden
+        self._fuzzy = {
+            "syllable": FuzzyMatcher([k.compact for k in words]),
+            "jamo": FuzzyMatcher([k.jamo for k in words]),
+        }
+
+    def _add(self, key: str, pattern_id: int):
+        state = 0
+        for ch in key:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] += ((pattern_id, len(key)),)
+
+    def _build(self):
+        """BFS로 실패 링크를 잇고 실패 링크 쪽 출력을 미리 합쳐 둔다"""
+        queue = deque(self._goto[0].values())  # 깊이 1 상태의 실패 링크는 루트
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def find_all(self, text: str) -> List[Hit]:
+        """모든 일치 (끝 위치 순, 같은 위치에서 끝나면 긴 패턴 먼저)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        hits: List[Hit] = []
+        state = 0
+        norm = match_text(text)
+        for i, ch in enumerate(norm):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern_id, length in out[state]:
+                word = self.target if pattern_id == TARGET_ID else self.forbidden[pattern_id]
+                hits.append(Hit(i + 1 - length, i + 1, word, pattern_id))
+        return hits
+
+    def check(self, text: str) -> Tuple[Optional[str], bool]:
+        """(금지어_위반, 목표어_위반) - 금지어가 여러 개 나오면 목록에서 앞선 단어"""
+        goto, fail, out = self._goto, self._fail, self._out
+        target_violation = False
+        first_forbidden: Optional[int] = None
+        state = 0
+        norm = match_text(text)
+        for i, ch in enumerate(norm):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern_id, _ in out[state]:
+                if pattern_id == TARGET_ID:
+                    target_violation = True
+                elif first_forbidden is None or pattern_id < first_forbidden:
+                    first_forbidden = pattern_id
+        forbidden_violation = self.forbidden[first_forbidden] if first_forbidden is not None else None
+        return forbidden_violation, target_violation
+
+    def fuzzy_hits(self, text: str, max_ratio: float, min_length: int, unit: str = "jamo") -> List[Hit]:
+        """편집 거리 허용 범위 안의 단어 (위치는 unit 단위 정규화 텍스트 기준, 시작은 추정값)
+
+        정확 일치(check)와 같은 기준으로 어절마다 따로 스캔한다 - 어절 경계를 넘는 일치는 없다
+        ("자동 차"는 "자동차"와 불일치). 오탐은 라운드를 잃게 하므로 띄어쓰기 차이는 허용하지 않는다."""
+        fuzzy = self._fuzzy[unit]
+        hits: List[Hit] = []
+        offset = 0
+        for token in match_text(text).split(" "):
+            if unit == "jamo":
+                token = to_jamo(token)
+            for hit in fuzzy.matches(token, max_ratio, min_length):
+                pattern_id = hit.index - 1
+                word = self.target if pattern_id == TARGET_ID else self.forbidden[pattern_id]
+                start = max(0, hit.end - int(fuzzy.lengths[hit.index]))
+                hits.append(Hit(offset + start, offset + hit.end, word, pattern_id))
+            offset += len(token) + 1
+        return hits
+
+    def fuzzy_check(self, text: str, max_ratio: float, min_length: int,
+                    unit: str = "jamo") -> Tuple[Optional[str], bool]:
+        """check와 같은 형식의 퍼지 검사 (max_ratio: 단어 길이 대비 허용 편집 비율, min_length보다 짧은 단어는 제외)"""
+        return self.summarize(self.fuzzy_hits(text, max_ratio, min_length, unit))
+
+    @staticmethod
+    def summarize(hits: List[Hit]) -> Tuple[Optional[str], bool]:
+        """일치 목록 → (금지어_위반, 목표어_위반) - 금지어는 목록에서 앞선 단어"""
+        target_violation = any(h.pattern_id == TARGET_ID for h in hits)
+        forbidden = [h for h in hits if h.pattern_id != TARGET_ID]
+        forbidden_violation = min(forbidden, key=lambda h: h.pattern_id).word if forbidden else None
+        return forbidden_violation, target_violation
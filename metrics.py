@@ -0,0 +1,187 @@
+"""
+음성 턴 단계별 지연 시간 측정
+
+각 단계(캡처 종료, 버퍼 연결, VAD, 인코딩, 업로드+ASR, 위반 검사, LLM, 추측 파싱, 상태 반영)를
+span으로 감싸 프로세스 내 히스토그램에 모으고 p50/p95/p99를 계산한다.
+턴마다 생기는 사건(캐시 적중, 대체 경로 사용, 인식 결과 폐기 등)은 카운터로 센다 (count).
+결과는 JSON 또는 Prometheus 텍스트 형식 파일로 내보내거나 게임 화면의 디버그 오버레이(F3)로 본다.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Prometheus 히스토그램 버킷 상한 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# 오버레이/내보내기에 표시할 턴 단계 순서
+TURN_STAGES = (
+    "capture_stop", "concatenate", "queue_wait", "vad", "encode", "asr",
+    "violation_check", "llm", "guess_parse", "state_update", "turn_total",
+)
+
+
+class Histogram:
+    """누적 버킷(Prometheus용) + 최근 표본(분위수 계산용)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, window: int = 1000):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.samples: deque = deque(maxlen=window)
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        self.samples.append(value)
+        for i, upper in enumerate(self.buckets):
+            if value <= upper:
+                self.bucket_counts[i] += 1
+
+    def percentiles(self, qs=(50, 95, 99)) -> Dict[str, float]:
+        if not self.samples:
+            return {}
+        values = np.percentile(np.fromiter(self.samples, dtype=np.float64), qs)
+        return {f"p{q}": float(v) for q, v in zip(qs, values)}
+
+    @property
+    def last(self) -> Optional[float]:
+        return self.samples[-1] if self.samples else None
+
+
+class MetricsRegistry:
+    """이름별 히스토그램 + 카운터 모음 (여러 스레드에서 기록)
+
+    이름이 "_seconds"로 끝나는 히스토그램은 단계 지연이 아닌 값(예: vad_trimmed_seconds)으로,
+    Prometheus에서는 단계 히스토그램과 따로 내보낸다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Histogram] = {}
+        self._counters: Dict[str, int] = {}
+
+    def count(self, name: str, n: int = 1):
+        """name 사건 횟수 증가"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def counters(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            hist = self._histograms.get(name)
+            if hist is None:
+                hist = self._histograms[name] = Histogram()
+            hist.observe(seconds)
+
+    @contextmanager
+    def span(self, name: str, trace: Optional[Dict[str, float]] = None) -> Iterator[None]:
+        """with 블록의 실행 시간을 name 히스토그램에 기록 (trace가 있으면 턴별 기록에도 남김)"""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            self.observe(name, elapsed)
+            if trace is not None:
+                trace[name] = trace.get(name, 0.0) + elapsed
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """단계별 count/sum/mean/last/p50/p95/p99 (초)"""
+        with self._lock:
+            result = {}
+            for name, hist in self._histograms.items():
+                entry = {"count": hist.count, "sum": hist.sum, "mean": hist.sum / hist.count,
+                         "last": hist.last}
+                entry.update(hist.percentiles())
+                result[name] = entry
+            return result
+
+    def to_json(self) -> str:
+        return json.dumps({"generated_at": time.time(), "stages": self.snapshot(),
+                           "events": self.counters()}, indent=2)
+
+    def to_prometheus(self, metric: str = "voicetaboo_stage_seconds") -> str:
+        """Prometheus 텍스트 노출 형식 (단계 히스토그램 + 값 히스토그램 + 사건 카운터)"""
+        lines = [f"# HELP {metric} Voice turn stage latency in seconds",
+                 f"# TYPE {metric} histogram"]
+        with self._lock:
+            values = []
+            for name, hist in sorted(self._histograms.items()):
+                if name.endswith("_seconds"):
+                    values.append((name, hist))
+                    continue
+                self._histogram_lines(lines, metric, f'stage="{name}",', hist)
+            for name, hist in values:
+                lines += [f"# TYPE voicetaboo_{name} histogram"]
+                self._histogram_lines(lines, f"voicetaboo_{name}", "", hist)
+            if self._counters:
+                lines += ["# HELP voicetaboo_events_total Voice turn events",
+                          "# TYPE voicetaboo_events_total counter"]
+                for name, n in sorted(self._counters.items()):
+                    lines.append(f'voicetaboo_events_total{{event="{name}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _histogram_lines(lines: List[str], metric: str, labels: str, hist: Histogram):
+        for upper, count in zip(hist.buckets, hist.bucket_counts):
+            lines.append(f'{metric}_bucket{{{labels}le="{upper}"}} {count}')
+        lines.append(f'{metric}_bucket{{{labels}le="+Inf"}} {hist.count}')
+        tail = f"{{{labels.rstrip(',')}}}" if labels else ""
+        lines.append(f'{metric}_sum{tail} {hist.sum:.6f}')
+        lines.append(f'{metric}_count{tail} {hist.count}')
+
+    def export(self, path: str):
+        """확장자가 .prom이면 Prometheus 텍스트, 그 외에는 JSON으로 저장"""
+        if not path:
+            return
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        text = self.to_prometheus() if path.endswith(".prom") else self.to_json()
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)  # 수집기가 쓰다 만 파일을 읽지 않도록
+
+    def overlay_lines(self, last_turn: Optional[Dict[str, float]] = None) -> List[str]:
+        """디버그 오버레이용 표 (ms, last는 마지막 턴 값 - 턴 기록에 없는 단계는 마지막 관측값)"""
+        snap = self.snapshot()
+        lines = [f"{'stage':<16}{'last':>7}{'p50':>7}{'p95':>7}{'p99':>7}{'n':>5}"]
+        for name in TURN_STAGES:
+            entry = snap.get(name)
+            if entry is None:
+                continue
+            last = (last_turn or {}).get(name, entry["last"])
+            cells = [last] + [entry.get(p) for p in ("p50", "p95", "p99")]
+            text = "".join(f"{v * 1000:7.0f}" if v is not None else f"{'-':>7}" for v in cells)
+            lines.append(f"{name:<16}{text}{entry['count']:5d}")
+        return lines
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+# 프로세스 전역 레지스트리
+REGISTRY = MetricsRegistry()
+
+
+def span(name: str, trace: Optional[Dict[str, float]] = None):
+    """REGISTRY.span 단축"""
+    return REGISTRY.span(name, trace)
+
+
+def count(name: str, n: int = 1):
+    """REGISTRY.count 단축"""
+    REGISTRY.count(name, n)
@@ -0,0 +1,374 @@
+"""
+로컬 OpenAI 대역 서버 (오프라인 부하/지연 시간 테스트용)
+
+OpenAIHelper가 쓰는 엔드포인트만 흉내 낸다.
+- POST /v1/audio/transcriptions  (json / verbose_json / text)
+- POST /v1/chat/completions      (일반 응답 + stream=True면 SSE, include_usage 지원)
+- GET  /v1/models/<id>           (연결 예열용)
+- GET  /__stats                  (요청/장애 주입 카운터)
+
+응답은 스크립트 파일(JSON)의 문장을 순서대로 돌려 쓰거나 (같은 프로세스에서 띄웠으면)
+MockBehavior.pin으로 고정한 문장을 돌려주고, 지연 시간은 분포에서 뽑으며,
+일정 비율로 HTTP 오류 / 응답 지연(타임아웃 유발) / 연결 끊김을 주입한다.
+
+사용법:
+  python mock_openai_server.py --port 8765 --asr-latency lognormal:0.4,0.3 --error-rate 0.05
+  # 다른 터미널에서 (.env에 넣어도 됨)
+  OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=mock python main_arcade.py
+
+스크립트 파일 형식:
+  {"transcriptions": ["빨갛고 동그란 과일이에요", ...], "completions": ["과일이네요. [[사과]]", ...]}
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_TRANSCRIPTIONS = ["빨갛고 동그란 과일이에요", "아침에 많이 먹어요", "나무에 열려요"]
+DEFAULT_COMPLETIONS = ["과일 같네요. [[사과]]", "아침 식사와 관련 있어 보여요. [[사과]] [[바나나]] [[딸기]]"]
+
+_BOUNDARY_RE = re.compile(r'boundary="?([^";]+)"?')
+_FIELD_NAME_RE = re.compile(rb'name="([^"]*)"')
+
+
+def _usage_tokens(text: str) -> int:
+    """usage에 넣을 대략적인 토큰 수 (게임 config를 읽지 않도록 prompt_builder 대신 UTF-8 길이로 추정)"""
+    return (len(text.encode("utf-8")) + 2) // 3
+
+
+class LatencyModel:
+    """지연 시간 분포 (초)
+
+    형식: "0.3"(고정) / "uniform:0.1,0.5" / "normal:평균,표준편차" /
+          "lognormal:중앙값,sigma" / "exp:평균"
+    """
+
+    def __init__(self, spec: str = "0"):
+        self.spec = spec
+        kind, _, args = spec.partition(":")
+        if not args:
+            kind, args = "const", kind
+        self.kind = kind
+        self.params = [float(a) for a in args.split(",") if a]
+        expected = {"const": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exp": 1}.get(kind)
+        if expected is None or len(self.params) != expected:
+            raise ValueError(f"invalid latency spec: {spec!r}")
+
+    def sample(self, rng: random.Random) -> float:
+        p = self.params
+        if self.kind == "const":
+            value = p[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(p[0], p[1])
+        elif self.kind == "normal":
+            value = rng.gauss(p[0], p[1])
+        elif self.kind == "lognormal":
+            value = p[0] * rng.lognormvariate(0.0, p[1])
+        else:
+            value = rng.expovariate(1.0 / p[0]) if p[0] > 0 else 0.0
+        return max(0.0, value)
+
+
+class MockBehavior:
+    """응답 내용, 지연 시간, 장애 주입 설정 (여러 요청 스레드가 공유)
+
+    error_rate: HTTP 오류 응답 비율 (error_codes 중 무작위, 429/5xx는 클라이언트 재시도 대상)
+    hang_rate: hang_seconds 동안 응답하지 않는 비율 (클라이언트 읽기 타임아웃 유발)
+    drop_rate: 응답 없이 연결을 끊는 비율 (연결 오류 유발)
+    """
+
+    def __init__(self, asr_latency: str = "0.3", llm_latency: str = "0.4", chunk_delay: float = 0.02,
+                 error_rate: float = 0.0, error_codes: Tuple[int, ...] = (500,), hang_rate: float = 0.0,
+                 hang_seconds: float = 30.0, drop_rate: float = 0.0, script: Optional[dict] = None,
+                 seed: Optional[int] = None):
+        self.asr_latency = LatencyModel(asr_latency)
+        self.llm_latency = LatencyModel(llm_latency)
+        self.chunk_delay = chunk_delay
+        self.error_rate = error_rate
+        self.error_codes = tuple(error_codes)
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        self.drop_rate = drop_rate
+        script = script or {}
+        self.transcriptions: List[str] = script.get("transcriptions") or DEFAULT_TRANSCRIPTIONS
+        self.completions: List[str] = script.get("completions") or DEFAULT_COMPLETIONS
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._next = {"asr": 0, "llm": 0}
+        self._pinned: Dict[str, Optional[str]] = {"asr": None, "llm": None}
+        self.counters: Dict[str, int] = {
+            "transcriptions": 0, "completions": 0, "streams": 0, "models": 0,
+            "errors": 0, "hangs": 0, "drops": 0,
+        }
+
+    def count(self, key: str):
+        with self._lock:
+            self.counters[key] += 1
+
+    def latency(self, kind: str) -> float:
+        model = self.asr_latency if kind == "asr" else self.llm_latency
+        with self._lock:
+            return model.sample(self._rng)
+
+    def fault(self) -> Optional[Tuple[str, int]]:
+        """이번 요청에 주입할 장애 (없으면 None)"""
+        with self._lock:
+            r = self._rng.random()
+            if r < self.drop_rate:
+                return "drop", 0
+            r -= self.drop_rate
+            if r < self.hang_rate:
+                return "hang", 0
+            r -= self.hang_rate
+            if r < self.error_rate:
+                return "error", self._rng.choice(self.error_codes)
+        return None
+
+    def pin(self, transcription: Optional[str] = None, completion: Optional[str] = None):
+        """이후 요청에 돌려줄 문장 고정 (None이면 스크립트 순서로 복귀)
+
+        재시도/취소된 턴 때문에 요청 수가 스크립트와 어긋나도 턴마다 맞는 응답을 주도록
+        리플레이가 턴을 시작할 때마다 호출한다.
+        """
+        with self._lock:
+            self._pinned = {"asr": transcription, "llm": completion}
+
+    def next_reply(self, kind: str) -> str:
+        """고정된 문장, 없으면 스크립트 문장을 순서대로 (끝나면 처음부터) 반환"""
+        replies = self.transcriptions if kind == "asr" else self.completions
+        with self._lock:
+            pinned = self._pinned[kind]
+            if pinned is not None:
+                return pinned
+            i = self._next[kind]
+            self._next[kind] = i + 1
+        return replies[i % len(replies)]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counters)
+
+
+def _multipart_fields(body: bytes, content_type: str) -> Dict[str, bytes]:
+    """multipart/form-data 본문의 필드 (파일은 내용 그대로)"""
+    match = _BOUNDARY_RE.search(content_type)
+    if not match:
+        return {}
+    fields = {}
+    for part in body.split(b"--" + match.group(1).encode()):
+        head, sep, value = part.partition(b"\r\n\r\n")
+        name = _FIELD_NAME_RE.search(head)
+        if sep and name:
+            fields[name.group(1).decode()] = value[:-2] if value.endswith(b"\r\n") else value
+    return fields
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # 클라이언트 연결 풀이 keep-alive로 재사용하도록
+
+    @property
+    def behavior(self) -> MockBehavior:
+        return self.server.behavior
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send_json(self, payload: dict, status: int = 200):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_text(self, text: str):
+        data = text.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _inject_fault(self) -> bool:
+        """장애를 주입했으면 True (요청 처리 중단)"""
+        fault = self.behavior.fault()
+        if fault is None:
+            return False
+        kind, status = fault
+        if kind == "drop":
+            self.behavior.count("drops")
+            self.close_connection = True
+            return True
+        if kind == "hang":
+            self.behavior.count("hangs")
+            time.sleep(self.behavior.hang_seconds)
+            self.close_connection = True
+            return True
+        self.behavior.count("errors")
+        error_type = "rate_limit_exceeded" if status == 429 else "server_error"
+        self._send_json({"error": {"message": f"injected {status}", "type": error_type,
+                                   "param": None, "code": None}}, status)
+        return True
+
+    def do_GET(self):
+        if self.path == "/__stats":
+            self._send_json(self.behavior.stats())
+        elif self.path.startswith("/v1/models/"):
+            self.behavior.count("models")
+            model = self.path.rsplit("/", 1)[-1]
+            self._send_json({"id": model, "object": "model", "created": 0, "owned_by": "mock"})
+        else:
+            self._send_json({"error": {"message": f"unknown path {self.path}"}}, 404)
+
+    def do_POST(self):
+        body = self._read_body()  # 장애 주입 여부와 관계없이 본문은 다 읽어야 연결을 재사용할 수 있다
+        if self.path == "/v1/audio/transcriptions":
+            if not self._inject_fault():
+                self._transcription(_multipart_fields(body, self.headers.get("Content-Type", "")))
+        elif self.path == "/v1/chat/completions":
+            if not self._inject_fault():
+                self._chat(json.loads(body or b"{}"))
+        else:
+            self._send_json({"error": {"message": f"unknown path {self.path}"}}, 404)
+
+    def _transcription(self, fields: Dict[str, bytes]):
+        self.behavior.count("transcriptions")
+        time.sleep(self.behavior.latency("asr"))
+        text = self.behavior.next_reply("asr")
+        response_format = fields.get("response_format", b"json").decode()
+        if response_format == "text":
+            self._send_text(text)
+        elif response_format == "verbose_json":
+            self._send_json({"task": "transcribe", "language": "korean",
+                             "duration": len(fields.get("file", b"")) / 32000.0, "text": text,
+                             "segments": []})
+        else:
+            self._send_json({"text": text})
+
+    def _chat(self, request: dict):
+        reply = self.behavior.next_reply("llm")
+        model = request.get("model", "mock")
+        prompt_tokens = sum(_usage_tokens(str(m.get("content", ""))) for m in request.get("messages", []))
+        completion_tokens = _usage_tokens(reply)
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                 "total_tokens": prompt_tokens + completion_tokens}
+        base = {"id": f"chatcmpl-{uuid.uuid4().hex[:12]}", "created": int(time.time()), "model": model}
+        time.sleep(self.behavior.latency("llm"))  # 첫 토큰까지의 시간
+        if not request.get("stream"):
+            self.behavior.count("completions")
+            self._send_json(dict(base, object="chat.completion", usage=usage, choices=[{
+                "index": 0, "message": {"role": "assistant", "content": reply}, "finish_reason": "stop",
+            }]))
+            return
+        self.behavior.count("streams")
+        include_usage = bool((request.get("stream_options") or {}).get("include_usage"))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            pieces = [reply[i:i + 4] for i in range(0, len(reply), 4)]
+            for i, piece in enumerate(pieces):
+                if i:
+                    time.sleep(self.behavior.chunk_delay)
+                self._send_event(dict(base, object="chat.completion.chunk", choices=[{
+                    "index": 0, "delta": {"content": piece}, "finish_reason": None,
+                }]))
+            self._send_event(dict(base, object="chat.completion.chunk", choices=[{
+                "index": 0, "delta": {}, "finish_reason": "stop",
+            }]))
+            if include_usage:
+                self._send_event(dict(base, object="chat.completion.chunk", choices=[], usage=usage))
+            self._send_chunk(b"data: [DONE]\n\n")
+            self._send_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 [[추측]]을 받자마자 스트림을 닫은 경우
+            self.close_connection = True
+
+    def _send_event(self, payload: dict):
+        self._send_chunk(f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode("utf-8"))
+
+    def _send_chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+
+class MockOpenAIServer:
+    """백그라운드 스레드에서 도는 대역 서버 (port=0이면 빈 포트 자동 선택)"""
+
+    def __init__(self, behavior: Optional[MockBehavior] = None, host: str = "127.0.0.1", port: int = 0,
+                 verbose: bool = False):
+        self.behavior = behavior or MockBehavior()
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.behavior = self.behavior
+        self.httpd.verbose = verbose
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "MockOpenAIServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 OpenAI 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--script", help="응답 스크립트 JSON 파일")
+    parser.add_argument("--asr-latency", default="0.3", help="인식 지연 분포 (예: lognormal:0.4,0.3)")
+    parser.add_argument("--llm-latency", default="0.4", help="첫 토큰까지 지연 분포")
+    parser.add_argument("--chunk-delay", type=float, default=0.02, help="스트리밍 청크 간격 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-codes", default="500,503,429")
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--hang-seconds", type=float, default=30.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("-v", "--verbose", action="store_true", help="요청 로그 출력")
+    args = parser.parse_args()
+
+    script = None
+    if args.script:
+        with open(args.script, "r", encoding="utf-8") as f:
+            script = json.load(f)
+    behavior = MockBehavior(
+        asr_latency=args.asr_latency, llm_latency=args.llm_latency, chunk_delay=args.chunk_delay,
+        error_rate=args.error_rate, error_codes=tuple(int(c) for c in args.error_codes.split(",") if c),
+        hang_rate=args.hang_rate, hang_seconds=args.hang_seconds, drop_rate=args.drop_rate,
+        script=script, seed=args.seed,
+    )
+    server = MockOpenAIServer(behavior, args.host, args.port, verbose=args.verbose)
+    print(f"OpenAI 대역 서버 실행 중: OPENAI_BASE_URL={server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"요청 통계: {behavior.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,10 @@
 Voice Taboo 게임 데이터 모델
 """
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+from matcher import ViolationMatcher
+from text_normalize import EntryKeys
 
 @dataclass
 class RoundState:
@@ -17,3 +20,26 @@ class RoundState:
     description_history: List[str] = field(default_factory=list)
     taboo_violation: Optional[str] = None
     target_violation: bool = False  # 목표어 말했는지 여부
+    keys: Optional[EntryKeys] = field(default=None, repr=False, compare=False)  # 뱅크 로드 시 계산한 정규화 형태
+    matcher: ViolationMatcher = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # 목표어 + 금지어를 라운드 시작 시 한 번만 컴파일 (턴마다 위반 검사에 재사용)
+        self.matcher = ViolationMatcher(self.target, self.forbidden, self.keys)
+        self.keys = self.matcher.keys
+
+
+@dataclass
+class TurnOutcome:
+    """백그라운드에서 처리된 한 턴(ASR → 위반 검사 → AI 추측)의 결과"""
+    text: str = ""
+    error_feedback: Optional[str] = None  # 음성 처리 실패 시 표시할 메시지
+    forbidden_violation: Optional[str] = None
+    target_violation: bool = False
+    ai_reply: Optional[str] = None
+    ai_guess: Optional[str] = None  # 정답과 일치한 후보 (없으면 1순위 후보)
+    ai_guesses: List[str] = field(default_factory=list)  # 순위별 추측 후보 (top-k 모드)
+    guess_rank: Optional[int] = None  # 정답과 일치한 후보의 순위 (0부터)
+    success: bool = False
+    timings: Dict[str, float] = field(default_factory=dict)  # 단계별 소요 시간 (초)
+    started_at: Optional[float] = None  # 턴 시작 시각 (perf_counter, 녹음 키를 뗀 순간)
@@ -1,78 +1,256 @@
 """
 OpenAI API 인터페이스
 """
+import hashlib
+import logging
 import os
-from typing import List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Callable, List, Optional, Tuple
 
 try:
-    from openai import OpenAI
+    from openai import (
+        OpenAI, DefaultHttpxClient, APIError, APIConnectionError, APITimeoutError, InternalServerError,
+        RateLimitError
+    )
 except Exception:
     raise SystemExit("openai SDK not found. Run: pip install openai")
 
-from config import ASR_MODEL, LLM_MODEL
+try:  # 연결 풀/keep-alive 설정용 (선택 - 없으면 SDK 기본 HTTP 클라이언트 사용)
+    import httpx
+except ImportError:
+    httpx = None
+
+from config import (
+    ASR_MODEL, LLM_MODEL, LLM_STREAMING, LLM_MAX_OUTPUT_TOKENS, GUESS_TOP_K, GUESS_BACKEND, LOCAL_GUESS_LATENCY_BUDGET,
+    LOCAL_GUESS_MAX_ENTRIES, GUESS_CACHE_ENABLED, GUESS_CACHE_SIZE, GUESS_CACHE_TTL, GUESS_CACHE_PATH,
+    ASR_CACHE_ENABLED, ASR_CACHE_SIZE, ASR_CACHE_DISK_SIZE, ASR_CACHE_PATH, ASR_BACKEND,
+    OPENAI_BASE_URL, OPENAI_READ_TIMEOUT, TURN_DEADLINE_SECONDS, HTTP_KEEPALIVE_SECONDS, HTTP_WARM_IDLE_SECONDS
+)
+from asr_backends import (
+    ASRBackend, ASRError, LocalWhisperBackend, create_asr_backend, local_asr_available
+)
+from resilience import (
+    CallGuard, CircuitBreaker, CircuitOpen, Deadline, DeadlineExceeded, MIN_ATTEMPT_SECONDS, request_timeout
+)
+from bank_store import get_bank_store
+from local_guesser import LocalGuesser
+from metrics import count
+from prompt_builder import GuessPrompt, PromptBuilder, TokenStats, count_tokens
+from response_cache import TieredCache, history_key_parts, make_key
+from turn_pipeline import TurnCancelled
+from utils import GuessTokenScanner
+
+log = logging.getLogger(__name__)
+
+GUESS_TEMPERATURE = 0.2
+
+
+class _GuessAbandoned(Exception):
+    """지연 예산 초과로 원격 응답을 더 이상 기다리지 않을 때 스트림을 중단시키는 예외"""
+
+
+# 재시도할 만한 일시적 오류 (APITimeoutError는 APIConnectionError의 하위 클래스)
+_TRANSIENT_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+
+def _root_cause(e: BaseException) -> BaseException:
+    """ASRError로 감싸진 SDK 예외를 꺼낸다"""
+    while isinstance(e, ASRError) and e.__cause__ is not None:
+        e = e.__cause__
+    return e
+
+
+def _is_transient(e: BaseException) -> bool:
+    return isinstance(_root_cause(e), _TRANSIENT_ERRORS)
+
+
+def _is_timeout(e: BaseException) -> bool:
+    return isinstance(_root_cause(e), (APITimeoutError, TimeoutError))
+
+
+def _is_service_failure(e: BaseException) -> bool:
+    """원격 서비스 실패인지 (취소, 로컬 모델 로딩 중 같은 내부 사유는 제외)"""
+    return isinstance(_root_cause(e), (APIError, TimeoutError))
+
+
+def _keepalive_http_client():
+    """keep-alive를 길게 잡은 HTTP 클라이언트 (httpx가 없으면 None - SDK 기본 클라이언트)
+
+    httpx 기본 keep-alive(5초)는 플레이어가 말하는 동안 끊기므로 길게 잡아 연결을 재사용한다.
+    """
+    if httpx is None:
+        log.warning("httpx 모듈이 없어 HTTP keep-alive 설정(HTTP_KEEPALIVE_SECONDS) 없이 "
+                    "openai SDK 기본 클라이언트 사용 (설정하려면: pip install httpx)")
+        return None
+    return DefaultHttpxClient(limits=httpx.Limits(
+        max_connections=20, max_keepalive_connections=10, keepalive_expiry=HTTP_KEEPALIVE_SECONDS,
+    ))
 
 
 class OpenAIHelper:
     """OpenAI API를 사용한 음성 인식 및 텍스트 생성"""
     
     def __init__(self):
-        if not os.getenv("OPENAI_API_KEY"):
+        # 인식과 추측을 모두 로컬에서 하면 API 키 없이도 동작
+        offline = ASR_BACKEND == "local" and GUESS_BACKEND == "local"
+        if not os.getenv("OPENAI_API_KEY") and not offline:
             raise SystemExit("OPENAI_API_KEY not set.")
-        self.client = OpenAI()
+        # SDK 자체 재시도는 끄고 CallGuard가 턴 마감 시간 안에서 재시도한다.
+        self.client = OpenAI(
+            base_url=OPENAI_BASE_URL, timeout=request_timeout(OPENAI_READ_TIMEOUT), max_retries=0,
+            http_client=_keepalive_http_client(),
+        ) if os.getenv("OPENAI_API_KEY") else None
+        self._last_request = 0.0  # 마지막 원격 호출 시각 (연결이 살아 있을 가능성 판단)
+        self._warm_lock = threading.Lock()
+        self.asr = create_asr_backend(ASR_BACKEND, self.client, is_usable=self._is_usable_transcription)
+        self._asr_fallback: Optional[ASRBackend] = None
+        self._asr_fallback_tried = False
+        self.asr_guard = CallGuard("asr", is_retryable=_is_transient, is_failure=_is_service_failure,
+                                   is_timeout=_is_timeout)
+        self.llm_guard = CallGuard("llm", is_retryable=_is_transient, is_failure=_is_service_failure,
+                                   is_timeout=_is_timeout)
+        self.prompt_builder = PromptBuilder(GUESS_TOP_K)
+        self.token_stats = TokenStats()
+        self._local_guesser: Optional[LocalGuesser] = None
+        self._local_guesser_key: Optional[tuple] = None  # 색인 당시 (뱅크 버전, 이번 게임 항목)
+        self._session_entries: tuple = ()
+        self._guess_executor: Optional[ThreadPoolExecutor] = None
+        self.guess_cache = TieredCache(
+            "guess", GUESS_CACHE_SIZE, GUESS_CACHE_TTL,
+            disk_path=GUESS_CACHE_PATH or None, enabled=GUESS_CACHE_ENABLED,
+        )
+        self.asr_cache = TieredCache(
+            "asr", ASR_CACHE_SIZE, None, disk_path=ASR_CACHE_PATH or None,
+            disk_max_entries=ASR_CACHE_DISK_SIZE, enabled=ASR_CACHE_ENABLED,
+        )
+
+    @property
+    def local_guesser(self) -> LocalGuesser:
+        """taboo 뱅크로 만든 로컬 추측기 (처음 사용할 때, 뱅크 파일이 바뀌었을 때 색인)
+
+        색인은 항목당 LOCAL_GUESS_DIM 크기의 행이라, 뱅크가 LOCAL_GUESS_MAX_ENTRIES보다 크면
+        이번 게임 항목(set_session_entries) + 무작위 일부만 색인하고 게임이 바뀔 때 다시 만든다.
+        """
+        store = get_bank_store()
+        version = store.refresh()
+        capped = len(store) > LOCAL_GUESS_MAX_ENTRIES
+        key = (version, self._session_entries if capped else None)
+        if self._local_guesser is None or key != self._local_guesser_key:
+            entries = store.index_entries(LOCAL_GUESS_MAX_ENTRIES, self._session_entries)
+            if capped:
+                log.info("로컬 추측기: 뱅크 %d개 중 %d개만 색인", len(store), len(entries))
+            self._local_guesser = LocalGuesser(entries)
+            self._local_guesser_key = key
+        return self._local_guesser
+
+    def set_session_entries(self, entries):
+        """이번 게임에 쓰는 뱅크 항목 (큰 뱅크에서 로컬 추측기가 일부만 색인할 때도 항상 포함)"""
+        self._session_entries = tuple(entries)
+
+    @staticmethod
+    def _asr_cache_key(audio_data: bytes, filename: str, model: str = ASR_MODEL, **params) -> str:
+        """인코딩된 오디오 내용 해시 + ASR 파라미터로 만든 캐시 키"""
+        digest = hashlib.blake2b(audio_data, digest_size=20).hexdigest()
+        ext = os.path.splitext(filename)[1].lower()
+        return make_key(kind="asr", audio=digest, format=ext, model=model, **params)
+
+    def warm_up(self):
+        """DNS 조회 + TLS 핸드셰이크를 미리 끝내 연결 풀에 살아 있는 연결을 만들어 둔다
+        (최근 HTTP_WARM_IDLE_SECONDS 안에 호출했으면 연결이 살아 있으므로 생략)"""
+        if self.client is None or not self._warm_lock.acquire(blocking=False):
+            return  # 오프라인 모드이거나 이미 예열 중
+        try:
+            if time.monotonic() - self._last_request < HTTP_WARM_IDLE_SECONDS:
+                return
+            t0 = time.perf_counter()
+            self.client.models.retrieve(LLM_MODEL, timeout=request_timeout(OPENAI_READ_TIMEOUT))
+            self._last_request = time.monotonic()
+            log.info("API 연결 예열 완료 (%.0fms)", (time.perf_counter() - t0) * 1000)
+        except Exception as e:
+            log.warning("API 연결 예열 실패 (무시): %s", e)
+        finally:
+            self._warm_lock.release()
+
+    def warm_up_async(self):
+        """warm_up을 백그라운드 스레드에서 실행 (메인 루프를 막지 않음)"""
+        if self.client is None or time.monotonic() - self._last_request < HTTP_WARM_IDLE_SECONDS:
+            return
+        threading.Thread(target=self.warm_up, name="api-warmup", daemon=True).start()
+
+    def api_stats(self) -> dict:
+        """재시도/타임아웃/서킷 브레이커 카운터, ASR 백엔드, 응답 캐시 적중률 통계"""
+        return {"asr": self.asr_guard.stats(), "llm": self.llm_guard.stats(), "asr_backend": self.asr.stats(),
+                "tokens": self.token_stats.stats(), "guess_cache": self.guess_cache.stats(),
+                "asr_cache": self.asr_cache.stats()}
+
+    def close(self):
+        """ASR 백엔드 정리 (로컬 워커 프로세스 종료)"""
+        stats = self.api_stats()
+        if (stats["asr"]["calls"] or stats["llm"]["calls"]
+                or stats["guess_cache"]["lookups"] or stats["asr_cache"]["lookups"]):
+            print(f"API 통계: {stats}")  # 백엔드별 지연/헤지 승리 횟수, 재시도/서킷 카운터
+        self.asr.close()
+        if self._asr_fallback is not None:
+            self._asr_fallback.close()
 
     def transcribe(self, wav_path: str) -> str:
         """WAV 파일을 텍스트로 변환 (Whisper 사용, 한국어 명시)"""
+        prompt = "한국어로 말하고 있습니다. 게임에서 사용하는 일상적인 단어들입니다."  # 한국어 컨텍스트 제공
+        if self.client is None:  # 오프라인 모드: 설정된 ASR 백엔드로 처리
+            with open(wav_path, "rb") as f:
+                return self.transcribe_audio_data(f.read(), os.path.basename(wav_path))
         with open(wav_path, "rb") as f:
             try:
+                audio_data = f.read()
+                key = self._asr_cache_key(audio_data, wav_path, response_format="text",
+                                          language="ko", prompt=prompt, temperature=0)
+                cached = self.asr_cache.get(key)
+                if cached is not None:
+                    return cached
+                f.seek(0)
                 result = self.client.audio.transcriptions.create(
                     model=ASR_MODEL,
                     file=f,
                     response_format="text",
                     language="ko",  # 한국어 명시적 지정
-                    prompt="한국어로 말하고 있습니다. 게임에서 사용하는 일상적인 단어들입니다.",  # 한국어 컨텍스트 제공
+                    prompt=prompt,
                     temperature=0,
                 )
-                return (result or "").strip()
+                text = (result or "").strip()
+                self.asr_cache.set(key, text)
+                return text
             except Exception as e:
                 return f"__error__: {e}"
     
-    def transcribe_audio_data(self, audio_data: bytes, filename: str = "audio.wav") -> str:
-        """오디오 바이너리 데이터를 직접 텍스트로 변환 (파일 저장 불필요)"""
+    def transcribe_audio_data(self, audio_data: bytes, filename: str = "audio.wav",
+                              deadline: Optional[Deadline] = None) -> str:
+        """오디오 바이너리 데이터를 직접 텍스트로 변환 (파일 저장 불필요)
+        deadline: 턴 마감 시간 (없으면 TURN_DEADLINE_SECONDS)"""
+        deadline = deadline or Deadline(TURN_DEADLINE_SECONDS)
         try:
-            from io import BytesIO
-            
-            # 디버깅: 오디오 데이터 크기 확인
-            print(f"오디오 데이터 크기: {len(audio_data)} bytes")
-            
-            if len(audio_data) < 5000:  # 더 큰 임계값 (5KB 미만은 거부)
+            # WAV 기준 5KB 미만은 거부 (압축 코덱은 크기로 길이를 판단할 수 없음)
+            if filename.endswith(".wav") and len(audio_data) < 5000:
                 return "음성이 너무 짧거나 조용합니다. 더 크고 길게 말해주세요."
             
-            audio_file = BytesIO(audio_data)
-            audio_file.name = filename  # 파일명 지정 (확장자로 포맷 인식)
-            
-            result = self.client.audio.transcriptions.create(
-                model=ASR_MODEL,
-                file=audio_file,
-                response_format="verbose_json",  # 더 상세한 결과
-                language="ko",  # 한국어 명시적 지정
-                prompt="",  # 프롬프트 제거 (편향 방지)
-                temperature=0.3,  # 약간의 랜덤성 추가
-            )
-            
-            # verbose_json에서 텍스트 추출
-            transcription = ""
-            if hasattr(result, 'text'):
-                transcription = result.text.strip()
-            elif isinstance(result, dict) and 'text' in result:
-                transcription = result['text'].strip()
+            # 같은 오디오(재시도, 리플레이)는 캐시된 인식 결과 사용
+            key = self._asr_cache_key(audio_data, filename, model=self.asr.model_name,
+                                      backend=self.asr.name, response_format="verbose_json",
+                                      language="ko", prompt="", temperature=0.3)
+            transcription = self.asr_cache.get(key)
+            if transcription is not None:
+                log.debug("음성 인식 캐시 적중: %r", transcription)
+                count("asr_cache_hit")
             else:
-                transcription = str(result).strip()
-                
-            print(f"음성 인식 결과: '{transcription}'")
+                transcription = self._transcribe_guarded(audio_data, filename, deadline)
+                self.asr_cache.set(key, transcription)
+                log.debug("음성 인식 결과: %r", transcription)
             
             # 유튜브 관련 잘못된 인식 결과만 간단히 필터링
             if transcription and self._is_youtube_garbage(transcription):
-                print(f"유튜브 관련 잘못된 인식으로 판단: '{transcription}'")
+                log.info("유튜브 관련 잘못된 인식으로 판단: %r", transcription)
+                count("asr_rejected")
                 return "음성 인식 결과가 명확하지 않습니다. 다시 말해주세요."
             
             if not transcription:
@@ -93,7 +271,8 @@ class OpenAIHelper:
             ]
             
             if transcription.lower() in [s.lower() for s in strange_responses]:
-                print(f"이상한 응답 감지됨: '{transcription}' - 무시합니다")
+                log.info("이상한 응답 감지됨: %r - 무시합니다", transcription)
+                count("asr_rejected")
                 return "음성 인식 결과가 명확하지 않습니다. 다시 말해주세요."
             
             if not transcription:
@@ -102,9 +281,45 @@ class OpenAIHelper:
             return transcription
             
         except Exception as e:
-            print(f"음성 인식 오류: {e}")
+            log.warning("음성 인식 오류: %s", e)
+            count("asr_error")
             return f"__error__: {e}"
     
+    def _transcribe_guarded(self, audio_data: bytes, filename: str, deadline: Deadline) -> str:
+        """재시도/서킷 브레이커를 거쳐 ASR 호출 (서킷이 열리면 로컬 ASR로 대체)"""
+        try:
+            text = self.asr_guard.call(
+                lambda timeout: self.asr.transcribe(audio_data, filename, timeout=timeout),
+                deadline, OPENAI_READ_TIMEOUT,
+            )
+            self._last_request = time.monotonic()
+            return text
+        except Exception as e:
+            if self.asr_guard.breaker.state != CircuitBreaker.OPEN:
+                raise
+            fallback = self._asr_fallback_backend()
+            if fallback is None:
+                raise
+            log.warning("ASR 서킷 열림 - 로컬 ASR 사용: %s", e)
+            count("asr_local_fallback")
+            return fallback.transcribe(audio_data, filename,
+                                       timeout=max(deadline.remaining(), MIN_ATTEMPT_SECONDS))
+
+    def _asr_fallback_backend(self) -> Optional[ASRBackend]:
+        """서킷이 처음 열릴 때 만드는 로컬 ASR (faster-whisper가 없거나 이미 로컬이면 None)"""
+        if not self._asr_fallback_tried:
+            self._asr_fallback_tried = True
+            if self.asr.name != "local" and local_asr_available():
+                try:
+                    self._asr_fallback = LocalWhisperBackend()
+                except ASRError as e:
+                    log.warning("로컬 ASR 대체 사용 불가: %s", e)
+        return self._asr_fallback
+
+    def _is_usable_transcription(self, text: str) -> bool:
+        """헤지 요청에서 채택할 만한 인식 결과인지 (빈 결과, 유튜브 문구 제외)"""
+        return bool(text and text.strip()) and not self._is_youtube_garbage(text)
+
     def _is_youtube_garbage(self, text: str) -> bool:
         """유튜브 관련 잘못된 인식인지 확인 (정확한 매칭만)"""
         youtube_patterns = [
@@ -158,37 +373,195 @@ class OpenAIHelper:
                 return transcription
                 
         except Exception as e:
-            print(f"검증 오류: {e}")
+            log.warning("검증 오류: %s", e)
             # 검증 실패시 원본 반환
             return transcription
 
-    def ask_guess(self, history: List[str]) -> str:
+    def ask_guess(self, history: List[str], on_partial: Optional[Callable[[str], None]] = None,
+                  deadline: Optional[Deadline] = None) -> str:
         """
         설명 히스토리를 바탕으로 AI가 추측하도록 요청
         규칙: 가능하면 [[word]] 토큰 포함, 한두 문장 이내
+        on_partial: 스트리밍 모드에서 응답 조각이 도착할 때마다 누적 텍스트로 호출
+        deadline: 턴 마감 시간 (없으면 TURN_DEADLINE_SECONDS)
+        
+        config.GUESS_BACKEND: remote(OpenAI) / local(로컬 추측기) /
+        fallback(원격 우선, 지연 예산 초과나 오류 시 로컬)
         """
-        lines = "\n".join(f"- {h}" for h in history[-6:])
-        sys = (
-            "당신은 추측 게임을 하고 있습니다. 사용자가 금지어를 사용하지 않고 숨겨진 목표어를 설명합니다. "
-            "당신은 목표어나 금지어 목록을 볼 수 없습니다.\n"
-            "한국어로 간결하게 답변하세요(2문장 이하). 확신이 들면 가장 좋은 추측을 "
-            "[[단어]] 형태로 포함하세요(소문자, 공백 없이).\n"
-            "예시: 이것은 교통수단 같네요. [[버스]]"
-        )
-        user = (
-            "다음 설명들을 바탕으로 짧은 추론과 함께 답변해주세요. "
-            "확신이 들면 [[단어]] 형태로 추측을 포함하세요.\n"
-            f"설명들:\n{lines}"
+        if GUESS_BACKEND == "local":
+            return self._ask_guess_local(history, on_partial)
+        deadline = deadline or Deadline(TURN_DEADLINE_SECONDS)
+        if GUESS_BACKEND == "fallback":
+            return self._ask_guess_with_fallback(history, on_partial, deadline)
+        return self._ask_guess_remote(history, on_partial, deadline)
+
+    def _ask_guess_local(self, history: List[str], on_partial: Optional[Callable[[str], None]] = None) -> str:
+        reply = self.local_guesser.ask_guess(history)
+        if on_partial:
+            on_partial(reply)
+        return reply
+
+    def _ask_guess_with_fallback(self, history: List[str], on_partial: Optional[Callable[[str], None]],
+                                 deadline: Deadline) -> str:
+        """원격 추측을 지연 예산 안에서 기다리고, 넘기거나 실패하면 로컬 추측으로 대체"""
+        if self._guess_executor is None:
+            self._guess_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="guess")
+        abandoned = threading.Event()
+
+        def guarded_partial(text: str):
+            if abandoned.is_set():
+                raise _GuessAbandoned()
+            if on_partial:
+                on_partial(text)
+
+        future = self._guess_executor.submit(self._ask_guess_remote, history, guarded_partial, deadline)
+        try:
+            reply = future.result(timeout=LOCAL_GUESS_LATENCY_BUDGET)
+        except FutureTimeout:
+            abandoned.set()
+            log.info("원격 추측 지연 (%.1f초 초과) - 로컬 추측 사용", LOCAL_GUESS_LATENCY_BUDGET)
+            count("guess_remote_slow")
+            return self._ask_guess_local(history, on_partial)
+        if reply.startswith("(AI error"):
+            log.warning("원격 추측 실패 - 로컬 추측 사용: %s", reply)
+            count("guess_remote_failed")
+            return self._ask_guess_local(history, on_partial)
+        return reply
+
+    def _guess_cache_key(self, prompt: GuessPrompt) -> str:
+        """실제로 보내는 설명(정규화) + 모델 설정으로 만든 캐시 키"""
+        return make_key(
+            kind="guess",
+            history=history_key_parts(prompt.history),
+            model=LLM_MODEL,
+            temperature=GUESS_TEMPERATURE,
+            max_tokens=LLM_MAX_OUTPUT_TOKENS,
+            system=prompt.messages[0]["content"],
         )
+
+    def _ask_guess_remote(self, history: List[str], on_partial: Optional[Callable[[str], None]] = None,
+                          deadline: Optional[Deadline] = None) -> str:
+        """OpenAI 채팅 API로 추측 요청 (같은 설명이면 캐시된 응답 사용, 서킷이 열리면 로컬 추측)"""
+        deadline = deadline or Deadline(TURN_DEADLINE_SECONDS)
+        prompt = self.prompt_builder.build(history)
+        key = self._guess_cache_key(prompt)
+        cached = self.guess_cache.get(key)
+        if cached is not None:
+            log.debug("추측 캐시 적중: %r", cached)
+            count("guess_cache_hit")
+            if on_partial:
+                on_partial(cached)
+            return cached
         try:
-            resp = self.client.chat.completions.create(
-                model=LLM_MODEL,
-                messages=[
-                    {"role": "system", "content": sys},
-                    {"role": "user", "content": user},
-                ],
-                temperature=0.2,
+            reply, usage = self.llm_guard.call(
+                lambda timeout: self._request_guess(prompt.messages, on_partial, timeout, deadline),
+                deadline, OPENAI_READ_TIMEOUT,
             )
-            return (resp.choices[0].message.content or "").strip()
+            self._last_request = time.monotonic()
+            self._record_tokens(prompt, reply, usage)
+        except (TurnCancelled, _GuessAbandoned):
+            raise  # 취소된 턴은 오류 문자열로 바꾸지 않는다 (fallback 모드가 로컬 추측을 시작하지 않도록)
         except Exception as e:
+            if isinstance(e, CircuitOpen) or (
+                    _is_service_failure(e) and self.llm_guard.breaker.state == CircuitBreaker.OPEN):
+                log.warning("추측 서킷 열림 - 로컬 추측 사용: %s", e)
+                count("guess_circuit_open")
+                return self._ask_guess_local(history, on_partial)
             return f"(AI error: {e})"
+        if reply:
+            self.guess_cache.set(key, reply)
+        return reply
+
+    def _record_tokens(self, prompt: GuessPrompt, reply: str, usage):
+        """API가 알려준 사용량을 기록 (스트림을 일찍 끊어 usage가 없으면 추정값)"""
+        if usage is not None and getattr(usage, "prompt_tokens", None):
+            prompt_tokens, completion_tokens, measured = usage.prompt_tokens, usage.completion_tokens, True
+        else:
+            prompt_tokens, completion_tokens, measured = prompt.prompt_tokens, count_tokens(reply), False
+        self.token_stats.record(prompt_tokens, completion_tokens, measured)
+        log.debug("추측 토큰: 프롬프트 %d, 응답 %d%s, 설명 %d개 (제외 %d개)", prompt_tokens, completion_tokens,
+                  "" if measured else " (추정)", len(prompt.history), prompt.dropped)
+
+    def _request_guess(self, messages: List[dict], on_partial: Optional[Callable[[str], None]],
+                       timeout: float, deadline: Deadline) -> Tuple[str, object]:
+        """추측 요청 한 번 (timeout: 이번 시도의 타임아웃 초). (응답, usage 또는 None) 반환"""
+        if LLM_STREAMING:
+            return self._ask_guess_stream(messages, on_partial, timeout, deadline)
+        resp = self.client.chat.completions.create(
+            model=LLM_MODEL,
+            messages=messages,
+            temperature=GUESS_TEMPERATURE,
+            max_tokens=LLM_MAX_OUTPUT_TOKENS,
+            timeout=request_timeout(timeout),
+        )
+        return (resp.choices[0].message.content or "").strip(), getattr(resp, "usage", None)
+
+    def _ask_guess_stream(self, messages: List[dict], on_partial: Optional[Callable[[str], None]],
+                          timeout: float, deadline: Deadline) -> Tuple[str, object]:
+        """스트리밍으로 추측 요청 - [[단어]] 토큰이 GUESS_TOP_K개 닫히는 즉시 나머지 응답은 버리고 종료
+        (timeout은 청크 사이 대기 시간의 상한, 전체 길이는 deadline으로 제한)"""
+        stream = self.client.chat.completions.create(
+            model=LLM_MODEL,
+            messages=messages,
+            temperature=GUESS_TEMPERATURE,
+            max_tokens=LLM_MAX_OUTPUT_TOKENS,
+            stream=True,
+            stream_options={"include_usage": True},  # 끝까지 받으면 마지막 청크에 사용량 포함
+            timeout=request_timeout(timeout),
+        )
+        scanner = GuessTokenScanner(want=GUESS_TOP_K)
+        usage = None
+        try:
+            for chunk in stream:
+                if getattr(chunk, "usage", None) is not None:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                guess = scanner.feed(delta)
+                if on_partial:
+                    on_partial(scanner.text)
+                if guess:
+                    break
+                if deadline.expired:
+                    raise DeadlineExceeded("guess stream exceeded the turn deadline")
+        finally:
+            stream.close()  # 남은 스트림 중단 (HTTP 연결 반환)
+        return scanner.text.strip(), usage
+
+
+# 프로세스 전역 헬퍼: 게임마다 새로 만들면 첫 요청이 매번 DNS + TLS 비용을 치르므로
+# HTTP 연결 풀, 응답 캐시, 로컬 ASR 워커를 게임 사이에 재사용한다
+_helper: Optional[OpenAIHelper] = None
+_helper_lock = threading.Lock()
+
+
+def get_openai_helper() -> OpenAIHelper:
+    """프로세스 전역 OpenAIHelper (첫 호출 시 생성)"""
+    global _helper
+    with _helper_lock:
+        if _helper is None:
+            _helper = OpenAIHelper()
+        return _helper
+
+
+def warm_openai_helper():
+    """헬퍼 생성 + 연결 예열을 백그라운드에서 시작 (메인 메뉴에서 호출, 블로킹 없음)"""
+    helper = _helper
+    if helper is not None:
+        helper.warm_up_async()
+        return
+    threading.Thread(target=lambda: get_openai_helper().warm_up(), name="api-warmup", daemon=True).start()
+
+
+def shutdown_openai_helper():
+    """프로그램 종료 시 헬퍼 정리 (통계 출력, 로컬 ASR 워커 종료, HTTP 연결 닫기)"""
+    global _helper
+    with _helper_lock:
+        if _helper is not None:
+            _helper.close()
+            if _helper.client is not None:
+                _helper.client.close()
+            _helper = None
@@ -0,0 +1,169 @@
+"""
+추측 요청 프롬프트 구성 + 토큰 사용량 기록
+
+- 시스템 프롬프트는 프로세스 동안 바이트 단위로 동일하게 유지 (서버 측 프롬프트 캐시 적중)
+- 설명 히스토리는 최신 설명부터 토큰 예산 안에 들어가는 만큼만 포함 (중복 설명은 한 번만)
+- 턴마다 프롬프트/응답 토큰 수를 기록 (API usage가 없으면 추정값)
+"""
+import math
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except Exception:
+    TIKTOKEN_AVAILABLE = False
+
+from config import LLM_MODEL, GUESS_TOP_K, PROMPT_HISTORY_TOKEN_BUDGET, PROMPT_HISTORY_MAX_ITEMS
+from response_cache import normalize_text
+
+
+_HANGUL_RE = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣ]")
+_SPACE_RE = re.compile(r"\s+")
+# 채팅 메시지 하나당 역할/구분자 오버헤드 (OpenAI 문서 기준 근사값)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def _load_encoding():
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.encoding_for_model(LLM_MODEL)
+    except Exception:
+        try:
+            return tiktoken.get_encoding("o200k_base")
+        except Exception:
+            return None
+
+
+_encoding = _load_encoding()
+
+
+def count_tokens(text: str) -> int:
+    """토큰 수 (tiktoken이 있으면 정확히, 없으면 한글 1음절≈1토큰, 그 외 4글자≈1토큰으로 추정)"""
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    hangul = len(_HANGUL_RE.findall(text))
+    return hangul + math.ceil((len(text) - hangul) / 4)
+
+
+def _system_prompt(top_k: int) -> str:
+    if top_k > 1:
+        # top-k 모드: 후보를 순위대로 여러 개 받아 한 번의 요청으로 여러 번 추측
+        return (
+            "당신은 추측 게임을 하고 있습니다. 사용자가 금지어를 사용하지 않고 숨겨진 목표어를 설명합니다. "
+            "당신은 목표어나 금지어 목록을 볼 수 없습니다.\n"
+            "한국어로 간결하게 답변하세요(1문장). 그 다음 가능성이 높은 순서대로 추측 후보를 "
+            f"최대 {top_k}개까지 각각 [[단어]] 형태로 나열하세요(소문자, 공백 없이, 서로 다른 단어).\n"
+            "예시: 이것은 교통수단 같네요. [[버스]] [[택시]] [[지하철]]"
+        )
+    return (
+        "당신은 추측 게임을 하고 있습니다. 사용자가 금지어를 사용하지 않고 숨겨진 목표어를 설명합니다. "
+        "당신은 목표어나 금지어 목록을 볼 수 없습니다.\n"
+        "한국어로 간결하게 답변하세요(2문장 이하). 확신이 들면 가장 좋은 추측을 "
+        "[[단어]] 형태로 포함하세요(소문자, 공백 없이).\n"
+        "예시: 이것은 교통수단 같네요. [[버스]]"
+    )
+
+
+def _user_instruction(top_k: int) -> str:
+    if top_k > 1:
+        return ("다음 설명들을 바탕으로 짧은 추론과 함께 답변해주세요. "
+                f"추측 후보를 최대 {top_k}개, 가능성 높은 순서대로 [[단어]] 형태로 포함하세요.\n설명들:\n")
+    return ("다음 설명들을 바탕으로 짧은 추론과 함께 답변해주세요. "
+            "확신이 들면 [[단어]] 형태로 추측을 포함하세요.\n설명들:\n")
+
+
+@dataclass
+class GuessPrompt:
+    """한 번의 추측 요청에 보낼 메시지와 실제로 포함된 설명"""
+    messages: List[dict]
+    history: List[str]  # 예산 안에 들어간 설명 (오래된 것부터)
+    prompt_tokens: int  # 추정 프롬프트 토큰 수
+    dropped: int = 0  # 예산/개수 제한으로 빠진 설명 수
+
+
+class PromptBuilder:
+    """고정 시스템 프롬프트 + 토큰 예산 안의 최신 설명으로 추측 요청 메시지 구성"""
+
+    def __init__(self, top_k: int = GUESS_TOP_K, history_budget: int = PROMPT_HISTORY_TOKEN_BUDGET,
+                 max_items: int = PROMPT_HISTORY_MAX_ITEMS):
+        self.history_budget = history_budget
+        self.max_items = max_items
+        # 시스템 프롬프트와 사용자 지시문은 한 번만 만들어 매 요청 같은 문자열을 재사용
+        self.system = _system_prompt(top_k)
+        self.instruction = _user_instruction(top_k)
+        self._static_tokens = (count_tokens(self.system) + count_tokens(self.instruction)
+                               + 2 * MESSAGE_OVERHEAD_TOKENS)
+
+    def select_history(self, history: List[str]) -> List[str]:
+        """최신 설명부터 예산 안에 들어가는 만큼 선택 (정규화 기준 중복 제거, 원래 순서 유지)"""
+        selected: List[str] = []
+        seen = set()
+        used = 0
+        for text in reversed(history):
+            line = _SPACE_RE.sub(" ", text).strip()
+            key = normalize_text(line)
+            if not key or key in seen:
+                continue
+            cost = count_tokens(line) + 1  # 줄바꿈 + "- "
+            if selected and used + cost > self.history_budget:
+                break
+            seen.add(key)
+            selected.append(line)
+            used += cost
+            if len(selected) >= self.max_items:
+                break
+        selected.reverse()
+        return selected
+
+    def build(self, history: List[str]) -> GuessPrompt:
+        selected = self.select_history(history)
+        lines = "\n".join(f"- {h}" for h in selected)
+        messages = [
+            {"role": "system", "content": self.system},
+            {"role": "user", "content": self.instruction + lines},
+        ]
+        prompt_tokens = self._static_tokens + count_tokens(lines)
+        return GuessPrompt(messages, selected, prompt_tokens, dropped=len(history) - len(selected))
+
+
+class TokenStats:
+    """턴별 프롬프트/응답 토큰 수 기록 (measured=False면 추정값)"""
+
+    def __init__(self, maxlen: int = 500):
+        self._lock = threading.Lock()
+        self._turns: deque = deque(maxlen=maxlen)
+        self.requests = 0
+        self.measured = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def record(self, prompt_tokens: int, completion_tokens: int, measured: bool):
+        with self._lock:
+            self.requests += 1
+            self.measured += int(measured)
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+            self._turns.append((prompt_tokens, completion_tokens, measured))
+
+    @property
+    def last(self) -> Optional[tuple]:
+        with self._lock:
+            return self._turns[-1] if self._turns else None
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            n = self.requests
+            return {
+                "requests": n,
+                "measured": self.measured,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "mean_prompt_tokens": self.prompt_tokens / n if n else 0.0,
+                "mean_completion_tokens": self.completion_tokens / n if n else 0.0,
+            }
@@ -0,0 +1,209 @@
+"""
+API 호출 보호 장치: 요청 타임아웃, 턴 마감 시간, 지터 백오프 재시도, 서킷 브레이커
+
+네트워크가 멈추면 요청 하나가 라운드 전체를 붙잡는다. CallGuard는 한 번의 호출을
+- 턴 마감 시간(Deadline) 안에서만
+- 일시적 오류일 때만, 정해진 횟수까지 지터를 섞은 지수 백오프로 재시도하고
+- 연속 실패가 쌓이면 서킷을 열어 한동안 호출 자체를 건너뛰게 해서 (호출 측은 로컬 대체 사용)
+턴의 최악 지연 시간을 제한한다. 모든 동작은 카운터로 남는다.
+"""
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from openai import Timeout
+
+from config import (
+    OPENAI_CONNECT_TIMEOUT, API_MAX_ATTEMPTS, API_RETRY_BASE_DELAY, API_RETRY_MAX_DELAY,
+    BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_SECONDS
+)
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 남은 시간이 이보다 짧으면 요청을 보내도 의미가 없다
+MIN_ATTEMPT_SECONDS = 0.2
+
+
+class DeadlineExceeded(TimeoutError):
+    """턴 마감 시간 초과"""
+
+
+class CircuitOpen(Exception):
+    """서킷이 열려 있어 호출을 건너뜀"""
+
+
+def request_timeout(seconds: float) -> Timeout:
+    """요청 하나의 타임아웃 (연결 타임아웃은 설정값을 넘지 않게)"""
+    return Timeout(seconds, connect=min(OPENAI_CONNECT_TIMEOUT, seconds))
+
+
+class Deadline:
+    """턴 단위 마감 시각 (ASR과 추측 요청이 같은 예산을 나눠 쓴다)"""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.perf_counter() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.perf_counter())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+
+class CircuitBreaker:
+    """closed → (연속 실패 threshold회) → open → (reset_seconds 후) half_open → 시험 호출 1회 결과로 복귀"""
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 reset_seconds: float = BREAKER_RESET_SECONDS):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        """호출해도 되는지 (열린 서킷은 reset_seconds가 지나면 시험 호출 하나만 허용)"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_seconds:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+            if self._state != self.CLOSED:
+                log.warning("[%s] 서킷 닫힘 - 원격 호출 재개", self.name)
+            self._state = self.CLOSED
+
+    def release(self):
+        """결과를 판단할 수 없이 끝난 호출(취소 등)의 시험 호출 자리 반납"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._consecutive_failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or (
+                    self._state == self.CLOSED and self._consecutive_failures >= self.failure_threshold):
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self.trips += 1
+                log.warning("[%s] 서킷 열림 - %.0f초 동안 원격 호출 중단", self.name, self.reset_seconds)
+
+
+class RetryPolicy:
+    """최대 시도 횟수 + full jitter 지수 백오프"""
+
+    def __init__(self, max_attempts: int = API_MAX_ATTEMPTS, base_delay: float = API_RETRY_BASE_DELAY,
+                 max_delay: float = API_RETRY_MAX_DELAY):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, retry: int) -> float:
+        """retry번째 재시도 전 대기 시간 (0 ~ base * 2^(retry-1), max_delay 상한)"""
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * (2 ** (retry - 1))))
+
+
+class CallGuard:
+    """한 원격 서비스(ASR, LLM)에 대한 재시도 + 서킷 브레이커 + 카운터
+
+    is_retryable: 다시 시도할 만한 일시적 오류인지 (타임아웃, 연결 오류, 429, 5xx 등)
+    is_failure: 서킷 브레이커에 실패로 셀 오류인지 (취소 같은 내부 예외는 제외)
+    is_timeout: 타임아웃 카운터에 셀 오류인지
+    """
+
+    def __init__(self, name: str, policy: Optional[RetryPolicy] = None,
+                 breaker: Optional[CircuitBreaker] = None,
+                 is_retryable: Callable[[BaseException], bool] = lambda e: False,
+                 is_failure: Callable[[BaseException], bool] = lambda e: True,
+                 is_timeout: Callable[[BaseException], bool] = lambda e: isinstance(e, TimeoutError)):
+        self.name = name
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker(name)
+        self.is_retryable = is_retryable
+        self.is_failure = is_failure
+        self.is_timeout = is_timeout
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = {
+            "calls": 0, "attempts": 0, "successes": 0, "failures": 0, "retries": 0,
+            "timeouts": 0, "deadline_exceeded": 0, "short_circuited": 0,
+        }
+
+    def _count(self, key: str):
+        with self._lock:
+            self.counters[key] += 1
+
+    def call(self, fn: Callable[[float], T], deadline: Deadline, attempt_timeout: float) -> T:
+        """fn(이번 시도의 타임아웃 초)을 재시도 정책에 따라 실행
+
+        서킷이 열려 있으면 CircuitOpen, 마감 시간이 부족하면 DeadlineExceeded,
+        재시도할 수 없거나 재시도가 소진되면 마지막 예외를 그대로 던진다.
+        """
+        self._count("calls")
+        if not self.breaker.allow():
+            self._count("short_circuited")
+            raise CircuitOpen(f"{self.name} circuit open")
+        attempt = 0
+        while True:
+            timeout = min(attempt_timeout, deadline.remaining())
+            if timeout < MIN_ATTEMPT_SECONDS:
+                self._count("deadline_exceeded")
+                self.breaker.release()  # 시간 부족은 서비스 실패로 세지 않음 (실패한 시도는 이미 기록됨)
+                raise DeadlineExceeded(f"{self.name}: turn deadline exceeded")
+            attempt += 1
+            self._count("attempts")
+            try:
+                result = fn(timeout)
+            except Exception as e:
+                if not self.is_failure(e):
+                    self.breaker.release()
+                    raise
+                if self.is_timeout(e):
+                    self._count("timeouts")
+                self._count("failures")
+                self.breaker.record_failure()
+                if attempt >= self.policy.max_attempts or not self.is_retryable(e):
+                    raise
+                pause = self.policy.backoff(attempt)
+                if deadline.remaining() - pause < MIN_ATTEMPT_SECONDS or not self.breaker.allow():
+                    raise
+                self._count("retries")
+                log.info("[%s] 일시적 오류로 재시도 %d/%d (%.2f초 후): %s",
+                         self.name, attempt, self.policy.max_attempts - 1, pause, e)
+                time.sleep(pause)
+                continue
+            self._count("successes")
+            self.breaker.record_success()
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            result: Dict[str, Any] = dict(self.counters)
+        result.update(name=self.name, breaker=self.breaker.state, trips=self.breaker.trips)
+        return result
@@ -0,0 +1,193 @@
+"""
+API 응답 캐시 (메모리 LRU + 선택적 SQLite 디스크 계층)
+
+교실에서는 같은 목표어가 반복되고 설명도 거의 같아서 같은 요청이 자주 나온다.
+정규화된 요청 키로 응답을 저장해 두면 반복 턴은 네트워크 없이 바로 끝난다.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 정규화: NFKC, 소문자, 문장부호 제거, 공백 정리"""
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _PUNCT_RE.sub(" ", text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def make_key(**parts: Any) -> str:
+    """키워드 인자들을 정렬된 JSON으로 직렬화해 해시한 캐시 키"""
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """크기 제한 + TTL이 있는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 512, ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (value, stored_at)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, stored_at = entry
+            if self.ttl is not None and time.time() - stored_at > self.ttl:
+                del self._data[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, stored_at: Optional[float] = None):
+        with self._lock:
+            self._data[key] = (value, stored_at if stored_at is not None else time.time())
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """SQLite 기반 영구 캐시 계층 (개수 제한, 오래 안 쓴 항목부터 삭제)"""
+
+    def __init__(self, path: str, max_entries: int = 10000, ttl: Optional[float] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[tuple]:
+        """(값, 저장 시각) 반환"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, stored_at FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None or (self.ttl is not None and now - row[1] > self.ttl):
+                if row is not None:
+                    self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any, stored_at: Optional[float] = None):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), stored_at or now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                "SELECT key FROM cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class TieredCache:
+    """메모리 LRU → 디스크 순서로 조회하는 2단 캐시 (enabled=False면 항상 miss)"""
+
+    def __init__(self, name: str, max_entries: int, ttl: Optional[float] = None,
+                 disk_path: Optional[str] = None, disk_max_entries: int = 10000, enabled: bool = True):
+        self.name = name
+        self.enabled = enabled
+        self.memory = LRUCache(max_entries, ttl)
+        self.disk: Optional[DiskCache] = None
+        if enabled and disk_path:
+            try:
+                self.disk = DiskCache(disk_path, disk_max_entries, ttl)
+            except Exception as e:
+                print(f"{name} 디스크 캐시 열기 실패 (메모리 캐시만 사용): {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        value = self.memory.get(key)
+        if value is not None or self.disk is None:
+            return value
+        entry = self.disk.get(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        self.memory.set(key, value, stored_at)  # 메모리 계층으로 올림
+        return value
+
+    def set(self, key: str, value: Any):
+        if not self.enabled:
+            return
+        self.memory.set(key, value)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, value)
+            except Exception as e:
+                log.warning("%s 디스크 캐시 저장 실패: %s", self.name, e)
+
+    def stats(self) -> Dict[str, Any]:
+        """적중률 등 카운터"""
+        lookups = self.memory.hits + self.memory.misses
+        hits = self.memory.hits + (self.disk.hits if self.disk else 0)
+        return {
+            "name": self.name,
+            "enabled": self.enabled,
+            "entries": len(self.memory),
+            "lookups": lookups,
+            "memory_hits": self.memory.hits,
+            "disk_hits": self.disk.hits if self.disk else 0,
+            "evictions": self.memory.evictions,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+
+def history_key_parts(history: List[str]) -> List[str]:
+    """프롬프트에 실제로 들어간 설명(PromptBuilder가 고른 GuessPrompt.history) 전체를 정규화 (빈 설명 제외)"""
+    return [n for n in (normalize_text(h) for h in history) if n]
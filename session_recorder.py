@@ -0,0 +1,123 @@
+"""
+게임 세션 녹화 아카이브 (느리거나 이상했던 세션을 그대로 재현하기 위한 기록)
+
+세션 하나 = 디렉터리 하나
+- audio.pcm    : 턴별 원본 녹음 샘플(VAD 전)을 이어 붙인 append-only 파일, 읽을 때는 메모리 매핑
+- turns.jsonl  : 턴마다 한 줄 (오디오 위치/형식, 라운드 정보, 인식 결과, AI 응답, 단계별 시간, 타임스탬프)
+- session.json : 세션 메타데이터 (시작 시각, 모드, 주요 설정)
+
+턴 기록은 매번 flush하므로 게임이 비정상 종료되어도 그때까지의 턴은 남는다.
+재생은 benchmarks/replay_session.py 참고.
+"""
+import json
+import os
+import time
+import uuid
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from models import TurnOutcome
+
+AUDIO_FILE = "audio.pcm"
+TURNS_FILE = "turns.jsonl"
+META_FILE = "session.json"
+
+
+class SessionRecorder:
+    """한 게임 세션의 턴을 디스크에 기록 (메인 스레드에서만 사용)"""
+
+    def __init__(self, path: str, meta: Optional[dict] = None):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._t0 = time.perf_counter()
+        self._audio = open(os.path.join(path, AUDIO_FILE), "ab")
+        self._turns = open(os.path.join(path, TURNS_FILE), "a", encoding="utf-8")
+        self._offset = self._audio.tell()
+        self.turn_count = 0
+        with open(os.path.join(path, META_FILE), "w", encoding="utf-8") as f:
+            json.dump(dict(meta or {}, started_at=time.time()), f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def create(cls, base_dir: str, meta: Optional[dict] = None) -> "SessionRecorder":
+        """base_dir 아래에 새 세션 디렉터리 생성 (이름: 시작 시각 + 임의 접미사)"""
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        return cls(os.path.join(base_dir, name), meta)
+
+    def add_audio(self, samples: np.ndarray, sample_rate: int) -> dict:
+        """녹음 샘플을 아카이브 끝에 추가하고 위치 정보 반환 (턴 기록의 "audio" 항목)"""
+        samples = np.ascontiguousarray(samples.reshape(-1))
+        ref = {"offset": self._offset, "samples": int(samples.shape[0]), "dtype": samples.dtype.str,
+               "sample_rate": sample_rate, "t": time.perf_counter() - self._t0, "wall_time": time.time()}
+        self._audio.write(samples.tobytes())
+        self._audio.flush()
+        self._offset += samples.nbytes
+        return ref
+
+    def record_turn(self, audio_ref: dict, round_info: dict, outcome: Optional[TurnOutcome] = None,
+                    status: str = "ok", error: Optional[str] = None):
+        """턴 한 줄 기록 (status: ok / error / cancelled)"""
+        record = {"turn": self.turn_count, "status": status, "audio": audio_ref, **round_info,
+                  "finished_t": time.perf_counter() - self._t0}
+        if error is not None:
+            record["error"] = error
+        if outcome is not None:
+            record.update(
+                text=outcome.text, ai_reply=outcome.ai_reply, ai_guesses=outcome.ai_guesses,
+                success=outcome.success, guess_rank=outcome.guess_rank,
+                forbidden_violation=outcome.forbidden_violation, target_violation=outcome.target_violation,
+                error_feedback=outcome.error_feedback, timings=outcome.timings,
+            )
+        self._turns.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._turns.flush()
+        self.turn_count += 1
+
+    def close(self):
+        self._audio.close()
+        self._turns.close()
+
+
+class SessionArchive:
+    """녹화된 세션 읽기 (오디오는 메모리 매핑, 턴별 샘플은 복사 없는 view)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        meta_path = os.path.join(path, META_FILE)
+        self.meta: dict = {}
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                self.meta = json.load(f)
+        self.turns: List[dict] = []
+        with open(os.path.join(path, TURNS_FILE), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    self.turns.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break  # 비정상 종료로 잘린 마지막 줄
+        audio_path = os.path.join(path, AUDIO_FILE)
+        self._audio = (np.memmap(audio_path, dtype=np.uint8, mode="r")
+                       if os.path.getsize(audio_path) else np.zeros(0, dtype=np.uint8))
+
+    def __len__(self) -> int:
+        return len(self.turns)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.turns)
+
+    def samples(self, turn: dict) -> np.ndarray:
+        """턴의 원본 녹음 샘플 (읽기 전용 view)"""
+        ref = turn["audio"]
+        return np.frombuffer(self._audio, dtype=np.dtype(ref["dtype"]), count=ref["samples"],
+                             offset=ref["offset"])
+
+    def recorded_timings(self) -> Dict[str, List[float]]:
+        """녹화 당시 단계별 소요 시간 (초, 처리 결과가 남은 턴만)"""
+        result: Dict[str, List[float]] = {}
+        for turn in self.turns:
+            for name, seconds in (turn.get("timings") or {}).items():
+                result.setdefault(name, []).append(seconds)
+        return result
+
+    def close(self):
+        """매핑 해제 (이미 꺼낸 샘플 view가 남아 있으면 그 view가 사라질 때 해제됨)"""
+        self._audio = np.zeros(0, dtype=np.uint8)
@@ -0,0 +1,83 @@
+"""
+위반 검사기(matcher.ViolationMatcher) 회귀 테스트
+
+  python -m pytest tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from matcher import ViolationMatcher  # noqa: E402
+from text_normalize import MatchKey, contains_key, match_text  # noqa: E402
+
+
+def test_compound_target_is_violation():
+    """합성어 안의 목표어도 위반 (짧은 목표어가 합성어에 자주 들어감)"""
+    assert ViolationMatcher("버스", []).check("시내버스 타고 갔어")[1]
+    assert ViolationMatcher("버스", []).check("고속버스")[1]
+    assert ViolationMatcher("크림", []).check("아이스크림 좋아해")[1]
+    assert ViolationMatcher("폰", []).check("핸드폰으로 전화해")[1]
+
+
+def test_compound_forbidden_word_is_violation():
+    matcher = ViolationMatcher("여행", ["버스", "기차"])
+    assert matcher.check("시내버스를 타요") == ("버스", False)
+
+
+def test_particles_punctuation_and_split_syllables():
+    matcher = ViolationMatcher("버스", [])
+    for text in ("버스를 탔어", "버스!", "버 스", "버스"):
+        assert matcher.check(text) == (None, True), text
+
+
+def test_no_match_across_word_boundary():
+    """어절 경계를 넘는 일치는 위반이 아님 ("회사 과장님이"에 "사과" 없음)"""
+    assert ViolationMatcher("과일", ["사과"]).check("회사 과장님이 먹어요") == (None, False)
+
+
+def test_single_syllable_particle_not_joined():
+    assert ViolationMatcher("색깔", ["노랑"]).check("노 랑") == (None, False)
+
+
+def test_multi_word_entry_matches_spaced_and_joined():
+    matcher = ViolationMatcher("아이스 크림", [])
+    assert matcher.check("아이스크림")[1]
+    assert matcher.check("아이스 크림이요")[1]
+
+
+def test_find_all_positions():
+    hits = ViolationMatcher("버스", ["시내"]).find_all("시내버스")
+    assert [(h.start, h.end, h.word) for h in hits] == [(0, 2, "시내"), (2, 4, "버스")]
+
+
+def test_contains_key_matches_inside_compound():
+    key = MatchKey.of("버스")
+    assert contains_key(match_text("정답은 시내버스예요"), key)
+    assert not contains_key(match_text("버 정류장 스"), key)
+
+
+# 퍼지 검사 (utils.check_violations 기본값: 자모 단위, 15%, 6자모 이상)
+FUZZY = dict(max_ratio=0.15, min_length=6, unit="jamo")
+
+
+def test_fuzzy_catches_misheard_word():
+    assert ViolationMatcher("스마트폰", []).fuzzy_check("스마트펀 샀어", **FUZZY) == (None, True)
+    assert ViolationMatcher("자동차", []).fuzzy_check("자동자 타고", **FUZZY) == (None, True)
+
+
+def test_fuzzy_does_not_span_spaces():
+    """띄어 쓴 어절을 이어 붙인 일치는 퍼지 위반이 아님"""
+    assert ViolationMatcher("자동차", []).fuzzy_check("자동 차", **FUZZY) == (None, False)
+    assert ViolationMatcher("전화", ["안드로이드"]).fuzzy_check("안드로 이드 폰", **FUZZY) == (None, False)
+
+
+def test_fuzzy_agrees_with_exact_rule_inside_compounds():
+    """합성어 안의 단어는 정확 일치도 위반이므로 퍼지 결과와 어긋나지 않음"""
+    matcher = ViolationMatcher("케이스", [])
+    assert matcher.check("스마트폰케이스") == matcher.fuzzy_check("스마트폰케이스", **FUZZY) == (None, True)
+
+
+def test_fuzzy_hit_positions_are_per_word_offsets():
+    hits = ViolationMatcher("자동차", []).fuzzy_hits("빨간 자동자", **FUZZY)
+    assert [(h.start, h.end) for h in hits] == [(7, 14)]
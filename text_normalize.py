@@ -0,0 +1,136 @@
+"""
+한국어 텍스트 정규화 (목표어/금지어 매칭용)
+
+인식 결과와 단어를 같은 형태로 맞춘 뒤 비교한다.
+- NFKC: 호환/전각 문자 통일 + 음절 조합 (NFD로 들어온 "버스"도 같은 문자열이 됨)
+- 소문자, 연속 공백 정리
+- compact: 공백과 문장부호 제거 ("버 스", "버스!" → "버스") - 단어 쪽 비교 형태
+- match_text: 어절 구분은 남기고 문장부호만 제거 - 인식 결과/응답 쪽 검사 형태.
+  단어는 어절 안의 부분 문자열로 찾고 ("시내버스"의 "버스"는 일치) 어절 경계는 넘지 않는다
+  ("회사 과장"에서 "사과"를 찾지 않도록)
+- 조사 제거 (선택): 어절 끝의 조사 ("버스를" → "버스")
+- 자모 분해 (선택): 초성/중성/종성 단위 (퍼지 매칭용)
+
+단어 쪽 정규화 결과(MatchKey)는 뱅크를 불러올 때 한 번만 계산해 항목(bank_store.BankEntry)에 붙여 두고,
+턴마다 인식 결과만 한 번 정규화한다.
+"""
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+_SPACE_RE = re.compile(r"\s+")
+_NON_WORD_RE = re.compile(r"[\W_]+")  # 공백 + 문장부호 (한글/영문/숫자는 \w)
+
+# 어절 끝 조사 (긴 것부터 검사)
+PARTICLES = tuple(sorted((
+    "은", "는", "이", "가", "을", "를", "의", "에", "도", "만", "와", "과", "로", "랑", "나",
+    "으로", "에서", "에게", "한테", "께서", "까지", "부터", "마저", "조차", "처럼", "보다", "이나",
+    "이랑", "하고", "라고", "이라고", "에게서", "한테서", "으로는", "에서는", "이에요", "예요", "입니다", "이다",
+), key=len, reverse=True))
+
+
+def normalize(text: str, compact: bool = False, strip_particles: bool = False, jamo: bool = False) -> str:
+    """NFKC + 소문자 + 공백 정리
+
+    compact: 공백/문장부호 제거
+    strip_particles: 어절마다 문장부호와 끝 조사 제거 (compact보다 먼저 적용)
+    jamo: 마지막에 자모로 분해
+    """
+    text = _SPACE_RE.sub(" ", unicodedata.normalize("NFKC", text).lower()).strip()
+    if strip_particles:
+        text = " ".join(strip_particle(_NON_WORD_RE.sub("", token)) for token in text.split(" "))
+    if compact:
+        text = _NON_WORD_RE.sub("", text)
+    if jamo:
+        text = to_jamo(text)
+    return text
+
+
+def match_text(text: str) -> str:
+    """위반 검사/응답 비교용 텍스트: normalize + 어절마다 문장부호 제거, 공백 하나로 구분
+
+    인식기가 음절을 띄어 적은 경우("버 스")를 위해 연달아 나오는 한 글자 어절은 붙인다.
+    단 한 글자 조사("랑", "도" 등)인 어절은 붙이지 않는다 ("노 랑"이 "노랑"이 되지 않도록).
+    """
+    merged: List[str] = []
+    joinable = False  # 직전 어절이 한 글자 어절(또는 그것들을 붙인 것)인지
+    for token in normalize(text).split(" "):
+        token = _NON_WORD_RE.sub("", token)
+        if not token:
+            continue
+        single = len(token) == 1 and token not in PARTICLES
+        if single and joinable:
+            merged[-1] += token
+        else:
+            merged.append(token)
+        joinable = single
+    return " ".join(merged)
+
+
+def contains_key(text: str, key: "MatchKey") -> bool:
+    """match_text 형태의 text에 key가 부분 문자열로 나오는지 (합성어 안도 일치, 어절 경계는 넘지 않음)"""
+    return any(form in text for form in key.forms)
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 조합용 자모(초성/중성/종성)로 분해 - NFD (한글 외 문자는 그대로)"""
+    return unicodedata.normalize("NFD", text)
+
+
+def strip_particle(token: str, min_stem: int = 1) -> str:
+    """어절 끝 조사 하나 제거 (남는 어간이 min_stem 글자보다 짧아지면 그대로)
+
+    "사과"처럼 조사와 같은 글자로 끝나는 명사도 잘리므로, 비교할 때는 원형과 함께
+    후보로 쓴다 (token_forms).
+    """
+    for particle in PARTICLES:
+        if token.endswith(particle) and len(token) - len(particle) >= min_stem:
+            return token[:-len(particle)]
+    return token
+
+
+def token_forms(token: str) -> Tuple[str, ...]:
+    """비교 후보: compact 원형 + 조사를 뗀 형태 (같으면 하나)"""
+    base = normalize(token, compact=True)
+    stripped = normalize(token, compact=True, strip_particles=True)
+    return (base,) if stripped == base or not stripped else (base, stripped)
+
+
+@dataclass(frozen=True)
+class MatchKey:
+    """단어 하나의 정규화 형태 (뱅크 로드 시 미리 계산)"""
+    word: str  # 원래 단어
+    text: str  # NFKC + 소문자 + 공백 정리
+    compact: str  # 공백/문장부호 제거 - 위반 검사와 정답 비교에 사용
+    jamo: str  # compact의 자모 분해 - 퍼지 매칭용
+    spaced: str = ""  # match_text 형태 (여러 어절로 된 단어만 compact와 다름)
+
+    @classmethod
+    def of(cls, word: str) -> "MatchKey":
+        text = normalize(word)
+        compact = _NON_WORD_RE.sub("", text)
+        return cls(word, text, compact, to_jamo(compact), match_text(word))
+
+    @property
+    def forms(self) -> Tuple[str, ...]:
+        """match_text 안에서 찾을 형태 ("아이스 크림"은 띄어 쓴 형태와 붙여 쓴 형태 둘 다)"""
+        if not self.compact:
+            return ()
+        return (self.compact,) if self.spaced in ("", self.compact) else (self.compact, self.spaced)
+
+
+@dataclass(frozen=True)
+class EntryKeys:
+    """뱅크 항목(목표어 + 금지어)의 정규화 형태"""
+    target: MatchKey
+    forbidden: Tuple[MatchKey, ...]
+
+    @classmethod
+    def of(cls, target: str, forbidden: List[str]) -> "EntryKeys":
+        return cls(MatchKey.of(target), tuple(MatchKey.of(w) for w in forbidden))
+
+
+def words_match(word: str, key: MatchKey, forms: Optional[Tuple[str, ...]] = None) -> bool:
+    """단어(추측 후보 등)가 key와 같은지 - 정규화 후 원형 또는 조사를 뗀 형태로 비교"""
+    return key.compact in (forms or token_forms(word))
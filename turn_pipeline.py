@@ -0,0 +1,129 @@
+"""
+음성 턴 처리 파이프라인 (백그라운드 워커)
+
+ASR + LLM 왕복은 수 초가 걸리므로 pygame 메인 루프에서 직접 호출하면 창이 멈춘다.
+TurnPipeline은 턴 작업을 워커 스레드에서 실행하고, 결과는 큐에 쌓아두었다가
+메인 루프(Game.update)가 매 프레임 poll()로 꺼내 적용한다.
+"""
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+
+class TurnCancelled(Exception):
+    """턴 작업이 취소되었을 때 워커 내부에서 사용하는 예외"""
+
+
+class TurnContext:
+    """워커에서 실행되는 턴 작업에 전달되는 컨텍스트 (취소 확인, 중간 결과 전달)"""
+
+    def __init__(self, turn_id: int, round_id: int, sink: Optional[Callable[["TurnResult"], None]] = None):
+        self.turn_id = turn_id
+        self.round_id = round_id
+        self._cancel_event = threading.Event()
+        self._sink = sink
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def check(self):
+        """취소되었으면 TurnCancelled를 던져 남은 단계를 건너뛴다"""
+        if self._cancel_event.is_set():
+            raise TurnCancelled()
+
+    def report(self, value: Any):
+        """중간 결과(예: 스트리밍 중인 AI 응답)를 메인 루프로 전달. 취소되었으면 TurnCancelled"""
+        self.check()
+        if self._sink is not None:
+            self._sink(TurnResult(turn_id=self.turn_id, round_id=self.round_id, value=value, partial=True))
+
+
+@dataclass
+class TurnResult:
+    """워커가 메인 루프로 돌려주는 턴 처리 결과"""
+    turn_id: int
+    round_id: int
+    value: Any = None
+    error: Optional[BaseException] = None
+    cancelled: bool = False
+    partial: bool = False  # True면 최종 결과가 아닌 중간 결과
+
+
+class TurnPipeline:
+    """턴 작업을 순서대로 처리하는 단일 워커 스레드 파이프라인"""
+
+    def __init__(self, name: str = "turn-worker"):
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._results: "queue.Queue[TurnResult]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._next_turn_id = 0
+        self._inflight: dict = {}  # turn_id -> TurnContext
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    @property
+    def busy(self) -> bool:
+        """처리 중이거나 대기 중인 턴이 있는지 여부"""
+        with self._lock:
+            return bool(self._inflight)
+
+    def submit(self, round_id: int, fn: Callable[[TurnContext], Any]) -> int:
+        """턴 작업 등록. fn은 워커 스레드에서 TurnContext를 인자로 호출된다"""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("TurnPipeline is closed")
+            self._next_turn_id += 1
+            ctx = TurnContext(self._next_turn_id, round_id, sink=self._results.put)
+            self._inflight[ctx.turn_id] = ctx
+        self._jobs.put((ctx, fn))
+        return ctx.turn_id
+
+    def cancel(self, round_id: Optional[int] = None):
+        """진행 중인 턴 취소 (round_id 지정 시 해당 라운드의 턴만)"""
+        with self._lock:
+            for ctx in self._inflight.values():
+                if round_id is None or ctx.round_id == round_id:
+                    ctx.cancel()
+
+    def poll(self) -> List[TurnResult]:
+        """완료된 결과를 모두 꺼낸다 (메인 루프에서 매 프레임 호출, 블로킹 없음)"""
+        results: List[TurnResult] = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                return results
+
+    def close(self):
+        """워커 종료 (진행 중인 턴은 취소 처리)"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self.cancel()
+        self._jobs.put(None)
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            ctx, fn = job
+            result = TurnResult(turn_id=ctx.turn_id, round_id=ctx.round_id)
+            try:
+                ctx.check()
+                result.value = fn(ctx)
+                result.cancelled = ctx.cancelled
+            except TurnCancelled:
+                result.cancelled = True
+            except Exception as e:
+                result.error = e
+            with self._lock:
+                self._inflight.pop(ctx.turn_id, None)
+            self._results.put(result)
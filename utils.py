@@ -1,11 +1,12 @@
 """
 Voice Taboo 게임 유틸리티 함수들
 """
-import json
+import logging
 import os
 import re
+import struct
 import time
-import wave
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 import numpy as np
@@ -13,100 +14,147 @@ import sounddevice as sd
 
 from config import (
     SAMPLE_RATE, CHANNELS, RECORD_SECONDS, 
-    TABOO_JSON_PATH, FALLBACK_TABOO_BANK
+    INPUT_DEVICE,
+    FUZZY_MATCH_ENABLED, FUZZY_UNIT, FUZZY_MAX_RATIO, FUZZY_MIN_LENGTH
 )
+from fuzzy_match import edit_distance, max_edits
+from matcher import ViolationMatcher
+from metrics import count
+from text_normalize import MatchKey, normalize, to_jamo, words_match
 
+log = logging.getLogger(__name__)
 
-def load_taboo_bank(path: str) -> List[dict]:
-    """JSON 파일에서 taboo 단어 목록을 로드"""
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        cleaned: List[dict] = []
-        for item in data:
-            if not isinstance(item, dict):
-                continue
-            t = item.get("target")
-            forb = item.get("forbidden")
-            if not isinstance(t, str) or not isinstance(forb, list):
-                continue
-            forb2 = [str(x).strip() for x in forb if str(x).strip()]
-            cleaned.append({"target": t.strip(), "forbidden": forb2})
-        if not cleaned:
-            return FALLBACK_TABOO_BANK
-        return cleaned
-    except Exception:
-        return FALLBACK_TABOO_BANK
+
+WAV_HEADER_SIZE = 44
+_PCM_CHUNK = 16384  # float → int16 변환 시 작업 공간 크기 (샘플)
+
+
+def wav_header(num_samples: int, samplerate: int = SAMPLE_RATE, channels: int = CHANNELS) -> bytes:
+    """16비트 PCM WAV 헤더 (44바이트)"""
+    data_size = num_samples * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, samplerate, samplerate * channels * 2, channels * 2, 16,
+        b"data", data_size,
+    )
+
+
+def write_pcm16(dst: np.ndarray, audio: np.ndarray, gain: float = 1.0):
+    """오디오(float 또는 int16)에 gain을 곱하고 클리핑해 int16 배열 dst에 직접 기록.
+
+    고정 크기 작업 공간을 재사용하므로 입력 길이만큼의 임시 배열을 만들지 않는다.
+    """
+    scale = gain if audio.dtype == np.int16 else gain * 32767.0
+    n = audio.shape[0]
+    scratch = np.empty(min(n, _PCM_CHUNK), dtype=np.float32)
+    for i in range(0, n, _PCM_CHUNK):
+        chunk = audio[i:i + _PCM_CHUNK]
+        tmp = scratch[:chunk.shape[0]]
+        np.multiply(chunk, scale, out=tmp, casting="unsafe")
+        np.clip(tmp, -32767.0, 32767.0, out=tmp)
+        np.copyto(dst[i:i + _PCM_CHUNK], tmp, casting="unsafe")
+
+
+def peak_abs(audio: np.ndarray) -> float:
+    """절대값 최대치 (np.abs 임시 배열 없이 계산)"""
+    if not audio.size:
+        return 0.0
+    return max(float(audio.max()), -float(audio.min()))
+
+
+def signal_levels(audio: np.ndarray) -> Tuple[float, float]:
+    """(최대값, RMS)를 float 스케일(-1.0~1.0)로 계산. int16 입력도 임시 배열 없이 처리"""
+    audio = audio.reshape(-1)
+    if not audio.size:
+        return 0.0, 0.0
+    peak = peak_abs(audio)
+    rms = float(np.sqrt(np.einsum("i,i->", audio, audio, dtype=np.float64) / audio.size))
+    if audio.dtype == np.int16:
+        return peak / 32767.0, rms / 32767.0
+    return peak, rms
+
+
+def upload_gain(audio: np.ndarray, peak: Optional[float] = None) -> float:
+    """업로드용 증폭 배율 (최대값을 0.8까지, 최대 50배). 무음이면 0"""
+    if peak is None:
+        peak = peak_abs(audio)
+    if peak <= 0:
+        return 0.0
+    target_level = 0.8  # 더 높은 목표 레벨
+    if peak < target_level:
+        return min(50.0, target_level / peak)  # 최대 50배 증폭
+    return 1.0
+
+
+def _dummy_tone(samplerate: int) -> np.ndarray:
+    """완전 무음일 때 보내는 짧은 더미 신호 (Whisper 오류 방지)"""
+    dummy_tone = np.sin(2 * np.pi * 440 * np.linspace(0, 0.1, int(0.1 * samplerate)))
+    return (dummy_tone * 0.1 * 32767.0).astype(np.int16)
+
+
+def build_wav_bytes(audio: np.ndarray, samplerate: int = SAMPLE_RATE, gain: float = 1.0) -> bytes:
+    """WAV 바이너리를 한 번의 할당으로 생성.
+
+    헤더와 샘플이 들어갈 bytearray를 먼저 만들고, 샘플 영역을 int16 view로 열어
+    변환 결과를 바로 써넣는다 (bytes 호환 bytearray 반환).
+    """
+    audio = audio.reshape(-1)
+    n = audio.shape[0]
+    buf = bytearray(WAV_HEADER_SIZE + n * 2)
+    buf[:WAV_HEADER_SIZE] = wav_header(n, samplerate)
+    samples = np.frombuffer(buf, dtype="<i2", offset=WAV_HEADER_SIZE)
+    if audio.dtype == np.int16 and gain == 1.0:
+        np.copyto(samples, audio)
+    else:
+        write_pcm16(samples, audio, gain)
+    return buf
 
 
 def save_wav_from_array(filename: str, audio: np.ndarray, samplerate: int = SAMPLE_RATE):
     """numpy 배열을 WAV 파일로 저장"""
-    if audio.dtype != np.int16:
-        if audio.dtype not in (np.float32, np.float64):
-            audio = audio.astype(np.float32)
-        audio = np.clip(audio, -1.0, 1.0)
-        audio = (audio * 32767.0).astype(np.int16)
-    with wave.open(filename, 'wb') as wf:
-        wf.setnchannels(CHANNELS)
-        wf.setsampwidth(2)
-        wf.setframerate(samplerate)
-        wf.writeframes(audio.tobytes())
-
-
-def audio_array_to_wav_bytes(audio: np.ndarray, samplerate: int = SAMPLE_RATE) -> bytes:
-    """numpy 배열을 WAV 바이너리 데이터로 변환 (파일 저장 없이)"""
-    import io
-    
-    print(f"오디오 변환 시작: {len(audio)} 샘플, {samplerate}Hz")
-    
-    # 오디오 데이터 정규화 및 증폭
-    if audio.dtype != np.int16:
-        if audio.dtype not in (np.float32, np.float64):
-            audio = audio.astype(np.float32)
-        
-        # 정규화 범위 확인
-        audio_max = np.max(np.abs(audio))
-        audio_rms = np.sqrt(np.mean(audio**2))
-        print(f"정규화 전 최대값: {audio_max:.6f}, RMS: {audio_rms:.6f}")
-        
-        if audio_max > 0:
-            # 매우 적극적인 증폭 (낮은 품질 오디오 문제 해결)
-            target_level = 0.8  # 더 높은 목표 레벨
-            if audio_max < target_level:
-                amplification = min(50.0, target_level / audio_max)  # 최대 50배 증폭
-                audio = audio * amplification
-                print(f"오디오 증폭: {amplification:.2f}배")
-            
-            # 하드 클리핑
-            audio = np.clip(audio, -1.0, 1.0)
-            
-            # 노이즈 게이트 완전 제거 (모든 신호 보존)
-            # threshold = 0.0005
-            # audio = np.where(np.abs(audio) < threshold, 0, audio)
-            
-            # 16비트로 변환
-            audio = (audio * 32767.0).astype(np.int16)
-            
-            # 최종 상태 확인
-            final_max = np.max(np.abs(audio))
-            print(f"변환 후 16비트 최대값: {final_max}")
-        else:
-            print("경고: 오디오 데이터가 무음입니다.")
-            # 완전 무음이면 짧은 더미 신호 생성 (Whisper 오류 방지)
-            dummy_tone = np.sin(2 * np.pi * 440 * np.linspace(0, 0.1, int(0.1 * samplerate)))
-            audio = (dummy_tone * 0.1 * 32767.0).astype(np.int16)
-    
-    # 메모리에서 WAV 파일 생성
-    wav_buffer = io.BytesIO()
-    with wave.open(wav_buffer, 'wb') as wf:
-        wf.setnchannels(CHANNELS)
-        wf.setsampwidth(2)
-        wf.setframerate(samplerate)
-        wf.writeframes(audio.tobytes())
+    with open(filename, "wb") as f:
+        f.write(build_wav_bytes(audio, samplerate))
+
+
+def prepare_pcm16(audio: np.ndarray, samplerate: int = SAMPLE_RATE,
+                  levels: Optional[Tuple[float, float]] = None) -> np.ndarray:
+    """업로드용 16비트 PCM 준비 (정규화/증폭/클리핑, 무음이면 더미 신호).
+
+    int16 입력(CAPTURE_DTYPE=int16)도 같은 증폭/무음 처리를 거치고, 증폭이 필요 없으면 그대로 반환한다.
+    levels: 이미 계산된 (최대값, RMS)가 있으면 넘겨서 재계산을 피한다.
+    """
+    audio = audio.reshape(-1)
+    gain = _log_upload_gain(audio, levels)
+    if gain == 0.0:
+        return _dummy_tone(samplerate)
+    if audio.dtype == np.int16 and gain == 1.0:
+        return audio
+    pcm = np.empty(audio.shape[0], dtype=np.int16)
+    write_pcm16(pcm, audio, gain)
+    return pcm
+
+
+def _log_upload_gain(audio: np.ndarray, levels: Optional[Tuple[float, float]] = None) -> float:
+    """증폭 배율 계산 (무음이면 경고 기록, 단계별 시간은 metrics의 encode 단계로 측정)"""
+    audio_max, _audio_rms = levels if levels is not None else signal_levels(audio)
+    gain = upload_gain(audio, audio_max)
+    if gain == 0.0:
+        log.warning("오디오 데이터가 무음입니다.")
+        count("upload_silent")
+    return gain
+
+
+def audio_array_to_wav_bytes(audio: np.ndarray, samplerate: int = SAMPLE_RATE,
+                             levels: Optional[Tuple[float, float]] = None) -> bytes:
+    """numpy 배열을 WAV 바이너리 데이터로 변환 (파일 저장 없이, 단일 할당)"""
+    audio = audio.reshape(-1)
     
-    wav_buffer.seek(0)
-    wav_data = wav_buffer.read()
-    print(f"WAV 변환 완료: {len(wav_data)} bytes")
+    gain = _log_upload_gain(audio, levels)
+    if gain == 0.0:
+        wav_data = build_wav_bytes(_dummy_tone(samplerate), samplerate)
+    else:
+        wav_data = build_wav_bytes(audio, samplerate, gain)
     
     return wav_data
 
@@ -118,24 +166,28 @@ def record_block(seconds: float = RECORD_SECONDS, samplerate: int = SAMPLE_RATE)
     return audio.reshape(-1)
 
 
-def start_recording(samplerate: int = SAMPLE_RATE) -> sd.InputStream:
-    """실시간 녹음 시작 (키를 누르는 동안)"""
-    # 마이크 테스트에서 잘 작동한 디바이스 22번 사용
+@lru_cache(maxsize=1)
+def resolve_input_device():
+    """config.INPUT_DEVICE 확인 (프로세스당 한 번만 조회)"""
+    if not INPUT_DEVICE:
+        return None
+    input_device = int(INPUT_DEVICE) if INPUT_DEVICE.isdigit() else INPUT_DEVICE
     try:
-        devices = sd.query_devices()
-        # 마이크 테스트에서 성공한 디바이스 22 (Realtek HD Audio Mic input) 시도
-        input_device = 22
         print(f"마이크 디바이스 {input_device} 사용 시도")
-        
-        device_info = sd.query_devices(input_device)
-        print(f"디바이스 정보: {device_info}")  # 전체 정보 출력
-        
+        device_info = sd.query_devices(input_device, kind='input')
+        print(f"디바이스 정보: {device_info}")
+        return input_device
     except Exception as e:
         print(f"디바이스 조회 오류: {e}")
-        input_device = None
+        return None
+
+
+def start_recording(samplerate: int = SAMPLE_RATE) -> sd.InputStream:
+    """실시간 녹음 시작 (키를 누르는 동안)"""
+    input_device = resolve_input_device()
     
     stream = sd.InputStream(
-        device=input_device,  # 테스트에서 성공한 디바이스 사용
+        device=input_device,
         samplerate=samplerate,
         channels=CHANNELS,
         dtype='float32',
@@ -148,24 +200,25 @@ def start_recording(samplerate: int = SAMPLE_RATE) -> sd.InputStream:
 def stop_recording_and_get_audio(stream: sd.InputStream, duration: float) -> np.ndarray:
     """녹음 중단하고 오디오 데이터 반환"""
     try:
-        print(f"녹음 중단 시작, 지속시간: {duration:.2f}초")
+        log.debug("녹음 중단 시작, 지속시간: %.2f초", duration)
         
         # 녹음된 데이터 수집
         frames = []
         samples_per_frame = 1024
         expected_frames = max(1, int(duration * stream.samplerate / samples_per_frame))
         
-        print(f"예상 프레임 수: {expected_frames}")
+        log.debug("예상 프레임 수: %d", expected_frames)
         
         # 실제 녹음된 데이터 읽기
         for i in range(expected_frames):
             try:
                 data, overflowed = stream.read(samples_per_frame)
                 if overflowed:
-                    print(f"프레임 {i}: 오디오 버퍼 오버플로우")
+                    log.warning("프레임 %d: 오디오 버퍼 오버플로우", i)
+                    count("capture_overflow")
                 frames.append(data)
             except Exception as read_error:
-                print(f"프레임 {i} 읽기 오류: {read_error}")
+                log.warning("프레임 %d 읽기 오류: %s", i, read_error)
                 break
         
         stream.stop()
@@ -173,25 +226,26 @@ def stop_recording_and_get_audio(stream: sd.InputStream, duration: float) -> np.
         
         if frames:
             audio = np.concatenate(frames, axis=0)
-            print(f"수집된 오디오 샘플 수: {len(audio)}")
+            log.debug("수집된 오디오 샘플 수: %d", len(audio))
             
             # 오디오 레벨 확인 - 임계치 강화
-            audio_level = np.max(np.abs(audio))
-            audio_rms = np.sqrt(np.mean(audio**2))
-            print(f"오디오 최대 레벨: {audio_level:.4f}, RMS: {audio_rms:.4f}")
+            audio_level, audio_rms = signal_levels(audio)
+            log.debug("오디오 최대 레벨: %.4f, RMS: %.4f", audio_level, audio_rms)
             
             # 너무 조용하면 정적으로 판단하고 처리 거부
             if audio_level < 0.005 or audio_rms < 0.001:  # 임계치 강화
-                print("경고: 오디오 레벨이 너무 낮습니다 (정적으로 판단). 더 크게 말해주세요.")
+                log.warning("오디오 레벨이 너무 낮습니다 (정적으로 판단). 더 크게 말해주세요.")
+                count("record_too_quiet")
                 return np.zeros(int(0.1 * SAMPLE_RATE))  # 매우 짧은 더미 데이터
             
             return audio.reshape(-1)
         else:
-            print("경고: 녹음된 데이터가 없습니다.")
+            log.warning("녹음된 데이터가 없습니다.")
+            count("record_empty")
             return np.zeros(int(0.5 * SAMPLE_RATE))  # 0.5초 더미 데이터
             
     except Exception as e:
-        print(f"녹음 중단 오류: {e}")
+        log.warning("녹음 중단 오류: %s", e)
         try:
             stream.stop()
             stream.close()
@@ -200,46 +254,39 @@ def stop_recording_and_get_audio(stream: sd.InputStream, duration: float) -> np.
         return np.zeros(int(0.5 * SAMPLE_RATE))
 
 
-def check_violations(text: str, target: str, forbidden: List[str]) -> Tuple[Optional[str], bool]:
+def check_violations(text: str, target: str, forbidden: List[str],
+                     matcher: Optional[ViolationMatcher] = None) -> Tuple[Optional[str], bool]:
     """
-    텍스트에서 금지어 및 목표어 위반을 검사
+    텍스트에서 금지어 및 목표어 위반을 검사 (정규화한 텍스트의 부분 문자열 일치, 한 번의 선형 스캔)
+    정확히 일치하는 단어가 없고 FUZZY_MATCH_ENABLED면 편집 거리 기준으로 한 번 더 검사
+    
+    matcher: 라운드에서 미리 컴파일한 검사기 (RoundState.matcher, 없으면 이번 호출용으로 컴파일)
     
     Returns:
         Tuple[금지어_위반, 목표어_위반]
-        - 금지어_위반: 위반된 금지어 문자열 또는 None
+        - 금지어_위반: 위반된 금지어 문자열 또는 None (여러 개면 목록에서 앞선 단어)
         - 목표어_위반: 목표어를 말했는지 여부 (bool)
     """
-    text_l = text.lower()
-    target_l = target.lower()
-    tokens = text_l.split()
-    token_set = set(tokens)
-    
-    # 1. 목표어 검사 (우선순위 높음)
-    target_violation = False
-    if target_l in token_set or target_l in text_l:
-        target_violation = True
-    
-    # 2. 금지어 검사
-    forbidden_violation = None
-    for w in forbidden:
-        w_l = w.lower().strip()
-        if not w_l:
-            continue
-        if w_l in token_set:
-            forbidden_violation = w
-            break
-        # 한글/붙임표 등 토큰 경계가 모호할 수 있으니 보조 검사
-        if w_l in text_l:
-            forbidden_violation = w
-            break
-    
-    return forbidden_violation, target_violation
+    if matcher is None:
+        matcher = ViolationMatcher(target, forbidden)
+    forbidden_violation, target_violation = matcher.check(text)
+    if forbidden_violation or target_violation or not FUZZY_MATCH_ENABLED:
+        return forbidden_violation, target_violation
+    hits = matcher.fuzzy_hits(text, FUZZY_MAX_RATIO, FUZZY_MIN_LENGTH, FUZZY_UNIT)
+    if not hits:
+        return None, False
+    log.debug("퍼지 일치: %s (%r)", ", ".join(h.word for h in hits), text)
+    count("fuzzy_match")
+    return matcher.summarize(hits)
+
+
+GUESS_TOKEN_RE = re.compile(r"\[\[\s*([가-힣\w]+)\s*\]\]")
 
 
 def extract_guess_token(text: str) -> str:
     """AI 응답에서 [[word]] 토큰 추출 (한글 지원 강화)"""
     # 1) [[단어]] 형태의 토큰 찾기
-    m = re.search(r"\[\[\s*([가-힣\w]+)\s*\]\]", text)
+    m = GUESS_TOKEN_RE.search(text)
     if m:
         return m.group(1).strip()
     
@@ -249,3 +296,71 @@ def extract_guess_token(text: str) -> str:
         return m2.group(1).strip()
     
     return ""
+
+
+def extract_guess_tokens(text: str, limit: Optional[int] = None) -> List[str]:
+    """AI 응답의 [[word]] 토큰들을 순서대로 추출 (중복 제거, 최대 limit개)"""
+    guesses: List[str] = []
+    for m in GUESS_TOKEN_RE.finditer(text):
+        word = m.group(1).strip()
+        if word and word not in guesses:
+            guesses.append(word)
+            if limit is not None and len(guesses) >= limit:
+                break
+    return guesses
+
+
+def guess_matches(guess: str, target: str, key: Optional[MatchKey] = None) -> bool:
+    """추측이 목표어와 같은지 (정확히 일치하거나, 정규화 후 원형 또는 조사를 뗀 형태가 일치,
+    FUZZY_MATCH_ENABLED면 편집 거리가 허용 범위 안인 경우도 포함)
+    key: 목표어의 미리 계산된 정규화 형태 (없으면 이번에 계산)"""
+    key = key or MatchKey.of(target)
+    if guess == target or words_match(guess, key):
+        return True
+    if not FUZZY_MATCH_ENABLED:
+        return False
+    pattern = key.jamo if FUZZY_UNIT == "jamo" else key.compact
+    allowed = int(max_edits(np.array([len(pattern)]), FUZZY_MAX_RATIO, FUZZY_MIN_LENGTH)[0])
+    if allowed < 0:
+        return False
+    word = normalize(guess, compact=True)
+    return edit_distance(to_jamo(word) if FUZZY_UNIT == "jamo" else word, pattern) <= allowed
+
+
+class GuessTokenScanner:
+    """스트리밍 응답 조각을 누적하며 [[단어]] 토큰이 닫히는 순간을 감지
+
+    want: 몇 개의 후보 토큰이 모이면 완료로 볼지 (top-k 추측 모드에서는 k)
+    """
+
+    def __init__(self, want: int = 1):
+        self.text = ""
+        self.want = max(1, want)
+        self.guesses: List[str] = []
+        self._scan_from = 0  # 아직 닫히지 않은 '[['의 위치 (이전 구간은 다시 검사하지 않음)
+
+    @property
+    def guess(self) -> Optional[str]:
+        """첫 번째(가장 유력한) 추측"""
+        return self.guesses[0] if self.guesses else None
+
+    @property
+    def done(self) -> bool:
+        return len(self.guesses) >= self.want
+
+    def feed(self, delta: str) -> Optional[str]:
+        """조각 추가. 후보 토큰이 want개 모였으면 첫 번째 추측 단어 반환"""
+        self.text += delta
+        if self.done:
+            return self.guess
+        for m in GUESS_TOKEN_RE.finditer(self.text, self._scan_from):
+            word = m.group(1).strip()
+            if word not in self.guesses:
+                self.guesses.append(word)
+            self._scan_from = m.end()
+            if self.done:
+                return self.guess
+        # 다음 검사는 마지막 '[[' (또는 경계에 걸친 '[')부터
+        open_pos = self.text.rfind("[[", self._scan_from)
+        self._scan_from = open_pos if open_pos >= 0 else max(self._scan_from, len(self.text) - 1)
+        return None
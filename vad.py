@@ -0,0 +1,78 @@
+"""
+음성 구간 검출 (VAD)
+
+업로드 전에 앞뒤 무음을 잘라내고, 말소리가 없는 클립은 아예 버린다.
+프레임 단위 에너지(RMS)와 영교차율(ZCR)을 NumPy로 한 번에 계산하며
+샘플 단위 파이썬 루프는 사용하지 않는다.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from config import (
+    SAMPLE_RATE, VAD_FRAME_MS, VAD_MIN_RMS, VAD_NOISE_RATIO, VAD_PEAK_RATIO, VAD_ZCR_THRESHOLD,
+    VAD_MIN_SPEECH_SECONDS, VAD_PADDING_SECONDS
+)
+
+
+@dataclass
+class VadResult:
+    """VAD 결과 (audio는 원본 배열의 view)"""
+    audio: np.ndarray
+    start: int  # 원본 기준 시작 샘플
+    end: int  # 원본 기준 끝 샘플 (미포함)
+    is_speech: bool
+    speech_seconds: float
+    original_seconds: float
+    samplerate: int = SAMPLE_RATE
+
+    @property
+    def trimmed_seconds(self) -> float:
+        """잘라낸 길이 (초)"""
+        return self.original_seconds - (self.end - self.start) / self.samplerate
+
+
+def frame_features(audio: np.ndarray, frame_len: int):
+    """프레임별 RMS(float 스케일)와 영교차율 계산"""
+    n_frames = audio.shape[0] // frame_len
+    frames = audio[:n_frames * frame_len].reshape(n_frames, frame_len)  # 복사 없는 view
+    energy = np.einsum("ij,ij->i", frames, frames, dtype=np.float64)
+    rms = np.sqrt(energy / frame_len)
+    if audio.dtype == np.int16:
+        rms /= 32767.0
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / frame_len
+    return rms, zcr
+
+
+def detect_speech(audio: np.ndarray, samplerate: int = SAMPLE_RATE) -> VadResult:
+    """앞뒤 무음을 제거한 구간과 음성 여부 반환"""
+    audio = audio.reshape(-1)
+    total = audio.shape[0]
+    original_seconds = total / samplerate
+    frame_len = max(1, int(samplerate * VAD_FRAME_MS / 1000))
+    if total < frame_len:
+        return VadResult(audio[:0], 0, 0, False, 0.0, original_seconds, samplerate)
+
+    rms, zcr = frame_features(audio, frame_len)
+
+    # 배경 소음 기준: 조용한 프레임(하위 10%)의 에너지 (프리롤 덕분에 보통 무음 구간이 포함됨)
+    # 무음 구간 없이 말로 꽉 찬 클립은 하위 10%도 말소리라 배수를 곱하면 클립 전체보다 커지므로,
+    # 가장 큰 프레임 대비 VAD_PEAK_RATIO를 상한으로 둔다
+    noise_floor = float(np.percentile(rms, 10))
+    threshold = max(VAD_MIN_RMS, min(noise_floor * VAD_NOISE_RATIO, float(rms.max()) * VAD_PEAK_RATIO))
+
+    # 유성음은 에너지로, 'ㅅ/ㅊ' 같은 무성 마찰음은 낮은 에너지 + 높은 ZCR로 판단
+    weak = (rms >= max(VAD_MIN_RMS, threshold * 0.5)) & (zcr >= VAD_ZCR_THRESHOLD)
+    speech = (rms >= threshold) | weak
+    speech_frames = int(np.count_nonzero(speech))
+    speech_seconds = speech_frames * frame_len / samplerate
+
+    if speech_seconds < VAD_MIN_SPEECH_SECONDS:
+        return VadResult(audio[:0], 0, 0, False, speech_seconds, original_seconds, samplerate)
+
+    idx = np.flatnonzero(speech)
+    pad = int(VAD_PADDING_SECONDS * samplerate)
+    start = max(0, int(idx[0]) * frame_len - pad)
+    end = min(total, (int(idx[-1]) + 1) * frame_len + pad)
+    return VadResult(audio[start:end], start, end, True, speech_seconds, original_seconds, samplerate)